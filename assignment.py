@@ -0,0 +1,307 @@
+import numpy as np
+
+# SciPy es opcional (se usa la implementación en NumPy) y se importa al primer uso:
+# scipy.optimize tarda cientos de milisegundos en cargarse
+_scipy_linear_sum_assignment = None
+
+# Códigos de estado compatibles con PuLP
+STATUS_OPTIMAL = 1
+STATUS_INFEASIBLE = -1
+
+
+class AssignmentResult:
+    """
+    Solución de un problema de asignación en arreglos de NumPy:
+
+    - rows, cols, values: Pares asignados (recurso, tarea) con su valor, en formato COO
+      ordenado por recurso y tarea. Solo se guardan los pares con valor distinto de cero.
+    - total_cost: Costo total de la asignación.
+    - num_resources, num_tasks: Dimensiones del problema.
+
+    El diccionario {(recurso, tarea): valor} se construye solo si se pide con to_dict.
+    """
+
+    def __init__(self, rows, cols, values, total_cost, num_resources, num_tasks):
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.broadcast_to(np.asarray(values, dtype=float), rows.shape)
+        keep = values != 0
+        order = np.lexsort((cols[keep], rows[keep]))
+        self.rows = rows[keep][order]
+        self.cols = cols[keep][order]
+        self.values = values[keep][order]
+        self.total_cost = total_cost
+        self.num_resources = num_resources
+        self.num_tasks = num_tasks
+        self._dict = None
+
+    def __len__(self):
+        return self.rows.size
+
+    @property
+    def task_assignment(self):
+        """
+        Arreglo assignment[tarea] -> recurso (-1 si la tarea no tiene recurso). Solo aplica
+        cuando cada tarea recibe a lo sumo un recurso.
+        """
+        if np.bincount(self.cols, minlength=self.num_tasks).max(initial=0) > 1:
+            raise ValueError("Hay tareas con más de un recurso; use rows/cols o to_csr.")
+        assignment = np.full(self.num_tasks, -1, dtype=np.int64)
+        assignment[self.cols] = self.rows
+        return assignment
+
+    def to_csr(self):
+        """Retorna (indptr, indices, data): las tareas y valores de cada recurso en formato CSR."""
+        indptr = np.zeros(self.num_resources + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.rows, minlength=self.num_resources), out=indptr[1:])
+        return indptr, self.cols, self.values
+
+    def to_dict(self):
+        """Vista {(recurso, tarea): valor}, construida una sola vez."""
+        if self._dict is None:
+            self._dict = dict(zip(zip(self.rows.tolist(), self.cols.tolist()), self.values.tolist()))
+        return self._dict
+
+
+def linear_sum_assignment(cost):
+    """
+    Resuelve el problema de asignación clásico (algoritmo húngaro) sobre una matriz de
+    costos de forma (n, m) con n <= m: cada fila se asigna a una columna distinta.
+    Los costos infinitos representan pares prohibidos.
+
+    Parámetros:
+    - cost: Arreglo de NumPy con los costos.
+
+    Retorna:
+    - Una tupla (filas, columnas) con los pares asignados, o None si no existe una
+      asignación factible.
+    """
+    cost = np.asarray(cost, dtype=float)
+    if cost.shape[0] > cost.shape[1]:
+        return None
+    scipy_solver = _scipy_solver()
+    if scipy_solver is not None:
+        try:
+            return scipy_solver(cost)
+        except ValueError:  # Matriz no factible por pares prohibidos
+            return None
+    return _hungarian(cost)
+
+
+def _scipy_solver():
+    """scipy.optimize.linear_sum_assignment, o None si SciPy no está instalado."""
+    global _scipy_linear_sum_assignment
+    if _scipy_linear_sum_assignment is None:
+        try:
+            from scipy.optimize import linear_sum_assignment
+        except ImportError:
+            linear_sum_assignment = False
+        _scipy_linear_sum_assignment = linear_sum_assignment
+    return _scipy_linear_sum_assignment or None
+
+
+def _hungarian(cost):
+    """
+    Algoritmo húngaro con caminos de aumento más cortos, O(n²·m), vectorizado sobre
+    las columnas. Requiere n <= m.
+    """
+    n, m = cost.shape
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    match = np.zeros(m + 1, dtype=np.int64)  # match[j]: fila (base 1) asignada a la columna j
+    way = np.zeros(m + 1, dtype=np.int64)
+
+    for i in range(1, n + 1):
+        match[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            free = ~used[1:]
+            reduced = cost[match[j0] - 1] - u[match[j0]] - v[1:]
+            improve = free & (reduced < minv[1:])
+            minv[1:][improve] = reduced[improve]
+            way[1:][improve] = j0
+
+            candidates = np.where(free, minv[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+            if not np.isfinite(delta):
+                return None
+
+            u[match[used]] += delta
+            v[used] -= delta
+            minv[1:][free] -= delta
+            j0 = j1
+            if match[j0] == 0:
+                break
+
+        while j0:
+            j1 = way[j0]
+            match[j0] = match[j1]
+            j0 = j1
+
+    cols = np.flatnonzero(match[1:])
+    rows = match[1:][cols] - 1
+    order = np.argsort(rows)
+    return rows[order], cols[order]
+
+
+def min_cost_flow_assignment(cost, resources_per_task, tasks_per_resource):
+    """
+    Resuelve la asignación con capacidades como un flujo de costo mínimo mediante caminos
+    más cortos sucesivos (Dijkstra con potenciales):
+
+        fuente -> recurso i  (capacidad tasks_per_resource)
+        recurso i -> tarea j (capacidad 1, costo cost[i, j])
+        tarea j -> sumidero  (capacidad resources_per_task)
+
+    Cada tarea debe recibir exactamente resources_per_task recursos distintos.
+
+    Parámetros:
+    - cost: Arreglo (recursos, tareas) con los costos; infinito para pares prohibidos.
+    - resources_per_task: Recursos requeridos por cada tarea.
+    - tasks_per_resource: Máximo de tareas por recurso.
+
+    Retorna:
+    - Una tupla (filas, columnas) con los pares asignados, o None si no es factible.
+    """
+    cost = np.asarray(cost, dtype=float)
+    n, m = cost.shape
+    assigned = np.zeros((n, m), dtype=bool)
+    load_r = np.zeros(n, dtype=np.int64)
+    load_t = np.zeros(m, dtype=np.int64)
+    if resources_per_task == 0:
+        # Sin flujo que enviar: la asignación vacía es factible aunque haya tareas sin pares
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    # Potenciales iniciales que hacen no negativos todos los costos reducidos
+    pot_r = np.zeros(n)
+    pot_t = cost.min(axis=0) if n else np.full(m, np.inf)
+    if not np.isfinite(pot_t).all():
+        return None
+    pot_sink = pot_t.min() if m else 0.0
+
+    for _ in range(resources_per_task * m):
+        dist_r = np.where(load_r < tasks_per_resource, np.maximum(-pot_r, 0.0), np.inf)
+        dist_t = np.full(m, np.inf)
+        dist_sink = np.inf
+        prev_t = np.full(m, -1, dtype=np.int64)  # recurso desde el que se alcanzó cada tarea
+        prev_r = np.full(n, -1, dtype=np.int64)  # tarea desde la que se alcanzó cada recurso (-1: fuente)
+        done_r = np.zeros(n, dtype=bool)
+        done_t = np.zeros(m, dtype=bool)
+        last_task = -1
+
+        while True:
+            open_r = np.where(done_r, np.inf, dist_r)
+            open_t = np.where(done_t, np.inf, dist_t)
+            i = int(np.argmin(open_r)) if n else 0
+            j = int(np.argmin(open_t))
+            best_r = open_r[i] if n else np.inf
+            best_t = open_t[j]
+            if min(best_r, best_t) >= dist_sink:
+                break
+            if best_r <= best_t:
+                done_r[i] = True
+                candidate = best_r + cost[i] + pot_r[i] - pot_t
+                improve = ~assigned[i] & ~done_t & (candidate < dist_t)
+                dist_t[improve] = candidate[improve]
+                prev_t[improve] = i
+            else:
+                done_t[j] = True
+                if load_t[j] < resources_per_task and best_t + pot_t[j] - pot_sink < dist_sink:
+                    dist_sink = best_t + pot_t[j] - pot_sink
+                    last_task = j
+                candidate = best_t - cost[:, j] + pot_t[j] - pot_r
+                improve = assigned[:, j] & ~done_r & (candidate < dist_r)
+                dist_r[improve] = candidate[improve]
+                prev_r[improve] = j
+
+        if last_task < 0:
+            return None
+
+        # Aumentar una unidad de flujo a lo largo del camino encontrado
+        load_t[last_task] += 1
+        j = last_task
+        while True:
+            i = prev_t[j]
+            assigned[i, j] = True
+            if prev_r[i] < 0:
+                load_r[i] += 1
+                break
+            j = prev_r[i]
+            assigned[i, j] = False
+
+        pot_r += np.minimum(dist_r, dist_sink)
+        pot_t += np.minimum(dist_t, dist_sink)
+        pot_sink += dist_sink
+
+    return np.nonzero(assigned)
+
+
+def _capacity(value, name):
+    """Valida una capacidad: debe ser un entero no negativo."""
+    try:
+        integer = int(value)
+    except (TypeError, ValueError):
+        integer = None
+    if integer is None or integer != value or integer < 0:
+        raise ValueError(f"{name} debe ser un entero no negativo.")
+    return integer
+
+
+def solve_assignment(cost, resources_per_task=1, tasks_per_resource=1, allow_unassigned_tasks=False):
+    """
+    Resuelve en memoria el modelo de ResourceAssignmentSolver con variables binarias,
+    eligiendo el algoritmo combinatorio adecuado:
+
+    - Con una de las capacidades igual a 1, el problema se reduce a una asignación
+      clásica replicando recursos o tareas, y se usa el algoritmo húngaro.
+    - En otro caso se resuelve como un flujo de costo mínimo.
+
+    Parámetros:
+    - cost: Arreglo (recursos, tareas) con los costos; infinito para pares prohibidos.
+    - resources_per_task: Recursos requeridos por cada tarea.
+    - tasks_per_resource: Máximo de tareas por recurso.
+    - allow_unassigned_tasks: Agrega la restricción de a lo sumo un recurso por tarea.
+
+    Retorna:
+    - Una tupla (estado, objetivo, filas, columnas) con el estado en códigos de PuLP.
+    """
+    cost = np.asarray(cost, dtype=float)
+    num_resources, num_tasks = cost.shape
+    empty = np.zeros(0, dtype=np.int64)
+    resources_per_task = _capacity(resources_per_task, "resources_per_task")
+    tasks_per_resource = _capacity(tasks_per_resource, "tasks_per_resource")
+
+    if allow_unassigned_tasks and resources_per_task > 1 and num_tasks:
+        return STATUS_INFEASIBLE, None, empty, empty
+    if resources_per_task * num_tasks > tasks_per_resource * num_resources:
+        return STATUS_INFEASIBLE, None, empty, empty
+
+    if resources_per_task == 1:
+        # Cada tarea (fila) elige una copia distinta de algún recurso (columna); un recurso
+        # no puede atender más tareas de las que hay
+        copies_per_resource = min(tasks_per_resource, num_tasks)
+        result = linear_sum_assignment(np.repeat(cost.T, copies_per_resource, axis=1))
+        if result is not None:
+            tasks, copies = result
+            result = copies // copies_per_resource, tasks
+    elif tasks_per_resource == 1:
+        # Cada recurso atiende a lo sumo una copia de una tarea; más copias que recursos ya
+        # se descartaron como no factibles
+        copies_per_task = min(resources_per_task, num_resources)
+        result = linear_sum_assignment(np.repeat(cost.T, copies_per_task, axis=0))
+        if result is not None:
+            copies, resources = result
+            result = resources, copies // copies_per_task
+    else:
+        result = min_cost_flow_assignment(cost, resources_per_task, tasks_per_resource)
+
+    if result is None:
+        return STATUS_INFEASIBLE, None, empty, empty
+    rows, cols = (np.asarray(a, dtype=np.int64) for a in result)
+    order = np.lexsort((cols, rows))
+    rows, cols = rows[order], cols[order]
+    return STATUS_OPTIMAL, float(cost[rows, cols].sum()), rows, cols
@@ -0,0 +1,143 @@
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+import modelfile
+import simplex
+from compact import CompactModel
+
+# Modelo base de cada proceso del pool: se envía una sola vez al iniciar el proceso
+_worker_state = None
+
+
+class BatchResult:
+    """
+    Resultados de un lote de escenarios en arreglos de NumPy:
+
+    - statuses: Estado de cada escenario (códigos de PuLP; 0 si no se resolvió).
+    - objectives: Valor objetivo de cada escenario (nan si no hay solución).
+    - solutions: Matriz (escenarios x variables) con la solución de cada escenario.
+    - errors: Mensaje de error de cada escenario no válido (None en los demás).
+    - var_names: Nombre de cada columna de solutions.
+    """
+
+    def __init__(self, num_scenarios, var_names):
+        self.var_names = list(var_names)
+        self.statuses = np.zeros(num_scenarios, dtype=np.int8)
+        self.objectives = np.full(num_scenarios, np.nan)
+        self.solutions = np.full((num_scenarios, len(self.var_names)), np.nan)
+        self.errors = [None] * num_scenarios
+
+    def __len__(self):
+        return self.statuses.size
+
+    def record(self, index, status, objective, x, error=None):
+        self.statuses[index] = status
+        self.errors[index] = error
+        self.objectives[index] = np.nan if objective is None else objective
+        if x is not None:
+            self.solutions[index] = x
+
+
+def solve_lp_scenario(model, scenario):
+    """
+    Resuelve un escenario de un CompactModel con el simplex en memoria.
+
+    Parámetros:
+    - model: El CompactModel base.
+    - scenario: Diccionario con los cambios del escenario: 'c', 'rhs' y/o 'bounds'
+      (ver CompactModel.with_changes).
+
+    Retorna:
+    - Una tupla (estado, objetivo, solución).
+    """
+    result = simplex.solve_model(model.with_changes(**scenario))
+    return result.status, result.objective, result.x
+
+
+def _solve_one(solve_function, base, scenario):
+    # Un escenario no válido se informa en su propio resultado sin detener el lote
+    try:
+        return (*solve_function(base, scenario), None)
+    except ValueError as e:
+        return 0, None, None, str(e)
+
+
+def _init_worker(solve_function, base, path=None):
+    global _worker_state
+    if path is not None:
+        base = modelfile.load(path).model
+    _worker_state = (solve_function, base)
+
+
+def _solve_chunk(chunk):
+    solve_function, base = _worker_state
+    return [(index, *_solve_one(solve_function, base, scenario)) for index, scenario in chunk]
+
+
+def iter_batch(solve_function, base, scenarios, workers=None, chunk_size=None):
+    """
+    Resuelve los escenarios en un pool de procesos y retorna los resultados a medida que
+    terminan. El modelo base se comparte con cada proceso una sola vez (un CompactModel,
+    como archivo de modelfile mapeado en memoria); por cada escenario solo viajan sus cambios.
+
+    Parámetros:
+    - solve_function: Función de nivel de módulo solve_function(base, escenario) que retorna
+      (estado, objetivo, solución).
+    - base: Modelo base compartido.
+    - scenarios: Lista de escenarios.
+    - workers: Número de procesos (por defecto, uno por núcleo). Con 1 se resuelve en el
+      proceso actual.
+    - chunk_size: Escenarios por tarea enviada al pool (por defecto, unas cuatro tareas por
+      proceso).
+
+    Retorna:
+    - Un generador de tuplas (índice, estado, objetivo, solución, error). Si solve_function
+      lanza ValueError, el escenario se informa con estado 0 y el mensaje en error.
+    """
+    scenarios = list(scenarios)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(scenarios) <= 1:
+        for index, scenario in enumerate(scenarios):
+            yield (index, *_solve_one(solve_function, base, scenario))
+        return
+
+    chunk_size = chunk_size or max(1, len(scenarios) // (4 * workers))
+    indexed = list(enumerate(scenarios))
+    chunks = [indexed[start:start + chunk_size] for start in range(0, len(indexed), chunk_size)]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Un CompactModel viaja como archivo de modelo compilado: cada proceso lo mapea en
+        # memoria y todos comparten las mismas páginas en lugar de recibir una copia
+        initargs = (solve_function, base)
+        if isinstance(base, CompactModel):
+            path = os.path.join(tmp_dir, "base.lpmodel")
+            modelfile.save(path, modelfile.ModelFile(base))
+            initargs = (solve_function, None, path)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+            futures = [pool.submit(_solve_chunk, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                yield from future.result()
+
+
+def solve_batch(solve_function, base, scenarios, var_names, workers=None, chunk_size=None, callback=None):
+    """
+    Resuelve un lote de escenarios en paralelo y junta los resultados en un BatchResult.
+
+    Parámetros:
+    - solve_function, base, scenarios, workers, chunk_size: Ver iter_batch.
+    - var_names: Nombres de las variables de la solución.
+    - callback: Función opcional callback(índice, estado, objetivo, solución) que se llama
+      apenas termina cada escenario.
+
+    Retorna:
+    - Un BatchResult.
+    """
+    scenarios = list(scenarios)
+    results = BatchResult(len(scenarios), var_names)
+    for index, status, objective, x, error in iter_batch(solve_function, base, scenarios, workers, chunk_size):
+        results.record(index, status, objective, x, error)
+        if callback is not None:
+            callback(index, status, objective, x)
+    return results
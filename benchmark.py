@@ -0,0 +1,403 @@
+"""
+Benchmarks reproducibles de construcción, análisis, resolución y graficado de modelos.
+
+Cada caso genera su instancia con una semilla fija y mide por separado sus fases
+(parse, build, io, solve, readback, plot): el pico de memoria de Python (tracemalloc) en
+una primera corrida, que además sirve de calentamiento, y el mejor tiempo de varias
+repeticiones. Los resultados se guardan en
+JSON para compararlos con una corrida de referencia y marcar las regresiones.
+
+Uso:
+    python benchmark.py run [--suite quick|full] [--repeat N] [--output resultados.json]
+                            [--baseline referencia.json] [--threshold 0.25]
+    python benchmark.py compare referencia.json resultados.json [--threshold 0.25]
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from compact import CompactModel
+
+SEED = 12345
+
+# Las diferencias menores que esto se consideran ruido al comparar
+MIN_SECONDS = 0.005
+MIN_BYTES = 1 << 20
+
+
+# Generadores de instancias
+
+def random_lp(num_constraints, num_variables, density=0.01, seed=SEED):
+    """
+    Genera un LP disperso factible y acotado: max c·x, A·x <= b, 0 <= x <= 10, con A >= 0.
+
+    Retorna:
+    - Un CompactModel.
+    """
+    rng = np.random.default_rng(seed)
+    per_row = max(1, int(round(density * num_variables)))
+    indices = np.sort(np.argsort(rng.random((num_constraints, num_variables)), axis=1)[:, :per_row], axis=1) \
+        if num_constraints * num_variables <= 4_000_000 else \
+        np.sort(rng.integers(0, num_variables, (num_constraints, per_row)), axis=1)
+    data = rng.uniform(0.5, 5.0, indices.shape)
+    indptr = np.arange(num_constraints + 1, dtype=np.int64) * per_row
+    x0 = rng.uniform(0.0, 5.0, num_variables)
+    rhs = (data * x0[indices]).sum(axis=1) + rng.uniform(0.0, 1.0, num_constraints)
+    return CompactModel(
+        rng.uniform(1.0, 10.0, num_variables), indptr, indices.ravel(), data.ravel(),
+        np.full(num_constraints, -np.inf), rhs,
+        np.zeros(num_variables), np.full(num_variables, 10.0),
+        minimize=False,
+    )
+
+
+def assignment_costs(num_resources, num_tasks, density=1.0, seed=SEED):
+    """
+    Genera una matriz de costos de asignación (recursos x tareas). Con density < 1 solo una
+    fracción de los pares está permitida (costo infinito en el resto), siempre incluyendo
+    una asignación completa para que la instancia sea factible.
+
+    Retorna:
+    - Una tupla (filas, columnas, costos) con los pares permitidos.
+    """
+    rng = np.random.default_rng(seed)
+    if density >= 1.0:
+        rows, cols = np.divmod(np.arange(num_resources * num_tasks), num_tasks)
+    else:
+        count = int(density * num_resources * num_tasks)
+        flat = np.unique(rng.integers(0, num_resources * num_tasks, count))
+        rows, cols = np.divmod(flat, num_tasks)
+        # Una asignación completa garantizada
+        matched = np.arange(min(num_resources, num_tasks))
+        extra_rows, extra_cols = matched, rng.permutation(num_tasks)[:matched.size]
+        pairs = np.unique(np.concatenate([rows * num_tasks + cols, extra_rows * num_tasks + extra_cols]))
+        rows, cols = np.divmod(pairs, num_tasks)
+    return rows, cols, rng.uniform(1.0, 100.0, rows.size)
+
+
+def constraint_corpus(num_constraints, num_variables, terms=5, seed=SEED):
+    """
+    Genera un corpus de restricciones en texto, como '3x_1 + 2.5x_4 - x_7 <= 12'.
+
+    Retorna:
+    - Una tupla (objetivo, líneas).
+    """
+    rng = np.random.default_rng(seed)
+    names = [f"x_{j}" for j in range(num_variables)]
+    objective = " + ".join(f"{rng.integers(1, 10)}{name}" for name in names)
+    operators = np.array(["<=", ">=", "="])
+    lines = []
+    for _ in range(num_constraints):
+        chosen = rng.choice(num_variables, size=min(terms, num_variables), replace=False)
+        coefficients = np.round(rng.uniform(-5.0, 5.0, chosen.size), 2)
+        lhs = " ".join(f"{'-' if a < 0 else '+'} {abs(a)}{names[j]}" for a, j in zip(coefficients, chosen)).lstrip("+ ")
+        lines.append(f"{lhs} {rng.choice(operators, p=[0.6, 0.2, 0.2])} {rng.integers(0, 100)}")
+    return objective, lines
+
+
+# Casos: cada uno recibe sus parámetros y phase(nombre), que mide el bloque que envuelve
+
+def _case_lp_matrix(phase, num_constraints, num_variables, density):
+    from models import LinearProgrammingSolver
+
+    model = random_lp(num_constraints, num_variables, density)
+    with phase("build"):
+        solver = LinearProgrammingSolver.from_compact_model(model)
+    with tempfile.TemporaryDirectory() as directory, phase("io"):
+        solver.problem.writeMPS(os.path.join(directory, "model.mps"))
+    with phase("solve"):
+        solver.solve(warm_start=False)
+    with phase("readback"):
+        solver.get_solution()
+        solver.problem.objective.value()
+
+
+def _case_lp_text(phase, num_constraints, num_variables, terms):
+    import utils
+    from models import LinearProgrammingSolver
+
+    objective, lines = constraint_corpus(num_constraints, num_variables, terms)
+    with phase("parse"):
+        for line in lines:
+            lhs, _, rhs = utils.split_constraint(line)
+            utils.parse_linear_expression(lhs)
+            utils.parse_linear_expression(rhs)
+    with phase("build"):
+        solver = LinearProgrammingSolver()
+        solver.add_function(objective)
+        solver.set_objective()
+        solver.add_constraints_bulk("\n".join(lines))
+
+
+def _case_assignment(phase, size, density, method):
+    import mps
+    from models import ResourceAssignmentSolver
+
+    rows, cols, costs = assignment_costs(size, size, density)
+    with phase("build"):
+        solver = ResourceAssignmentSolver.from_coo(rows, cols, costs, size, size, method=method)
+        if method == "mip":
+            model = solver.to_compact_model()
+    if method == "mip":
+        with tempfile.TemporaryDirectory() as directory, phase("io"):
+            mps.write_mps(model, os.path.join(directory, "model.mps"))
+    with phase("solve"):
+        solver.solve()
+    with phase("readback"):
+        solver.get_solution()
+
+
+def _case_plot(phase, num_constraints):
+    import matplotlib.pyplot as plt
+    from models import LinearProgrammingSolver
+
+    rng = np.random.default_rng(SEED)
+    with phase("build"):
+        solver = LinearProgrammingSolver(minimize=False)
+        solver.add_function("3x + 2y")
+        solver.set_objective()
+        for a, b in rng.uniform(0.5, 5.0, (num_constraints, 2)).round(2):
+            solver.add_constraint(f"{a}x + {b}y", "<=", round(float(rng.uniform(10.0, 50.0)), 2))
+    with phase("solve"):
+        solver.solve()
+    with phase("plot"):
+        fig = solver.plot_feasible_region()
+        fig.savefig(io.BytesIO(), format="png")
+        plt.close(fig)
+
+
+_CASES = {
+    "lp_matrix": _case_lp_matrix,
+    "lp_text": _case_lp_text,
+    "assignment": _case_assignment,
+    "plot": _case_plot,
+}
+
+SUITES = {
+    "quick": [
+        ("lp_matrix", {"num_constraints": 200, "num_variables": 300, "density": 0.05}),
+        ("lp_text", {"num_constraints": 500, "num_variables": 50, "terms": 5}),
+        ("assignment", {"size": 10, "density": 1.0, "method": "auto"}),
+        ("assignment", {"size": 100, "density": 1.0, "method": "auto"}),
+        ("assignment", {"size": 500, "density": 0.05, "method": "auto"}),
+        ("assignment", {"size": 30, "density": 1.0, "method": "mip"}),
+        ("plot", {"num_constraints": 8}),
+    ],
+    "full": [
+        ("lp_matrix", {"num_constraints": 200, "num_variables": 300, "density": 0.05}),
+        ("lp_matrix", {"num_constraints": 1000, "num_variables": 1500, "density": 0.01}),
+        ("lp_matrix", {"num_constraints": 2000, "num_variables": 3000, "density": 0.005}),
+        ("lp_text", {"num_constraints": 500, "num_variables": 50, "terms": 5}),
+        ("lp_text", {"num_constraints": 5000, "num_variables": 500, "terms": 10}),
+        ("assignment", {"size": 10, "density": 1.0, "method": "auto"}),
+        ("assignment", {"size": 100, "density": 1.0, "method": "auto"}),
+        ("assignment", {"size": 1000, "density": 1.0, "method": "auto"}),
+        ("assignment", {"size": 5000, "density": 1.0, "method": "auto"}),
+        ("assignment", {"size": 1000, "density": 0.01, "method": "auto"}),
+        ("assignment", {"size": 5000, "density": 0.002, "method": "auto"}),
+        ("assignment", {"size": 30, "density": 1.0, "method": "mip"}),
+        ("assignment", {"size": 100, "density": 0.2, "method": "mip"}),
+        ("plot", {"num_constraints": 8}),
+        ("plot", {"num_constraints": 100}),
+    ],
+}
+
+
+def case_name(kind, params):
+    return kind + "[" + ",".join(f"{key}={value}" for key, value in params.items()) + "]"
+
+
+def run_case(kind, params, repeat=3, memory=True):
+    """
+    Ejecuta un caso una vez sin medir tiempos (con tracemalloc si memory es True), para
+    cargar módulos y cachés, y luego repeat veces midiendo cada fase.
+
+    Retorna:
+    - Un diccionario {fase: {"seconds", "mean", "peak_bytes"}}; seconds es el mejor tiempo.
+    """
+    peaks = {}
+
+    @contextlib.contextmanager
+    def traced(name):
+        if not memory:
+            yield
+            return
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        yield
+        peaks[name] = tracemalloc.get_traced_memory()[1] - baseline
+
+    if memory:
+        tracemalloc.start()
+    try:
+        _CASES[kind](traced, **params)
+    finally:
+        if memory:
+            tracemalloc.stop()
+
+    times = {}
+
+    @contextlib.contextmanager
+    def timed(name):
+        start = time.perf_counter()
+        yield
+        times.setdefault(name, []).append(time.perf_counter() - start)
+
+    for _ in range(repeat):
+        _CASES[kind](timed, **params)
+
+    return {
+        name: {"seconds": min(values), "mean": statistics.fmean(values), "peak_bytes": peaks.get(name)}
+        for name, values in times.items()
+    }
+
+
+def _versions():
+    versions = {"python": platform.python_version(), "numpy": np.__version__}
+    for module in ("pulp", "scipy", "matplotlib"):
+        try:
+            versions[module] = __import__(module).__version__
+        except ImportError:
+            versions[module] = None
+    return versions
+
+
+def _warm_up():
+    """Importa de antemano los módulos que se cargan al primer uso, para no medir su carga."""
+    import matplotlib
+
+    import assignment
+    import models  # noqa: F401
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot  # noqa: F401
+
+    assignment._scipy_solver()
+
+
+def run_suite(suite="quick", repeat=3, memory=True, callback=None):
+    """
+    Ejecuta una suite de SUITES.
+
+    Parámetros:
+    - callback: Función opcional que recibe (nombre del caso, fases) al terminar cada caso.
+
+    Retorna:
+    - Los resultados como diccionario serializable a JSON.
+    """
+    results = {
+        "suite": suite,
+        "seed": SEED,
+        "repeat": repeat,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "machine": {"platform": platform.platform(), "processor": platform.processor(), "cpus": os.cpu_count()},
+        "versions": _versions(),
+        "cases": {},
+    }
+    _warm_up()
+    for kind, params in SUITES[suite]:
+        name = case_name(kind, params)
+        phases = run_case(kind, params, repeat, memory)
+        results["cases"][name] = {"kind": kind, "params": params, "phases": phases}
+        if callback is not None:
+            callback(name, phases)
+    return results
+
+
+def compare(baseline, current, threshold=0.25):
+    """
+    Compara dos corridas fase por fase.
+
+    Parámetros:
+    - baseline, current: Resultados de run_suite.
+    - threshold: Aumento relativo tolerado (0.25 = 25 %) en el tiempo y en el pico de memoria.
+
+    Retorna:
+    - Una lista de regresiones {"case", "phase", "metric", "baseline", "current", "ratio"}.
+    """
+    regressions = []
+    for name, case in current["cases"].items():
+        reference = baseline["cases"].get(name)
+        if reference is None:
+            continue
+        for phase_name, phase in case["phases"].items():
+            before = reference["phases"].get(phase_name)
+            if before is None:
+                continue
+            for metric, noise in (("seconds", MIN_SECONDS), ("peak_bytes", MIN_BYTES)):
+                old, new = before.get(metric), phase.get(metric)
+                if old is None or new is None:
+                    continue
+                if new > old * (1.0 + threshold) and new - old > noise:
+                    regressions.append({
+                        "case": name, "phase": phase_name, "metric": metric,
+                        "baseline": old, "current": new, "ratio": new / old if old else float("inf"),
+                    })
+    return regressions
+
+
+def _print_phases(name, phases):
+    print(name)
+    for phase_name, phase in phases.items():
+        peak = phase["peak_bytes"]
+        memory = f"{peak / 2 ** 20:9.1f} MiB" if peak is not None else ""
+        print(f"  {phase_name:<10} {phase['seconds'] * 1000:10.1f} ms {memory}")
+
+
+def _print_regressions(regressions):
+    for item in regressions:
+        unit = (1000, "ms") if item["metric"] == "seconds" else (2 ** -20, "MiB")
+        print(f"REGRESIÓN {item['case']} {item['phase']} {item['metric']}: "
+              f"{item['baseline'] * unit[0]:.1f} -> {item['current'] * unit[0]:.1f} {unit[1]} (x{item['ratio']:.2f})")
+
+
+def _load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de LP-Solver.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="Ejecuta una suite.")
+    run.add_argument("--suite", choices=sorted(SUITES), default="quick")
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--no-memory", action="store_true", help="No mide el pico de memoria.")
+    run.add_argument("--output", help="Archivo JSON donde guardar los resultados.")
+    run.add_argument("--baseline", help="Resultados de referencia con los que comparar.")
+    run.add_argument("--threshold", type=float, default=0.25)
+    diff = commands.add_parser("compare", help="Compara dos archivos de resultados.")
+    diff.add_argument("baseline")
+    diff.add_argument("current")
+    diff.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run_suite(args.suite, args.repeat, not args.no_memory, callback=_print_phases)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+        if not args.baseline:
+            return 0
+        baseline = _load(args.baseline)
+    else:
+        baseline, results = _load(args.baseline), _load(args.current)
+
+    regressions = compare(baseline, results, args.threshold)
+    _print_regressions(regressions)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
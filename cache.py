@@ -0,0 +1,168 @@
+import base64
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+def _default(value):
+    # Tipos que JSON no conoce: bytes (la figura en PNG) y escalares o arreglos de NumPy
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": base64.b64encode(value).decode("ascii")}
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"La caché no puede guardar valores de tipo {type(value).__name__}.")
+
+
+def _object_hook(obj):
+    if len(obj) == 1 and "__bytes__" in obj:
+        return base64.b64decode(obj["__bytes__"])
+    return obj
+
+
+def encode_entry(entry):
+    """Serializa una entrada como JSON (las tuplas se leen de vuelta como listas)."""
+    return json.dumps(entry, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def decode_entry(data):
+    return json.loads(data, object_hook=_object_hook)
+
+
+class SolveCache:
+    """
+    Caché LRU de resultados de resolución (estado, objetivo, solución, figura en PNG, ...)
+    indexada por una clave del modelo (ver LinearProgrammingSolver.canonical_key).
+
+    Las entradas se guardan serializadas en JSON, de modo que el límite de tamaño se mide
+    en bytes reales y leer el nivel en disco nunca ejecuta código. Con directory se agrega
+    un nivel en disco que sobrevive a los reinicios y se comparte entre sesiones; una
+    entrada que se encuentra en disco se promueve a memoria. Los archivos del nivel en disco
+    se recorren una sola vez al crear la caché y luego se siguen en memoria.
+    Es segura para usarse desde varios hilos (sesiones y trabajos en segundo plano).
+    """
+
+    def __init__(self, max_entries=64, max_bytes=64 * 1024 * 1024, directory=None, max_disk_entries=1024,
+                 max_disk_bytes=1024 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_entries = max_disk_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.disk_entries = OrderedDict()  # Clave -> tamaño en bytes, del uso más antiguo al más reciente
+        self.disk_size = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._scan_disk()
+
+    def __len__(self):
+        with self._lock:
+            return len(self.entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            if key in self.entries or key in self.disk_entries:
+                return True
+        return self.directory is not None and os.path.exists(self._path(key))
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _scan_disk(self):
+        files = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                try:
+                    info = os.stat(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                files.append((info.st_mtime, name[:-len(".json")], info.st_size))
+        for _, key, size in sorted(files):
+            self._track(key, size)
+        self._evict_disk()
+
+    def get(self, key):
+        """Retorna la entrada guardada para la clave, o None si no está en la caché."""
+        with self._lock:
+            data = self.entries.get(key)
+            if data is not None:
+                self.entries.move_to_end(key)
+            elif self.directory is not None:
+                try:
+                    with open(self._path(key), "rb") as f:
+                        data = f.read()
+                    os.utime(self._path(key))  # El nivel en disco también se depura por uso reciente
+                except OSError:
+                    data = None
+                    self._untrack(key)
+                if data is not None:
+                    self._track(key, len(data))
+                    self._store(key, data)
+
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        try:
+            return decode_entry(data)
+        except ValueError:
+            return None  # Archivo dañado: se trata como ausente
+
+    def put(self, key, entry):
+        """Guarda una entrada (un objeto serializable en JSON; se admiten bytes y tipos de NumPy) para la clave."""
+        data = encode_entry(entry)
+        with self._lock:
+            self._store(key, data)
+            if self.directory is not None:
+                self._write_to_disk(key, data)
+
+    def _store(self, key, data):
+        # Se llama con el candado tomado
+        if key in self.entries:
+            self.size -= len(self.entries.pop(key))
+        if len(data) > self.max_bytes:
+            return
+        self.entries[key] = data
+        self.size += len(data)
+        while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def _track(self, key, size):
+        self._untrack(key)
+        self.disk_entries[key] = size
+        self.disk_size += size
+
+    def _untrack(self, key):
+        size = self.disk_entries.pop(key, None)
+        if size is not None:
+            self.disk_size -= size
+
+    def _write_to_disk(self, key, data):
+        # Escritura atómica: otra sesión nunca lee un archivo a medio escribir
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self._path(key))
+        self._track(key, len(data))
+        self._evict_disk()
+
+    def _evict_disk(self):
+        while self.disk_entries and (len(self.disk_entries) > self.max_disk_entries or self.disk_size > self.max_disk_bytes):
+            key, size = self.disk_entries.popitem(last=False)
+            self.disk_size -= size
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.size = 0
@@ -0,0 +1,216 @@
+import numpy as np
+from pulp import LpAffineExpression, LpConstraint, LpConstraintEQ, LpConstraintGE, LpConstraintLE, LpMaximize, LpMinimize, LpProblem, LpVariable
+
+
+class CompactModel:
+    """
+    Representación compacta de un modelo lineal:
+
+        min/max  c·x + offset
+        s.a.     row_lower <= A·x <= row_upper
+                 lower <= x <= upper
+
+    Los costos y límites se guardan como arreglos por columna y la matriz A en formato CSR
+    (indptr, indices, data). Los límites ausentes se representan con ±inf.
+    """
+
+    def __init__(self, c, indptr, indices, data, row_lower, row_upper, lower, upper,
+                 var_names=None, row_names=None, minimize=True, offset=0.0, integer=None):
+        self.c = np.asarray(c, dtype=float)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=float)
+        self.row_lower = np.asarray(row_lower, dtype=float)
+        self.row_upper = np.asarray(row_upper, dtype=float)
+        self.lower = np.asarray(lower, dtype=float)
+        self.upper = np.asarray(upper, dtype=float)
+        self.var_names = list(var_names) if var_names is not None else [f"x_{j}" for j in range(self.c.size)]
+        self.row_names = list(row_names) if row_names is not None else [f"Restriccion_{i}" for i in range(self.row_lower.size)]
+        self.minimize = minimize
+        self.offset = float(offset)
+        self.integer = np.zeros(self.c.size, dtype=bool) if integer is None else np.asarray(integer, dtype=bool)
+
+    @property
+    def num_variables(self):
+        return self.c.size
+
+    @property
+    def num_constraints(self):
+        return self.row_lower.size
+
+    @property
+    def nnz(self):
+        return self.data.size
+
+    @property
+    def row_index(self):
+        """Fila de cada elemento no nulo de A."""
+        return np.repeat(np.arange(self.num_constraints), np.diff(self.indptr))
+
+    def is_mip(self):
+        return bool(self.integer.any())
+
+    def activity(self, x):
+        """Calcula A·x en una sola pasada sobre los elementos no nulos."""
+        return np.bincount(self.row_index, weights=self.data * np.asarray(x, dtype=float)[self.indices], minlength=self.num_constraints)
+
+    def variable_index(self, name):
+        if not hasattr(self, "_variable_index"):
+            self._variable_index = {var: j for j, var in enumerate(self.var_names)}
+        if name not in self._variable_index:
+            raise ValueError(f"La variable '{name}' no existe en el modelo.")
+        return self._variable_index[name]
+
+    def constraint_index(self, name):
+        if not hasattr(self, "_row_index"):
+            self._row_index = {row: i for i, row in enumerate(self.row_names)}
+        if name not in self._row_index:
+            raise ValueError(f"La restricción '{name}' no existe en el modelo.")
+        return self._row_index[name]
+
+    def with_changes(self, c=None, rhs=None, bounds=None):
+        """
+        Retorna una variante del modelo que comparte la matriz A y solo reemplaza los datos
+        indicados.
+
+        Parámetros:
+        - c: Vector completo de costos o diccionario {variable: costo}.
+        - rhs: Vector completo de lados derechos o diccionario {restricción: valor}. En las
+          restricciones de igualdad se cambian ambos límites; en las demás, el límite finito.
+        - bounds: Diccionario {variable: (inferior, superior)}, con None para "sin límite".
+
+        Retorna:
+        - Un nuevo CompactModel.
+        """
+        new_c = self.c.copy()
+        if isinstance(c, dict):
+            for name, value in c.items():
+                new_c[self.variable_index(name)] = value
+        elif c is not None:
+            new_c = np.asarray(c, dtype=float)
+
+        row_lower, row_upper = self.row_lower.copy(), self.row_upper.copy()
+        if rhs is not None:
+            if isinstance(rhs, dict):
+                positions = np.fromiter((self.constraint_index(name) for name in rhs), dtype=np.int64, count=len(rhs))
+                values = np.fromiter(rhs.values(), dtype=float, count=len(rhs))
+            else:
+                positions, values = np.arange(self.num_constraints), np.asarray(rhs, dtype=float)
+            equality = row_lower[positions] == row_upper[positions]
+            has_upper = np.isfinite(row_upper[positions])
+            row_upper[positions] = np.where(equality | has_upper, values, row_upper[positions])
+            row_lower[positions] = np.where(equality | ~has_upper, values, row_lower[positions])
+
+        lower, upper = self.lower.copy(), self.upper.copy()
+        for name, (low, up) in (bounds or {}).items():
+            j = self.variable_index(name)
+            lower[j] = -np.inf if low is None else low
+            upper[j] = np.inf if up is None else up
+
+        return CompactModel(new_c, self.indptr, self.indices, self.data, row_lower, row_upper, lower, upper,
+                            self.var_names, self.row_names, self.minimize, self.offset, self.integer)
+
+    @classmethod
+    def from_pulp(cls, problem, variables=None):
+        """
+        Extrae la forma compacta de un LpProblem recorriendo una vez cada restricción.
+
+        Parámetros:
+        - problem: El LpProblem.
+        - variables: Lista de variables que fija el orden de las columnas (por defecto, las
+          del problema en el orden de PuLP). Las variables del problema que no estén en la
+          lista se agregan al final.
+
+        Retorna:
+        - Una instancia de CompactModel.
+        """
+        variables = list(variables) if variables is not None else []
+        column = {var.name: j for j, var in enumerate(variables)}
+        for var in problem.variables():
+            if var.name not in column:
+                column[var.name] = len(variables)
+                variables.append(var)
+
+        indptr, indices, data = [0], [], []
+        row_lower, row_upper, row_names = [], [], []
+        for name, constraint in problem.constraints.items():
+            for var, coeff in constraint.items():
+                indices.append(column[var.name])
+                data.append(coeff)
+            indptr.append(len(indices))
+            rhs = -constraint.constant
+            row_lower.append(rhs if constraint.sense in (LpConstraintGE, LpConstraintEQ) else -np.inf)
+            row_upper.append(rhs if constraint.sense in (LpConstraintLE, LpConstraintEQ) else np.inf)
+            row_names.append(name)
+
+        c = np.zeros(len(variables))
+        offset = 0.0
+        if problem.objective is not None:
+            for var, coeff in problem.objective.items():
+                c[column[var.name]] = coeff
+            offset = problem.objective.constant
+
+        return cls(
+            c, indptr, indices, data, row_lower, row_upper,
+            lower=[-np.inf if var.lowBound is None else var.lowBound for var in variables],
+            upper=[np.inf if var.upBound is None else var.upBound for var in variables],
+            var_names=[var.name for var in variables],
+            row_names=row_names,
+            minimize=problem.sense == LpMinimize,
+            offset=offset,
+            integer=[var.cat == "Integer" for var in variables],
+        )
+
+    def to_pulp(self, problem_name="Compact_Model"):
+        """
+        Construye un LpProblem equivalente, con las variables y restricciones nombradas
+        como en var_names y row_names.
+
+        Las filas con dos límites finitos distintos se dividen en dos restricciones,
+        '<nombre>_min' y '<nombre>_max'; read_pulp_solution las vuelve a unir.
+        """
+        problem = LpProblem(problem_name, LpMinimize if self.minimize else LpMaximize)
+        variables = [
+            LpVariable(name, None if np.isinf(low) else low, None if np.isinf(up) else up,
+                       "Integer" if integer else "Continuous")
+            for name, low, up, integer in zip(self.var_names, self.lower.tolist(), self.upper.tolist(), self.integer.tolist())
+        ]
+        problem.setObjective(LpAffineExpression(
+            [(variables[j], coeff) for j, coeff in enumerate(self.c.tolist()) if coeff != 0], constant=self.offset
+        ))
+
+        indices, data = self.indices.tolist(), self.data.tolist()
+        for i, name in enumerate(self.row_names):
+            start, end = self.indptr[i], self.indptr[i + 1]
+            expression = LpAffineExpression([(variables[j], coeff) for j, coeff in zip(indices[start:end], data[start:end])])
+            low, up = self.row_lower[i], self.row_upper[i]
+            if low == up:
+                problem.addConstraint(LpConstraint(expression, LpConstraintEQ, rhs=low), name)
+            elif np.isfinite(low) and np.isfinite(up):
+                problem.addConstraint(LpConstraint(expression, LpConstraintGE, rhs=low), f"{name}_min")
+                problem.addConstraint(LpConstraint(expression, LpConstraintLE, rhs=up), f"{name}_max")
+            elif np.isfinite(low):
+                problem.addConstraint(LpConstraint(expression, LpConstraintGE, rhs=low), name)
+            else:
+                problem.addConstraint(LpConstraint(expression, LpConstraintLE, rhs=up), name)
+        return problem
+
+    def read_pulp_solution(self, problem):
+        """
+        Lee la solución de un LpProblem creado con to_pulp.
+
+        Retorna:
+        - Una tupla (x, duales) de arreglos en el orden de var_names y row_names. Los duales
+          de una fila dividida son la suma de los de sus dos restricciones; los de un problema
+          entero son ceros.
+        """
+        values = problem.variablesDict()
+        x = np.fromiter((values[name].varValue or 0.0 if name in values else 0.0 for name in self.var_names),
+                        dtype=float, count=self.num_variables)
+        duals = np.zeros(self.num_constraints)
+        for i, name in enumerate(self.row_names):
+            for key in (name, f"{name}_min", f"{name}_max"):
+                constraint = problem.constraints.get(key)
+                if constraint is not None and constraint.pi is not None:
+                    duals[i] += constraint.pi
+        return x, duals
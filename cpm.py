@@ -0,0 +1,328 @@
+import numpy as np
+
+import loaders
+
+
+def _gather(indptr, indices, nodes):
+    """
+    Vecinos de varios nodos en una matriz CSR, sin recorrerlos uno por uno.
+
+    Retorna:
+    - Una tupla (dueño, vecino): para cada arista, la posición en nodes de su nodo y el
+      nodo vecino.
+    """
+    starts = indptr[nodes]
+    counts = indptr[nodes + 1] - starts
+    total = int(counts.sum())
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(np.arange(nodes.size), counts), indices[np.repeat(starts, counts) + offsets]
+
+
+def _distinct(values):
+    """Valores distintos de un arreglo de enteros, ordenados."""
+    values = np.sort(values)
+    return values[np.concatenate([[True], values[1:] != values[:-1]])] if values.size else values
+
+
+def _csr(keys, values, size):
+    """Ordena pares (clave, valor) en una matriz CSR (indptr, indices) con size filas."""
+    order = np.argsort(keys, kind="stable")
+    indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=size), out=indptr[1:])
+    return indptr, values[order]
+
+
+class ProjectNetwork:
+    """
+    Red de actividades para el método de la ruta crítica (CPM), guardada como arreglos:
+    duraciones por actividad y las dependencias en formato CSR, una vez por sucesoras y
+    otra por predecesoras.
+
+    Los cálculos recorren la red por niveles (level[v] > level[u] para cada dependencia
+    u -> v) con operaciones vectorizadas sobre todas las actividades del nivel, en O(V + E).
+    Los tiempos tardíos se guardan como la cola de cada actividad (la ruta más larga desde
+    su fin hasta el fin del proyecto), que no depende de la duración total; así, al cambiar
+    una duración o una dependencia solo se recalculan las actividades aguas abajo (inicio
+    temprano) y aguas arriba (cola) del cambio.
+    """
+
+    def __init__(self, durations, sources=(), targets=(), names=None):
+        """
+        Parámetros:
+        - durations: Duración de cada actividad (no negativa).
+        - sources, targets: Dependencias como arreglos de índices: la actividad targets[k]
+          empieza cuando termina sources[k]. Las repetidas se cuentan una vez.
+        - names: Identificadores de las actividades (por defecto, '1', '2', ...).
+
+        Lanza ValueError si hay duraciones no válidas, índices fuera de rango o un ciclo.
+        """
+        self.durations = np.array(durations, dtype=float)
+        if self.durations.ndim != 1:
+            raise ValueError("durations debe ser un vector.")
+        self.names = list(names) if names is not None else [str(i + 1) for i in range(self.durations.size)]
+        if len(self.names) != self.durations.size:
+            raise ValueError("Debe haber un nombre por actividad.")
+        invalid = ~np.isfinite(self.durations) | (self.durations < 0)
+        if invalid.any():
+            raise ValueError(f"Duración no válida en la actividad '{self.names[np.flatnonzero(invalid)[0]]}'.")
+
+        n = self.durations.size
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        if sources.shape != targets.shape:
+            raise ValueError("sources y targets deben tener la misma longitud.")
+        if sources.size and (min(sources.min(), targets.min()) < 0 or max(sources.max(), targets.max()) >= n):
+            raise ValueError("Hay dependencias con actividades fuera de rango.")
+        # Ordenadas por origen y destino: el CSR de predecesoras conserva el orden por origen
+        keys = _distinct(sources * n + targets)
+        sources, targets = keys // max(n, 1), keys % max(n, 1)
+        self.succ_indptr, self.succ_indices = _csr(sources, targets, n)
+        self.pred_indptr, self.pred_indices = _csr(targets, sources, n)
+        self._index = None
+        self.recompute()
+
+    @classmethod
+    def from_csv(cls, source, delimiter=",", separator=";"):
+        """Crea la red desde un CSV de actividades (ver loaders.load_activities)."""
+        names, durations, sources, targets = loaders.load_activities(source, delimiter, separator)
+        return cls(durations, sources, targets, names)
+
+    @property
+    def num_activities(self):
+        return self.durations.size
+
+    @property
+    def num_dependencies(self):
+        return self.succ_indices.size
+
+    def index(self, activity):
+        """Índice de una actividad dada por su nombre o por su índice."""
+        if isinstance(activity, (int, np.integer)):
+            if not 0 <= activity < self.num_activities:
+                raise ValueError(f"No existe la actividad {activity}.")
+            return int(activity)
+        if self._index is None:
+            self._index = {name: i for i, name in enumerate(self.names)}
+        if activity not in self._index:
+            raise ValueError(f"No existe la actividad '{activity}'.")
+        return self._index[activity]
+
+    def recompute(self):
+        """Calcula los niveles y los tiempos de todas las actividades desde cero."""
+        n = self.num_activities
+        # Orden topológico de Kahn por niveles: cada nivel se procesa como un bloque
+        self.level = np.zeros(n, dtype=np.int64)
+        remaining = np.diff(self.pred_indptr)
+        frontier = np.flatnonzero(remaining == 0)
+        depth, processed = 0, 0
+        while frontier.size:
+            self.level[frontier] = depth
+            processed += frontier.size
+            _, successors = _gather(self.succ_indptr, self.succ_indices, frontier)
+            np.subtract.at(remaining, successors, 1)
+            frontier = _distinct(successors[remaining[successors] == 0])
+            depth += 1
+        if processed < n:
+            stuck = np.flatnonzero(remaining > 0)[0]
+            raise ValueError(f"Las dependencias forman un ciclo (incluye la actividad '{self.names[stuck]}').")
+
+        self.earliest_start = np.zeros(n)
+        self.earliest_finish = self.durations.copy()
+        self.tail = np.zeros(n)
+        order = np.argsort(self.level, kind="stable")
+        bounds = np.searchsorted(self.level[order], np.arange(depth + 1))
+        for k in range(1, depth):
+            self._forward(order[bounds[k]:bounds[k + 1]])
+        for k in range(depth - 2, -1, -1):
+            self._backward(order[bounds[k]:bounds[k + 1]])
+
+    def _forward(self, nodes):
+        """Recalcula el inicio y fin tempranos de nodes; retorna los que cambiaron."""
+        owner, predecessors = _gather(self.pred_indptr, self.pred_indices, nodes)
+        start = np.zeros(nodes.size)
+        np.maximum.at(start, owner, self.earliest_finish[predecessors])
+        finish = start + self.durations[nodes]
+        changed = (start != self.earliest_start[nodes]) | (finish != self.earliest_finish[nodes])
+        self.earliest_start[nodes] = start
+        self.earliest_finish[nodes] = finish
+        return nodes[changed]
+
+    def _backward(self, nodes):
+        """Recalcula la cola de nodes; retorna los que cambiaron."""
+        owner, successors = _gather(self.succ_indptr, self.succ_indices, nodes)
+        tail = np.zeros(nodes.size)
+        np.maximum.at(tail, owner, self.durations[successors] + self.tail[successors])
+        changed = tail != self.tail[nodes]
+        self.tail[nodes] = tail
+        return nodes[changed]
+
+    def _propagate(self, seeds, downstream):
+        """
+        Recalcula seeds y, nivel por nivel, las actividades del cono aguas abajo (o aguas
+        arriba) que dependen de un valor que cambió.
+        """
+        indptr, indices = (self.succ_indptr, self.succ_indices) if downstream else (self.pred_indptr, self.pred_indices)
+        pending = _distinct(np.asarray(seeds, dtype=np.int64))
+        while pending.size:
+            levels = self.level[pending]
+            current = levels == (levels.min() if downstream else levels.max())
+            changed = self._forward(pending[current]) if downstream else self._backward(pending[current])
+            _, neighbors = _gather(indptr, indices, changed)
+            pending = _distinct(np.concatenate([pending[~current], neighbors]))
+
+    def set_duration(self, activity, duration):
+        """Cambia la duración de una actividad y recalcula solo los tiempos afectados."""
+        i = self.index(activity)
+        duration = float(duration)
+        if not np.isfinite(duration) or duration < 0:
+            raise ValueError("La duración debe ser un número no negativo.")
+        self.durations[i] = duration
+        self._propagate([i], downstream=True)
+        self._propagate(self.pred_indices[self.pred_indptr[i]:self.pred_indptr[i + 1]], downstream=False)
+
+    def add_dependency(self, predecessor, successor):
+        """
+        Agrega la dependencia predecessor -> successor y recalcula solo los tiempos
+        afectados. Lanza ValueError si crearía un ciclo.
+        """
+        u, v = self.index(predecessor), self.index(successor)
+        if u == v:
+            raise ValueError("Una actividad no puede depender de sí misma.")
+        if v in self.successors(u):
+            return
+        if self.level[u] >= self.level[v]:
+            self._raise_levels(u, v)
+        position = self.succ_indptr[u + 1]
+        self.succ_indices = np.insert(self.succ_indices, position, v)
+        self.succ_indptr[u + 1:] += 1
+        position = self.pred_indptr[v + 1]
+        self.pred_indices = np.insert(self.pred_indices, position, u)
+        self.pred_indptr[v + 1:] += 1
+        self._propagate([v], downstream=True)
+        self._propagate([u], downstream=False)
+
+    def _raise_levels(self, u, v):
+        """Sube el nivel de v y de su cono aguas abajo por encima de u; detecta ciclos."""
+        level = self.level.copy()
+        level[v] = level[u] + 1
+        frontier = np.array([v])
+        while frontier.size:
+            owner, successors = _gather(self.succ_indptr, self.succ_indices, frontier)
+            required = level[frontier][owner] + 1
+            raised = required > level[successors]
+            if np.any(successors[raised] == u):
+                raise ValueError(f"La dependencia '{self.names[u]}' -> '{self.names[v]}' crearía un ciclo.")
+            np.maximum.at(level, successors[raised], required[raised])
+            frontier = _distinct(successors[raised])
+        self.level = level
+
+    def remove_dependency(self, predecessor, successor):
+        """Elimina la dependencia predecessor -> successor y recalcula solo los tiempos afectados."""
+        u, v = self.index(predecessor), self.index(successor)
+        position = np.flatnonzero(self.successors(u) == v)
+        if position.size == 0:
+            raise ValueError(f"No existe la dependencia '{self.names[u]}' -> '{self.names[v]}'.")
+        self.succ_indices = np.delete(self.succ_indices, self.succ_indptr[u] + position[0])
+        self.succ_indptr[u + 1:] -= 1
+        position = np.flatnonzero(self.predecessors(v) == u)
+        self.pred_indices = np.delete(self.pred_indices, self.pred_indptr[v] + position[0])
+        self.pred_indptr[v + 1:] -= 1
+        # Los niveles siguen siendo un orden válido: no hace falta recalcularlos
+        self._propagate([v], downstream=True)
+        self._propagate([u], downstream=False)
+
+    def successors(self, activity):
+        i = self.index(activity)
+        return self.succ_indices[self.succ_indptr[i]:self.succ_indptr[i + 1]]
+
+    def predecessors(self, activity):
+        i = self.index(activity)
+        return self.pred_indices[self.pred_indptr[i]:self.pred_indptr[i + 1]]
+
+    @property
+    def project_duration(self):
+        return float(self.earliest_finish.max(initial=0.0))
+
+    @property
+    def latest_finish(self):
+        return self.project_duration - self.tail
+
+    @property
+    def latest_start(self):
+        return self.latest_finish - self.durations
+
+    @property
+    def total_float(self):
+        return self.latest_start - self.earliest_start
+
+    @property
+    def free_float(self):
+        """Holgura libre: cuánto puede atrasarse una actividad sin atrasar a sus sucesoras."""
+        next_start = np.full(self.num_activities, self.project_duration)
+        has_successors = np.diff(self.succ_indptr) > 0
+        if self.num_dependencies:
+            starts = np.minimum.reduceat(self.earliest_start[self.succ_indices], self.succ_indptr[:-1][has_successors])
+            next_start[has_successors] = starts
+        return next_start - self.earliest_finish
+
+    def critical(self, tolerance=1e-9):
+        """Máscara de las actividades críticas (holgura total nula)."""
+        return self.total_float <= tolerance * max(1.0, self.project_duration)
+
+    def critical_path(self, tolerance=1e-9):
+        """
+        Una ruta crítica, del inicio al fin del proyecto.
+
+        Retorna:
+        - Un arreglo con los índices de sus actividades, en orden.
+        """
+        if self.num_activities == 0:
+            return np.zeros(0, dtype=np.int64)
+        critical = self.critical(tolerance)
+        eps = tolerance * max(1.0, self.project_duration)
+        # Siguiente actividad de cada una: la primera sucesora crítica que empieza al terminar
+        owner = np.repeat(np.arange(self.num_activities), np.diff(self.succ_indptr))
+        tight = critical[owner] & critical[self.succ_indices] & (
+            np.abs(self.earliest_start[self.succ_indices] - self.earliest_finish[owner]) <= eps
+        )
+        following = np.full(self.num_activities, -1, dtype=np.int64)
+        first_owners, first = np.unique(owner[tight], return_index=True)
+        following[first_owners] = self.succ_indices[tight][first]
+
+        node = int(np.flatnonzero(critical & (self.earliest_start <= eps))[0])
+        following = following.tolist()
+        path = [node]
+        while following[node] >= 0:
+            node = following[node]
+            path.append(node)
+        return np.array(path, dtype=np.int64)
+
+    def activity(self, activity):
+        """Tiempos de una actividad como diccionario."""
+        i = self.index(activity)
+        latest_finish = self.project_duration - self.tail[i]
+        next_starts = self.earliest_start[self.successors(i)]
+        return {
+            "name": self.names[i],
+            "duration": float(self.durations[i]),
+            "earliest_start": float(self.earliest_start[i]),
+            "earliest_finish": float(self.earliest_finish[i]),
+            "latest_start": float(latest_finish - self.durations[i]),
+            "latest_finish": float(latest_finish),
+            "total_float": float(latest_finish - self.earliest_finish[i]),
+            "free_float": float(next_starts.min(initial=self.project_duration) - self.earliest_finish[i]),
+            "predecessors": [self.names[j] for j in self.predecessors(i).tolist()],
+            "successors": [self.names[j] for j in self.successors(i).tolist()],
+        }
+
+    def summary(self):
+        """Resumen del proyecto: tamaño, duración, actividades críticas y holguras."""
+        total_float = self.total_float
+        return {
+            "num_activities": self.num_activities,
+            "num_dependencies": self.num_dependencies,
+            "project_duration": self.project_duration,
+            "num_critical": int(np.count_nonzero(self.critical())),
+            "depth": int(self.level.max(initial=-1)) + 1,
+            "mean_total_float": float(total_float.mean()) if total_float.size else 0.0,
+        }
@@ -0,0 +1,100 @@
+"""
+Presupuesto de tiempo de importación. Cada módulo se importa en un intérprete nuevo y se
+comprueba que cargue en menos del tiempo indicado y sin arrastrar dependencias pesadas
+que solo se necesitan en funciones concretas (SymPy para el análisis simbólico,
+Matplotlib para los gráficos, SciPy y pandas).
+
+Uso: python import_budget.py [--repeat N]
+Termina con código 1 si algún módulo excede su presupuesto o no se puede importar. Solo se
+omiten los módulos que necesitan una dependencia opcional que no está instalada.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+HEAVY_MODULES = ("sympy", "matplotlib", "scipy", "pandas")
+
+# Dependencias opcionales: si faltan, el módulo que las necesita se omite
+OPTIONAL_DEPENDENCIES = ("streamlit",)
+
+# Módulo: (segundos, dependencias que no debe cargar)
+BUDGETS = {
+    "models": (0.5, HEAVY_MODULES),
+    "batch": (0.4, HEAVY_MODULES),
+    "jobs": (0.4, HEAVY_MODULES),
+    "modelfile": (0.4, HEAVY_MODULES),
+    "cpm": (0.4, HEAVY_MODULES),
+    "Inicio": (1.5, HEAVY_MODULES),
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+try:
+    import {module}
+except ModuleNotFoundError as e:
+    if (e.name or "").split(".")[0] not in {optional!r}:
+        raise
+    print(json.dumps({{"missing": e.name}}))
+    sys.exit(0)
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module, heavy=HEAVY_MODULES, repeat=3):
+    """
+    Importa un módulo en un intérprete nuevo (repeat veces) y mide su tiempo de importación.
+
+    Retorna:
+    - Un diccionario {"elapsed": mejor tiempo en segundos, "loaded": dependencias pesadas
+      cargadas}; {"missing": dependencia} si falta una dependencia opcional (por ejemplo,
+      Streamlit), o {"error": mensaje} si la importación falla por cualquier otro motivo.
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+    best = None
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, heavy=tuple(heavy), optional=OPTIONAL_DEPENDENCIES)],
+            cwd=root, capture_output=True, text=True,
+        )
+        if completed.returncode != 0:
+            lines = completed.stderr.strip().splitlines()
+            return {"error": lines[-1] if lines else f"código de salida {completed.returncode}"}
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        if "missing" in result:
+            return result
+        if best is None or result["elapsed"] < best["elapsed"]:
+            best = result
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Importaciones por módulo; se toma la más rápida.")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module, (budget, heavy) in BUDGETS.items():
+        result = measure(module, heavy, args.repeat)
+        if "missing" in result:
+            print(f"{module:<12} omitido (falta la dependencia opcional {result['missing']})")
+            continue
+        if "error" in result:
+            failed = True
+            print(f"{module:<12} error al importar: {result['error']}")
+            continue
+        problems = []
+        if result["elapsed"] > budget:
+            problems.append(f"excede {budget:.2f} s")
+        if result["loaded"]:
+            problems.append("carga " + ", ".join(result["loaded"]))
+        failed = failed or bool(problems)
+        print(f"{module:<12} {result['elapsed'] * 1000:8.1f} ms  {'; '.join(problems) or 'ok'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
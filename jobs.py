@@ -0,0 +1,150 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import mip
+
+# Estados de un trabajo
+QUEUED = "queued"
+RUNNING = "running"
+CANCELLING = "cancelling"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+# Nombres de los estados de un trabajo en curso para mostrar en las páginas
+LABELS = {QUEUED: "en cola", RUNNING: "en ejecución", CANCELLING: "cancelando"}
+
+
+class SolveJob:
+    """
+    Resolución en segundo plano. La función recibe el propio trabajo: debe pasar job.token
+    (un mip.CancelToken) al solver para que cancel() pueda terminar el proceso de CBC, y
+    puede publicar su avance en job.progress (por ejemplo, la última solución incumbente).
+
+    Atributos:
+    - key: Clave del modelo (por ejemplo, LinearProgrammingSolver.canonical_key()).
+    - progress: Último avance publicado por la función.
+    - result: Lo que retornó la función, cuando el estado es DONE.
+    - error: La excepción, cuando el estado es FAILED.
+    """
+
+    def __init__(self, key, function):
+        self.key = key
+        self.function = function
+        self.token = mip.CancelToken()
+        self.submitted_at = time.monotonic()
+        self.started_at = None
+        self.finished_at = None
+        self.progress = None
+        self.result = None
+        self.error = None
+        self.future = None
+        self._cancelled = False
+
+    def _run(self):
+        self.started_at = time.monotonic()
+        try:
+            self.result = self.function(self)
+        except mip.SolveCancelled:
+            self._cancelled = True
+        except Exception as e:
+            self.error = e
+        finally:
+            self.finished_at = time.monotonic()
+
+    @property
+    def status(self):
+        # Un trabajo terminado conserva su estado aunque se cancele después
+        if self.finished_at is not None:
+            if self.error is not None:
+                return FAILED
+            return CANCELLED if self._cancelled else DONE
+        # Cancelado pero todavía en ejecución: no está terminado hasta que _run retorne
+        if self.token.cancelled:
+            return CANCELLING
+        return RUNNING if self.started_at is not None else QUEUED
+
+    def done(self):
+        return self.finished_at is not None
+
+    @property
+    def elapsed(self):
+        """Segundos de ejecución (sin contar la espera en la cola)."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    def cancel(self):
+        """
+        Cancela el trabajo: lo saca de la cola o termina el proceso de CBC en curso. No
+        hace nada si el trabajo ya terminó.
+        """
+        if self.finished_at is not None:
+            return
+        self.token.cancel()
+        if self.future is not None and self.future.cancel():
+            # Salió de la cola: _run nunca se ejecutará
+            self._cancelled = True
+            self.finished_at = time.monotonic()
+
+
+class JobManager:
+    """
+    Pool de hilos para resolver modelos sin bloquear la sesión de Streamlit. El trabajo
+    pesado ocurre en el proceso de CBC, de modo que los hilos no compiten por el GIL.
+
+    Un modelo con la misma clave que un trabajo que aún no termina no se vuelve a enviar:
+    submit retorna el trabajo existente.
+    """
+
+    def __init__(self, max_workers=None):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 1, thread_name_prefix="solve")
+        self.jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key, function):
+        """
+        Envía function(job) al pool.
+
+        Retorna:
+        - Una tupla (trabajo, es_nuevo); es_nuevo es False si ya había un trabajo en curso
+          para la misma clave.
+        """
+        with self._lock:
+            job = self.jobs.get(key)
+            if job is not None and not job.done():
+                return job, False
+            job = SolveJob(key, function)
+            self.jobs[key] = job
+            job.future = self.executor.submit(job._run)
+            return job, True
+
+    def get(self, key):
+        return self.jobs.get(key)
+
+    def cancel(self, key):
+        job = self.jobs.get(key)
+        if job is not None:
+            job.cancel()
+        return job
+
+    def forget(self, job):
+        """Quita un trabajo terminado del registro."""
+        with self._lock:
+            if self.jobs.get(job.key) is job and job.done():
+                del self.jobs[job.key]
+
+
+_default_manager = None
+_default_lock = threading.Lock()
+
+
+def default_manager():
+    """Pool compartido por todas las páginas y sesiones del proceso."""
+    global _default_manager
+    with _default_lock:
+        if _default_manager is None:
+            _default_manager = JobManager()
+        return _default_manager
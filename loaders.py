@@ -0,0 +1,233 @@
+import csv
+import io
+import itertools
+import os
+
+import numpy as np
+
+_BLOCK_SIZE = 1 << 20
+
+
+def _is_number(text):
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _open_binary(source):
+    """Retorna (flujo binario, debe_cerrarse) para una ruta o un objeto tipo archivo."""
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, "rb"), True
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source), True
+    source.seek(0)
+    return source, False
+
+
+def _count_lines(stream):
+    """Cuenta las líneas desde la posición actual leyendo bloques de tamaño fijo."""
+    start = stream.tell()
+    lines, last = 0, b"\n"
+    while True:
+        block = stream.read(_BLOCK_SIZE)
+        if not block:
+            break
+        lines += block.count(b"\n")
+        last = block[-1:]
+    stream.seek(start)
+    return lines + (last != b"\n")
+
+
+def validate_cost_matrix(matrix):
+    """
+    Valida una matriz de costos con operaciones vectorizadas: debe ser bidimensional y sus
+    valores numéricos, sin NaN ni -inf (inf representa un par prohibido).
+
+    Parámetros:
+    - matrix: Lista de listas o arreglo con los costos (recursos x tareas).
+
+    Retorna:
+    - La matriz como arreglo de NumPy de tipo float (sin copiar si ya lo era).
+    """
+    try:
+        matrix = np.asarray(matrix, dtype=float)
+    except (TypeError, ValueError) as e:
+        raise ValueError("cost_matrix debe ser una matriz rectangular de números.") from e
+    if matrix.ndim != 2:
+        raise ValueError("cost_matrix debe ser una matriz rectangular.")
+    _check_values(matrix, 0)
+    return matrix
+
+
+def _check_values(block, first_row):
+    invalid = np.isnan(block) | (block == -np.inf)
+    if invalid.any():
+        row, col = np.argwhere(invalid)[0]
+        raise ValueError(f"Costo no válido en la fila {first_row + row + 1}, columna {col + 1}.")
+
+
+def load_cost_matrix(source, delimiter=",", chunk_rows=65536, out=None):
+    """
+    Carga una matriz de costos (recursos x tareas) desde un archivo CSV o .npy, por bloques,
+    directamente en un arreglo contiguo de float.
+
+    En un CSV se detectan y omiten la fila de encabezado y una primera columna de etiquetas
+    (como la columna 'Recurso' que exporta la página). El archivo se recorre una vez para
+    contar las filas y otra para llenar el arreglo de a chunk_rows filas, validando cada
+    bloque; así la memoria adicional no depende del tamaño del archivo.
+
+    Parámetros:
+    - source: Ruta, bytes u objeto tipo archivo (por ejemplo, el de st.file_uploader).
+    - delimiter: Separador de columnas del CSV.
+    - chunk_rows: Filas leídas y validadas por bloque.
+    - out: Ruta opcional de un archivo .npy donde guardar la matriz como arreglo mapeado en
+      memoria, para matrices que no caben en RAM.
+
+    Retorna:
+    - Un arreglo de NumPy (o np.memmap) de forma (recursos, tareas).
+    """
+    name = str(getattr(source, "name", source)) if not isinstance(source, (bytes, bytearray)) else ""
+    if name.endswith(".npy"):
+        if isinstance(source, (str, os.PathLike)):
+            matrix = np.load(source, mmap_mode="r")
+        else:
+            stream, _ = _open_binary(source)
+            matrix = np.load(stream)
+        if matrix.ndim != 2 or not np.issubdtype(matrix.dtype, np.number):
+            raise ValueError("El archivo .npy debe contener una matriz numérica bidimensional.")
+        for start in range(0, matrix.shape[0], chunk_rows):
+            _check_values(np.asarray(matrix[start:start + chunk_rows], dtype=float), start)
+        return matrix if matrix.dtype == float else matrix.astype(float)
+
+    stream, should_close = _open_binary(source)
+    try:
+        total_lines = _count_lines(stream)
+        text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        try:
+            lines = (line for line in text if line.strip())
+
+            first = next(lines, None)
+            if first is None:
+                raise ValueError("El archivo está vacío.")
+            fields = [field.strip() for field in first.split(delimiter)]
+            has_header = any(field and not _is_number(field) for field in fields[1:] or fields)
+            first_row = None
+            if has_header:
+                first_row = next(lines, None)
+                if first_row is None:
+                    raise ValueError("El archivo no tiene filas de datos.")
+                fields = [field.strip() for field in first_row.split(delimiter)]
+            skip = 0 if _is_number(fields[0]) else 1
+            num_columns = len(fields) - skip
+            num_rows = total_lines - has_header
+            if num_columns == 0:
+                raise ValueError("El archivo no tiene columnas de costos.")
+
+            if out is not None:
+                matrix = np.lib.format.open_memmap(out, mode="w+", dtype=float, shape=(num_rows, num_columns))
+            else:
+                matrix = np.empty((num_rows, num_columns))
+
+            rows = itertools.chain([first_row if has_header else first], lines)
+            filled = 0
+            while True:
+                chunk = list(itertools.islice(rows, chunk_rows))
+                if not chunk:
+                    break
+                try:
+                    block = np.loadtxt(chunk, delimiter=delimiter, usecols=range(skip, skip + num_columns), ndmin=2, dtype=float)
+                    if any(line.count(delimiter) != num_columns + skip - 1 for line in chunk):
+                        raise ValueError("número de columnas distinto")
+                except ValueError as e:
+                    raise ValueError(f"Filas {filled + 1}-{filled + len(chunk)}: la matriz debe ser rectangular y numérica ({e}).") from e
+                _check_values(block, filled)
+                matrix[filled:filled + len(block)] = block
+                filled += len(block)
+        finally:
+            text.detach()  # No cerrar el flujo del llamador
+    finally:
+        if should_close:
+            stream.close()
+
+    return matrix[:filled] if filled < matrix.shape[0] else matrix
+
+
+def load_activities(source, delimiter=",", separator=";"):
+    """
+    Lee las actividades de un proyecto desde un CSV, fila por fila y sin cargar el archivo
+    completo: identificador, duración y, opcionalmente, las predecesoras separadas por
+    separator (por ejemplo "A,3,B;C"). La fila de encabezado se detecta y se omite.
+
+    Parámetros:
+    - source: Ruta, bytes u objeto tipo archivo (por ejemplo, el de st.file_uploader).
+    - delimiter: Separador de columnas.
+    - separator: Separador de las predecesoras dentro de su columna.
+
+    Retorna:
+    - Una tupla (nombres, duraciones, origenes, destinos): la lista de identificadores, un
+      arreglo con las duraciones y las dependencias origen -> destino como arreglos de índices.
+    """
+    names, durations, predecessors, targets = [], [], [], []
+    stream, should_close = _open_binary(source)
+    try:
+        text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        try:
+            rows = (fields for fields in csv.reader(text, delimiter=delimiter, skipinitialspace=True) if any(fields))
+            first = next(rows, None)
+            if first is not None and (len(first) < 2 or _is_number(first[1])):
+                rows = itertools.chain([first], rows)  # Sin encabezado
+            for fields in rows:
+                if len(fields) < 2:
+                    raise ValueError(f"Actividad {len(names) + 1}: se esperaban al menos el identificador y la duración.")
+                names.append(fields[0].strip())
+                durations.append(fields[1])
+                if len(fields) > 2 and fields[2]:
+                    for name in fields[2].split(separator):
+                        name = name.strip()
+                        if name:
+                            predecessors.append(name)
+                            targets.append(len(names) - 1)
+        finally:
+            text.detach()  # No cerrar el flujo del llamador
+    finally:
+        if should_close:
+            stream.close()
+
+    if not names:
+        raise ValueError("El archivo no tiene actividades.")
+    index = {name: i for i, name in enumerate(names)}
+    if len(index) != len(names):
+        duplicate = next(name for i, name in enumerate(names) if index[name] != i)
+        raise ValueError(f"La actividad '{duplicate}' está repetida.")
+    sources = np.fromiter((index.get(name, -1) for name in predecessors), dtype=np.int64, count=len(predecessors))
+    targets = np.array(targets, dtype=np.int64)
+    if (sources < 0).any():
+        k = int(np.flatnonzero(sources < 0)[0])
+        raise ValueError(f"La actividad '{names[targets[k]]}' tiene una predecesora desconocida: '{predecessors[k]}'.")
+    try:
+        durations = np.array(durations, dtype=float)
+    except ValueError:
+        k = next(k for k, value in enumerate(durations) if not _is_number(value))
+        raise ValueError(f"Duración no válida en la actividad '{names[k]}': '{durations[k]}'.") from None
+    return names, durations, sources, targets
+
+
+def read_table(source):
+    """
+    Lee una tabla CSV o Parquet con pandas (requerido solo para esta función; Parquet
+    requiere además pyarrow o fastparquet).
+
+    Parámetros:
+    - source: Ruta u objeto tipo archivo; el formato se deduce de la extensión.
+
+    Retorna:
+    - Un DataFrame de pandas.
+    """
+    import pandas as pd
+
+    name = str(getattr(source, "name", source)).lower()
+    if name.endswith(".parquet"):
+        return pd.read_parquet(source)
+    return pd.read_csv(source, skipinitialspace=True)
@@ -0,0 +1,374 @@
+import io
+import os
+import re
+import subprocess
+import threading
+import time
+
+from pulp import PULP_CBC_CMD, LpMaximize, LpSolutionOptimal, PulpSolverError
+
+import mps
+
+# Mensajes del registro de CBC. Los valores están en el sentido de minimización interno de CBC
+_NUMBER = r"([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)"
+_INCUMBENT = re.compile(r"Integer solution of " + _NUMBER + " found")
+_BOUND = re.compile(r"best possible " + _NUMBER)
+_COMPLETED = re.compile(r"Search completed - best objective " + _NUMBER)
+# CBC se detiene antes de probar la optimalidad: por la brecha pedida o por un límite
+_STOPPED = re.compile(r"Exiting (?:as integer gap|on maximum)|Partial search")
+# Resumen final: el motivo de parada y la cota (ya en el sentido del problema)
+_REASON = re.compile(r"^Result - (.*?)\s*$")
+_SUMMARY_BOUND = re.compile(r"^(?:Lower|Upper) bound:\s+" + _NUMBER)
+_SECONDS = re.compile(r"\(([\d.]+) seconds\)")
+_LP_ITERATIONS = re.compile(r"Optimal objective .* - (\d+) iterations")
+_TOTAL_ITERATIONS = re.compile(r"Total iterations:\s+(\d+)")
+_NODES = re.compile(r"Enumerated nodes:\s+(\d+)")
+
+
+def relative_gap(objective, bound):
+    """Brecha relativa |objetivo - cota| / |objetivo| entre una solución y la mejor cota."""
+    if objective is None or bound is None:
+        return None
+    return abs(objective - bound) / max(abs(objective), 1e-10)
+
+
+class SolveCancelled(Exception):
+    """La resolución se detuvo con CancelToken.cancel()."""
+
+
+class CancelToken:
+    """
+    Permite detener desde otro hilo una resolución de CBC en curso: cancel() termina el
+    proceso de CBC, si ya empezó, o impide que empiece.
+    """
+
+    def __init__(self):
+        self.cancelled = False
+        self._process = None
+        self._lock = threading.Lock()
+
+    def cancel(self):
+        with self._lock:
+            self.cancelled = True
+            if self._process is not None and self._process.poll() is None:
+                self._process.kill()
+
+    def _attach(self, process):
+        with self._lock:
+            self._process = process
+            if self.cancelled:
+                process.kill()
+
+
+class Incumbent:
+    """Solución entera mejorada encontrada durante la búsqueda de CBC."""
+
+    def __init__(self, objective, bound, elapsed):
+        self.objective = objective
+        self.bound = bound
+        self.elapsed = elapsed
+
+    @property
+    def gap(self):
+        return relative_gap(self.objective, self.bound)
+
+    def __repr__(self):
+        return f"Incumbent(objective={self.objective}, bound={self.bound}, elapsed={self.elapsed:.2f})"
+
+
+class MipResult:
+    """
+    Resultado de una resolución con CBC con límites de tiempo y de brecha.
+
+    Atributos:
+    - status: Estado de PuLP del problema (1 si hay una solución, aunque no esté probada óptima).
+    - objective: Valor objetivo de la mejor solución encontrada (None si no hay).
+    - bound: Mejor cota conocida del valor óptimo.
+    - gap: Brecha relativa entre objective y bound.
+    - proven_optimal: True si CBC terminó la búsqueda; detenerse por la brecha pedida o por
+      un límite no prueba la optimalidad.
+    - incumbents: Lista de Incumbent en el orden en que se encontraron.
+    - elapsed: Segundos totales.
+    - write_time, solve_time, read_time: Segundos en escribir el modelo para CBC, en el
+      proceso de CBC y en leer la solución de vuelta a las variables.
+    - iterations: Iteraciones del simplex que informó CBC.
+    - nodes: Nodos del árbol de ramificación (None en los problemas continuos).
+    - x, duals, reduced_costs: Arreglos de la solución cuando se resolvió un CompactModel
+      con solve_model (None con solve, que la deja en las variables del LpProblem).
+    """
+
+    def __init__(self, status, objective, bound, proven_optimal, incumbents, elapsed,
+                 write_time=None, solve_time=None, read_time=None, iterations=None, nodes=None):
+        self.status = status
+        self.objective = objective
+        self.bound = bound
+        self.gap = relative_gap(objective, bound)
+        self.proven_optimal = proven_optimal
+        self.incumbents = incumbents
+        self.elapsed = elapsed
+        self.write_time = write_time
+        self.solve_time = solve_time
+        self.read_time = read_time
+        self.iterations = iterations
+        self.nodes = nodes
+        self.x = None
+        self.duals = None
+        self.reduced_costs = None
+
+
+def iter_solve(problem, time_limit=None, gap_rel=None, gap_abs=None, threads=None, warm_start=False, options=(), cancel=None):
+    """
+    Resuelve un LpProblem con CBC y produce cada solución incumbente mejorada a medida que
+    CBC la encuentra, leyendo su registro mientras se ejecuta.
+
+    Parámetros:
+    - problem: El LpProblem; al terminar recibe los valores de la mejor solución, como con
+      problem.solve().
+    - time_limit: Segundos máximos de búsqueda (tiempo real).
+    - gap_rel: Brecha relativa con la que la búsqueda se da por terminada (por ejemplo 0.01).
+    - gap_abs: Brecha absoluta con la que la búsqueda se da por terminada.
+    - threads: Hilos de CBC.
+    - warm_start: Parte de los valores actuales de las variables.
+    - options: Opciones adicionales de la línea de comandos de CBC, como en PULP_CBC_CMD.
+    - cancel: CancelToken opcional para detener CBC desde otro hilo; en ese caso se lanza
+      SolveCancelled.
+
+    Retorna:
+    - Un generador de Incumbent. Su valor de retorno (StopIteration.value) es el MipResult.
+      Cerrar el generador antes de tiempo detiene CBC.
+    """
+    if cancel is not None and cancel.cancelled:
+        raise SolveCancelled()
+    solver = PULP_CBC_CMD(timeLimit=time_limit, gapRel=gap_rel, gapAbs=gap_abs, threads=threads,
+                          warmStart=warm_start, timeMode="elapsed")
+    if not solver.available():
+        raise PulpSolverError(f"No se encontró el ejecutable de CBC: {solver.path}")
+
+    start = time.perf_counter()
+    sign = -1.0 if problem.sense == LpMaximize else 1.0
+    offset = problem.objective.constant if problem.objective is not None else 0.0
+    mps_path, solution_path, start_path = solver.create_tmp_files(problem.name, "mps", "sol", "mst")
+    variables, variable_names, constraint_names, _ = problem.writeMPS(mps_path, rename=1)
+    args = [solver.path, mps_path]
+    if problem.sense == LpMaximize:
+        args.append("-max")
+    if warm_start:
+        solver.writesol(start_path, problem, variables, variable_names, constraint_names)
+        args += ["-mips", start_path]
+    if time_limit is not None:
+        args += ["-sec", str(time_limit)]
+    for option in [*options, *solver.getOptions()]:
+        args += ["-" + option.split()[0], *option.split()[1:]]
+    args += ["-solve", "-printingOptions", "all", "-solution", solution_path]
+    write_time = time.perf_counter() - start
+
+    try:
+        search = yield from _search(args, sign, offset, start, solution_path, cancel)
+        read_start = time.perf_counter()
+        status, values, reduced_costs, shadow_prices, slacks, solution_status = solver.readsol_MPS(
+            solution_path, problem, variables, variable_names, constraint_names
+        )
+        problem.assignVarsVals(values)
+        problem.assignVarsDj(reduced_costs)
+        problem.assignConsPi(shadow_prices)
+        problem.assignConsSlack(slacks, activity=True)
+        problem.assignStatus(status, solution_status)
+        read_time = time.perf_counter() - read_start
+    finally:
+        solver.delete_tmp_files(mps_path, solution_path, start_path)
+
+    objective = problem.objective.value() if status == 1 else None
+    return _result(status, solution_status, objective, search, start, write_time, read_start, read_time)
+
+
+def iter_solve_model(model, time_limit=None, gap_rel=None, gap_abs=None, threads=None, warm_start=None, options=(), cancel=None):
+    """
+    Resuelve un CompactModel con CBC sin pasar por objetos de PuLP: el MPS se escribe
+    directamente desde los arreglos del modelo y la solución se lee de vuelta a arreglos.
+
+    Parámetros:
+    - model: El CompactModel.
+    - warm_start: Vector opcional de valores iniciales de las variables.
+    - time_limit, gap_rel, gap_abs, threads, options, cancel: Como en iter_solve.
+
+    Retorna:
+    - Un generador de Incumbent. Su valor de retorno es el MipResult, con la solución en
+      sus atributos x, duals y reduced_costs.
+    """
+    if cancel is not None and cancel.cancelled:
+        raise SolveCancelled()
+    solver = PULP_CBC_CMD(timeLimit=time_limit, gapRel=gap_rel, gapAbs=gap_abs, threads=threads, timeMode="elapsed")
+    if not solver.available():
+        raise PulpSolverError(f"No se encontró el ejecutable de CBC: {solver.path}")
+
+    start = time.perf_counter()
+    sign = 1.0 if model.minimize else -1.0
+    mps_path, solution_path, start_path = solver.create_tmp_files("Compact_Model", "mps", "sol", "mst")
+    try:
+        mps.write_mps(model, mps_path)
+        args = [solver.path, mps_path]
+        if not model.minimize:
+            args.append("-max")
+        if warm_start is not None:
+            mps.write_start(start_path, warm_start)
+            args += ["-mips", start_path]
+        if time_limit is not None:
+            args += ["-sec", str(time_limit)]
+        for option in [*options, *solver.getOptions()]:
+            args += ["-" + option.split()[0], *option.split()[1:]]
+        args += ["-solve", "-printingOptions", "all", "-solution", solution_path]
+        write_time = time.perf_counter() - start
+
+        search = yield from _search(args, sign, model.offset, start, solution_path, cancel)
+        read_start = time.perf_counter()
+        status, solution_status, x, _, duals, reduced_costs = mps.read_solution(
+            solution_path, model.num_constraints, model.num_variables
+        )
+        read_time = time.perf_counter() - read_start
+    finally:
+        solver.delete_tmp_files(mps_path, solution_path, start_path)
+
+    objective = float(model.c @ x) + model.offset if status == 1 else None
+    result = _result(status, solution_status, objective, search, start, write_time, read_start, read_time)
+    result.x, result.duals, result.reduced_costs = x, duals, reduced_costs
+    return result
+
+
+def _search(args, sign, offset, start, solution_path, cancel):
+    """
+    Ejecuta CBC y produce los Incumbent que informa su registro. Su valor de retorno es una
+    tupla (incumbentes, cota, búsqueda completa, detenida antes de tiempo, iteraciones,
+    nodos, inicio de la resolución).
+    """
+    incumbents = []
+    bound = None
+    completed = stopped = False
+    iterations, nodes = 0, None
+    solve_start = time.perf_counter()
+    process, output = _start(args)
+    if cancel is not None:
+        cancel._attach(process)
+    try:
+        for line in _lines(output):
+            found = _BOUND.search(line)
+            if found:
+                bound = sign * float(found.group(1)) + offset
+            if _COMPLETED.search(line):
+                completed = True
+            if _STOPPED.search(line):
+                stopped = True
+            found = _REASON.search(line)
+            if found:
+                reason = found.group(1)
+                stopped = stopped or not reason.startswith("Optimal solution found") or "gap tolerance" in reason
+            found = _SUMMARY_BOUND.search(line)
+            if found:
+                bound = float(found.group(1)) + offset
+            found = _INCUMBENT.search(line)
+            if found:
+                objective = sign * float(found.group(1)) + offset
+                seconds = _SECONDS.search(line)
+                elapsed = float(seconds.group(1)) if seconds else time.perf_counter() - start
+                incumbents.append(Incumbent(objective, bound, elapsed))
+                yield incumbents[-1]
+            found = _LP_ITERATIONS.search(line)
+            if found:
+                iterations += int(found.group(1))
+            found = _TOTAL_ITERATIONS.search(line)
+            if found:
+                iterations = int(found.group(1))
+            found = _NODES.search(line)
+            if found:
+                nodes = int(found.group(1))
+        if cancel is not None and cancel.cancelled:
+            raise SolveCancelled()
+        if process.wait() != 0 or not os.path.exists(solution_path):
+            raise PulpSolverError(f"CBC terminó con error (código {process.returncode}).")
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        output.close()
+    return incumbents, bound, completed, stopped, iterations, nodes, solve_start
+
+
+def _result(status, solution_status, objective, search, start, write_time, read_start, read_time):
+    incumbents, bound, completed, stopped, iterations, nodes, solve_start = search
+    # CBC marca la solución como óptima aunque se haya detenido por la brecha pedida
+    proven_optimal = status == 1 and not stopped and (solution_status == LpSolutionOptimal or completed)
+    if proven_optimal and (bound is None or completed):
+        bound = objective
+    return MipResult(status, objective, bound, proven_optimal, incumbents, time.perf_counter() - start,
+                     write_time, read_start - solve_start, read_time, iterations, nodes)
+
+
+def _start(args):
+    """
+    Inicia CBC y retorna (proceso, salida). En POSIX la salida pasa por una pseudoterminal
+    para que CBC la escriba línea por línea; con una tubería la acumularía en su búfer
+    hasta terminar.
+    """
+    if os.name == "posix":
+        import pty
+
+        master, slave = pty.openpty()
+        try:
+            process = subprocess.Popen(args, stdout=slave, stderr=slave, stdin=subprocess.DEVNULL)
+        except BaseException:
+            os.close(master)
+            raise
+        finally:
+            os.close(slave)
+        return process, io.open(master, "r", encoding="utf-8", errors="replace")
+    process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+                               text=True, errors="replace")
+    return process, process.stdout
+
+
+def _lines(output):
+    # Al cerrarse la pseudoterminal, Linux señala el fin de la salida con EIO
+    try:
+        yield from output
+    except OSError:
+        return
+
+
+def solve(problem, callback=None, **options):
+    """
+    Resuelve un LpProblem con CBC llamando a callback(incumbent) con cada solución mejorada.
+
+    Parámetros:
+    - problem: El LpProblem.
+    - callback: Función opcional que recibe cada Incumbent.
+    - options: time_limit, gap_rel, gap_abs, threads, warm_start, options y cancel (ver iter_solve).
+
+    Retorna:
+    - Un MipResult.
+    """
+    return _drive(iter_solve(problem, **options), callback)
+
+
+def _drive(events, callback):
+    while True:
+        try:
+            incumbent = next(events)
+        except StopIteration as stop:
+            return stop.value
+        if callback is not None:
+            callback(incumbent)
+
+
+def solve_model(model, callback=None, **options):
+    """
+    Resuelve un CompactModel con CBC llamando a callback(incumbent) con cada solución mejorada.
+
+    Parámetros:
+    - model: El CompactModel.
+    - callback: Función opcional que recibe cada Incumbent.
+    - options: time_limit, gap_rel, gap_abs, threads, warm_start, options y cancel (ver
+      iter_solve_model).
+
+    Retorna:
+    - Un MipResult con la solución en x, duals y reduced_costs.
+    """
+    return _drive(iter_solve_model(model, **options), callback)
@@ -0,0 +1,187 @@
+import io
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from compact import CompactModel
+
+# Formato: MAGIC | largo del encabezado (uint64) | encabezado JSON | arreglos alineados.
+# El encabezado guarda los metadatos y, por cada arreglo, su tipo, forma y posición en el
+# archivo; así cada arreglo es una vista del archivo mapeado en memoria, sin copias.
+MAGIC = b"LPMODEL1"
+ALIGNMENT = 64
+
+_MODEL_ARRAYS = ("c", "indptr", "indices", "data", "row_lower", "row_upper", "lower", "upper")
+
+
+class ModelFile:
+    """
+    Contenido de un archivo de modelo compilado.
+
+    Atributos:
+    - model: El CompactModel.
+    - metadata: Diccionario con los datos propios de cada solver (opciones, nombre, ...).
+    - solution: None o {"status", "objective", "x", "duals", "reduced_costs"}.
+    - basis: None o la lista de estados ('B', 'L', 'U') de las variables seguidas de las filas.
+    - arrays: Arreglos adicionales guardados con el modelo.
+    """
+
+    def __init__(self, model, metadata=None, solution=None, basis=None, arrays=None):
+        self.model = model
+        self.metadata = metadata or {}
+        self.solution = solution
+        self.basis = basis
+        self.arrays = arrays or {}
+
+
+def _encode_names(names):
+    return np.frombuffer("\n".join(names).encode("utf-8"), dtype=np.uint8)
+
+
+def _decode_names(blob, count):
+    return bytes(blob).decode("utf-8").split("\n") if count else []
+
+
+def _data_start(header_length):
+    """Posición del primer arreglo: justo después del encabezado, alineada."""
+    return -(-(len(MAGIC) + 8 + header_length) // ALIGNMENT) * ALIGNMENT
+
+
+def _write(stream, model_file):
+    model = model_file.model
+    arrays = {name: getattr(model, name) for name in _MODEL_ARRAYS}
+    arrays["integer"] = model.integer.astype(np.uint8)
+    arrays["var_names"] = _encode_names(model.var_names)
+    arrays["row_names"] = _encode_names(model.row_names)
+    header = {
+        "version": 1,
+        "minimize": bool(model.minimize),
+        "offset": model.offset,
+        "num_variables": model.num_variables,
+        "num_constraints": model.num_constraints,
+        "metadata": model_file.metadata,
+        "solution": None,
+        "extra": sorted(model_file.arrays),
+        "arrays": {},
+    }
+    solution = model_file.solution
+    if solution is not None:
+        header["solution"] = {"status": solution["status"], "objective": solution["objective"]}
+        for key in ("x", "duals", "reduced_costs"):
+            if solution.get(key) is not None:
+                arrays[f"solution_{key}"] = solution[key]
+    if model_file.basis is not None:
+        arrays["basis"] = np.frombuffer("".join(model_file.basis).encode("ascii"), dtype=np.uint8)
+    for name, array in model_file.arrays.items():
+        arrays[f"extra_{name}"] = array
+
+    # Las posiciones se guardan relativas al inicio de los datos
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    position = 0
+    for name, array in arrays.items():
+        header["arrays"][name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": position}
+        position += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+    encoded = json.dumps(header).encode("utf-8")
+    start = _data_start(len(encoded))
+
+    stream.write(MAGIC)
+    stream.write(np.uint64(len(encoded)).tobytes())
+    stream.write(encoded)
+    written = len(MAGIC) + 8 + len(encoded)
+    for name, array in arrays.items():
+        target = start + header["arrays"][name]["offset"]
+        stream.write(b"\0" * (target - written))
+        stream.write(array.tobytes())
+        written = target + array.nbytes
+
+
+def _read(buffer):
+    """Reconstruye un ModelFile a partir de un arreglo de bytes (np.uint8), sin copiar los arreglos."""
+    if bytes(buffer[:len(MAGIC)]) != MAGIC:
+        raise ValueError("El archivo no es un modelo compilado.")
+    length = int(buffer[len(MAGIC):len(MAGIC) + 8].view(np.uint64)[0])
+    header = json.loads(bytes(buffer[len(MAGIC) + 8:len(MAGIC) + 8 + length]).decode("utf-8"))
+    if header.get("version") != 1:
+        raise ValueError(f"Versión de modelo compilado no soportada: {header.get('version')}")
+
+    arrays = {}
+    for name, spec in header["arrays"].items():
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"], dtype=np.int64))
+        start = _data_start(length) + spec["offset"]
+        arrays[name] = buffer[start:start + count * dtype.itemsize].view(dtype).reshape(spec["shape"])
+
+    model = CompactModel(
+        *(arrays[name] for name in _MODEL_ARRAYS),
+        var_names=_decode_names(arrays["var_names"], header["num_variables"]),
+        row_names=_decode_names(arrays["row_names"], header["num_constraints"]),
+        minimize=header["minimize"],
+        offset=header["offset"],
+        integer=arrays["integer"].astype(bool),
+    )
+    solution = None
+    if header["solution"] is not None:
+        solution = dict(header["solution"])
+        for key in ("x", "duals", "reduced_costs"):
+            solution[key] = arrays.get(f"solution_{key}")
+    basis = list(bytes(arrays["basis"]).decode("ascii")) if "basis" in arrays else None
+    extra = {name: arrays[f"extra_{name}"] for name in header["extra"]}
+    return ModelFile(model, header["metadata"], solution, basis, extra)
+
+
+def save(path, model_file):
+    """
+    Guarda un ModelFile en un archivo binario. La escritura es atómica: el archivo se
+    escribe aparte y se renombra al terminar.
+
+    Parámetros:
+    - path: Ruta del archivo o un objeto tipo archivo binario.
+    - model_file: El ModelFile a guardar.
+    """
+    if not isinstance(path, (str, os.PathLike)):
+        _write(path, model_file)
+        return
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            _write(f, model_file)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load(path, mmap=True):
+    """
+    Carga un archivo de modelo compilado.
+
+    Parámetros:
+    - path: Ruta del archivo o un objeto tipo archivo binario.
+    - mmap: Si es True (y path es una ruta), el archivo se mapea en memoria: los arreglos
+      son vistas de solo lectura que el sistema operativo carga a medida que se usan.
+
+    Retorna:
+    - Un ModelFile.
+    """
+    if isinstance(path, (str, os.PathLike)):
+        if mmap:
+            return _read(np.memmap(path, dtype=np.uint8, mode="r"))
+        with open(path, "rb") as f:
+            return _read(np.frombuffer(f.read(), dtype=np.uint8))
+    return _read(np.frombuffer(path.read(), dtype=np.uint8))
+
+
+def dumps(model_file):
+    """Serializa un ModelFile a bytes (por ejemplo, para una caché o una cola de trabajos)."""
+    buffer = io.BytesIO()
+    _write(buffer, model_file)
+    return buffer.getvalue()
+
+
+def loads(data):
+    """Reconstruye un ModelFile desde bytes, sin copiar los arreglos."""
+    return _read(np.frombuffer(data, dtype=np.uint8))
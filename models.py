@@ -1,14 +1,239 @@
-from pulp import LpProblem, LpVariable, LpMinimize, lpSum
+from pulp import LpProblem, LpVariable, LpMinimize, LpAffineExpression, LpConstraint, LpConstraintEQ, LpConstraintGE, LpConstraintLE, lpSum
+import hashlib
+import os
+import tempfile
+import time
 import numpy as np
-import matplotlib.pyplot as plt
 import utils
+import assignment
+import simplex
+import batch
+import sensitivity
+import mip
+import loaders
+import stats
+import modelfile
+from compact import CompactModel
+from presolve import Presolve
+
+# Operadores aceptados para las restricciones y su sentido en PuLP
+SENSES = {"<=": LpConstraintLE, "≤": LpConstraintLE, "=": LpConstraintEQ, "==": LpConstraintEQ, ">=": LpConstraintGE, "≥": LpConstraintGE}
+
+
+class ConstraintBatchError(ValueError):
+    """Errores de validación de un lote de restricciones; errors tiene un mensaje por fila."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        super().__init__(f"{len(self.errors)} restricciones con errores:\n" + "\n".join(self.errors))
+
+
+class NoSolutionError(ValueError):
+    """El solver terminó sin una solución factible; status es el estado de PuLP."""
+
+    def __init__(self, status):
+        self.status = status
+        super().__init__(f"Problema no factible o sin solución. Estado: {status}")
+
+
 class LinearProgrammingSolver:
-    def __init__(self, problem_name="LP_Problem", minimize=True):
+    def __init__(self, problem_name="LP_Problem", minimize=True, symbolic_fallback=False, backend="cbc"):
+        if backend not in ("cbc", "simplex"):
+            raise ValueError("backend debe ser 'cbc' o 'simplex'.")
         self.problem = LpProblem(problem_name, LpMinimize if minimize else -1)
         self.minimize = minimize
+        self.symbolic_fallback = symbolic_fallback
+        self.backend = backend
         self.variables = {}
         self.cons_coeffs = []
-        self.i = 0
+        self.i = 0  # Identificador de la próxima restricción; nunca se reutiliza
+        self.basis = None
+        self.warm_started = False
+        self.presolve_report = None
+        self.mip_result = None
+        # Segundos en interpretar y construir el modelo desde la última resolución (ver stats.RunStats)
+        self.model_times = {"parse": 0.0, "build": 0.0}
+        self.last_run_stats = None
+
+    @classmethod
+    def from_matrices(cls, c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+                      minimize=True, var_names=None, problem_name="LP_Problem", cat="Continuous", backend="cbc"):
+        """
+        Construye el modelo directamente desde su forma matricial, sin pasar por cadenas:
+
+            min/max  c·x
+            s.a.     A_ub·x <= b_ub
+                     A_eq·x == b_eq
+                     bounds
+
+        Parámetros:
+        - c: Vector de coeficientes de la función objetivo.
+        - A_ub, b_ub: Matriz (densa o dispersa de SciPy) y lado derecho de las restricciones '<='.
+        - A_eq, b_eq: Matriz (densa o dispersa de SciPy) y lado derecho de las restricciones '='.
+        - bounds: Límites de las variables, como en scipy.optimize.linprog (por defecto (0, None)).
+        - minimize: True para minimizar, False para maximizar.
+        - var_names: Nombres de las variables (por defecto x_0, x_1, ...).
+        - problem_name: Nombre del problema.
+        - cat: Tipo de las variables (por defecto 'Continuous').
+        - backend: 'cbc' o 'simplex' (ver solve).
+
+        Retorna:
+        - Una instancia de LinearProgrammingSolver lista para resolver.
+        """
+        c = np.asarray(c, dtype=float).ravel()
+        names = list(var_names) if var_names is not None else [f"x_{j}" for j in range(c.size)]
+        if len(names) != c.size:
+            raise ValueError("var_names debe tener un nombre por cada coeficiente de c.")
+        lower, upper = utils.expand_bounds(bounds, c.size)
+
+        solver = cls(problem_name, minimize, backend=backend)
+        with stats.timed(solver.model_times, "build"):
+            for name, low, up in zip(names, lower, upper):
+                solver.variables[name] = LpVariable(name, lowBound=low, upBound=up, cat=cat)
+        solver.objective = None
+        solver.objective_coefficients = dict(zip(names, c.tolist()))
+        solver.objective_constant = 0.0
+        solver.set_objective()
+        solver.add_matrix_constraints(A_ub, b_ub, "<=")
+        solver.add_matrix_constraints(A_eq, b_eq, "=")
+        return solver
+
+    @classmethod
+    def from_compact_model(cls, model, problem_name="LP_Problem", backend="cbc"):
+        """
+        Construye el solver desde un CompactModel, conservando los nombres de variables y
+        restricciones y sin analizar cadenas.
+
+        Las filas con dos límites finitos distintos no tienen equivalente en una sola
+        restricción de PuLP y se rechazan con ValueError.
+        """
+        ranged = np.isfinite(model.row_lower) & np.isfinite(model.row_upper) & (model.row_lower != model.row_upper)
+        if ranged.any():
+            raise ValueError(f"La restricción {model.row_names[int(np.argmax(ranged))]} tiene dos límites distintos.")
+
+        solver = cls(problem_name, model.minimize, backend=backend)
+        with stats.timed(solver.model_times, "build"):
+            for name, low, up, integer in zip(model.var_names, model.lower.tolist(), model.upper.tolist(), model.integer.tolist()):
+                solver.variables[name] = LpVariable(
+                    name, None if low == -np.inf else low, None if up == np.inf else up, "Integer" if integer else "Continuous"
+                )
+        solver.objective = None
+        solver.objective_coefficients = dict(zip(model.var_names, model.c.tolist()))
+        solver.objective_constant = model.offset
+        solver.set_objective()
+
+        equality = model.row_lower == model.row_upper
+        has_lower = np.isfinite(model.row_lower)
+        senses = np.where(equality, LpConstraintEQ, np.where(has_lower, LpConstraintGE, LpConstraintLE)).tolist()
+        rhs = np.where(has_lower, model.row_lower, model.row_upper)
+        solver._add_rows(model.indptr, model.indices, model.data, senses, rhs, model.row_names)
+        return solver
+
+    def save(self, path, include_solution=True):
+        """
+        Guarda el modelo compilado en el formato binario de modelfile: la matriz en CSR, los
+        límites, el sentido, los nombres y, si include_solution es True, la última solución
+        óptima y su base. Se vuelve a abrir con LinearProgrammingSolver.load sin repetir el
+        análisis de las cadenas.
+
+        Parámetros:
+        - path: Ruta del archivo o un objeto tipo archivo binario.
+        - include_solution: Incluir la solución y la base de la última resolución.
+        """
+        model = self.to_compact_model()
+        metadata = {
+            "solver": "LinearProgrammingSolver", "problem_name": self.problem.name, "backend": self.backend,
+            "objective": getattr(self, "objective", None), "next_id": self.i,
+        }
+        solution = basis = None
+        if include_solution and self.problem.status == 1:
+            variables = [self.variables[name] for name in model.var_names]
+            constraints = [self.problem.constraints[name] for name in model.row_names]
+            solution = {
+                "status": self.problem.status,
+                "objective": self.problem.objective.value(),
+                "x": np.array([var.varValue or 0.0 for var in variables]),
+                "duals": np.array([c.pi for c in constraints], dtype=float) if all(c.pi is not None for c in constraints) else None,
+                "reduced_costs": np.array([var.dj for var in variables], dtype=float) if all(var.dj is not None for var in variables) else None,
+            }
+            if self.basis is not None:
+                basis = self._basis_array(model)
+        modelfile.save(path, modelfile.ModelFile(model, metadata, solution, basis))
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Carga un modelo guardado con save (o cualquier CompactModel guardado con modelfile).
+
+        Parámetros:
+        - path: Ruta del archivo o un objeto tipo archivo binario.
+        - mmap: Mapear el archivo en memoria en lugar de leerlo completo.
+
+        Retorna:
+        - Un LinearProgrammingSolver con la solución y la base guardadas, si las hay.
+        """
+        stored = modelfile.load(path, mmap)
+        metadata = stored.metadata
+        if metadata.get("solver", "LinearProgrammingSolver") != "LinearProgrammingSolver":
+            raise ValueError(f"El archivo contiene un modelo de {metadata['solver']}.")
+        model = stored.model
+        solver = cls.from_compact_model(model, metadata.get("problem_name", "LP_Problem"), metadata.get("backend", "cbc"))
+        solver.objective = metadata.get("objective")
+        solver.i = max(solver.i, metadata.get("next_id", 0))
+        if stored.solution is not None:
+            solution = stored.solution
+            solver._store_solution(model, solution["status"], solution["x"], solution["duals"], solution["reduced_costs"])
+        if stored.basis is not None:
+            n = model.num_variables
+            solver.basis = {
+                "variables": dict(zip(model.var_names, stored.basis[:n])),
+                "constraints": dict(zip(model.row_names, stored.basis[n:])),
+            }
+        return solver
+
+    def add_matrix_constraints(self, A, b, operator):
+        """
+        Agrega un bloque de restricciones A·x (operador) b, con las columnas de A en el orden
+        de self.variables. El costo es lineal en el número de elementos no nulos de A.
+        """
+        if A is None:
+            return
+        if operator not in SENSES:
+            raise ValueError(f"Operador no válido: {operator}")
+        with stats.timed(self.model_times, "parse"):
+            indptr, indices, data = utils.to_csr_arrays(A, len(self.variables))
+            rhs = np.asarray(b, dtype=float).ravel()
+        if rhs.size != len(indptr) - 1:
+            raise ValueError(f"El lado derecho tiene {rhs.size} elementos, pero la matriz tiene {len(indptr) - 1} filas.")
+        self._add_rows(indptr, indices, data, [SENSES[operator]] * rhs.size, rhs)
+
+    def _add_rows(self, indptr, indices, data, senses, rhs, row_names=None):
+        """
+        Inserta filas ya validadas en formato CSR (columnas en el orden de self.variables).
+        Con row_names se conservan esos nombres (por ejemplo, al cargar un modelo guardado)
+        y self.i avanza más allá de los identificadores usados.
+
+        Retorna:
+        - La lista con los nombres de las restricciones creadas.
+        """
+        with stats.timed(self.model_times, "build"):
+            variables = list(self.variables.values())
+            indptr, indices, data = np.asarray(indptr).tolist(), np.asarray(indices).tolist(), np.asarray(data).tolist()
+            names = []
+            for row, (sense, value) in enumerate(zip(senses, np.asarray(rhs, dtype=float).tolist())):
+                start, end = indptr[row], indptr[row + 1]
+                expression = LpAffineExpression([(variables[j], coeff) for j, coeff in zip(indices[start:end], data[start:end])])
+                if row_names is None:
+                    name = f"Restriccion_{self.i}"
+                    self.i += 1
+                else:
+                    name = row_names[row]
+                    prefix, _, number = name.rpartition("_")
+                    if prefix == "Restriccion" and number.isdigit():
+                        self.i = max(self.i, int(number) + 1)
+                self.problem.addConstraint(LpConstraint(expression, sense, name, value), name)
+                names.append(name)
+        return names
 
     def add_function(self, objective_function, low_bound=None, up_bound=None, cat="Continuous"):
         """
@@ -23,130 +248,1041 @@ class LinearProgrammingSolver:
         Retorna:
         - Un diccionario con las variables creadas.
         """
-        # Extraer variables de la función objetivo
+        # Extraer variables y coeficientes de la función objetivo en una sola pasada
         self.objective = objective_function
-        self.objective_function = utils.format_to_sympy(objective_function)
-        variables = utils.extract_variables(self.objective_function)
+        with stats.timed(self.model_times, "parse"):
+            self.objective_coefficients, self.objective_constant = utils.parse_linear_expression(
+                objective_function, self.symbolic_fallback
+            )
         
-        # Crear las variables de decisión
-        for var in variables:
-            var_name = str(var)  # Convertir el identificador simbólico en un nombre
-            self.variables[var_name] = LpVariable(var_name, lowBound=low_bound, upBound=up_bound, cat=cat)
+        # Crear las variables de decisión en el orden en que aparecen
+        with stats.timed(self.model_times, "build"):
+            for var_name in self.objective_coefficients:
+                self.variables[var_name] = LpVariable(var_name, lowBound=low_bound, upBound=up_bound, cat=cat)
         
         return self.variables
 
     def set_objective(self):
         """Define la función objetivo."""
-        self.of_coefficients = utils.extract_coefficients(self.objective_function, self.variables.keys())
-        # Asociar cada coeficiente a su respectiva variable
-        objective_terms = [
-            coeff * self.variables[var_name] 
-            for var_name, coeff in zip(self.variables.keys(), self.of_coefficients)
-        ]
-        self.problem += lpSum(objective_terms), "Objective"
+        with stats.timed(self.model_times, "build"):
+            self.of_coefficients = [self.objective_coefficients.get(var_name, 0.0) for var_name in self.variables]
+            # Asociar cada coeficiente a su respectiva variable
+            objective_terms = [
+                (self.variables[var_name], coeff)
+                for var_name, coeff in self.objective_coefficients.items()
+            ]
+            self.problem += LpAffineExpression(objective_terms, constant=self.objective_constant), "Objective"
+
+    def _parse_row(self, lhs, operator, rhs):
+        """
+        Valida una restricción lhs (operador) rhs y la lleva a la forma coeficientes·x (sentido) valor.
+        lhs puede ser una cadena o un diccionario {variable: coeficiente}; rhs, un número o
+        una expresión lineal en texto.
+        """
+        if operator not in SENSES:
+            raise ValueError(f"Operador no válido: {operator}")
+        if isinstance(lhs, dict):
+            coefficients, constant = dict(lhs), 0.0
+        else:
+            coefficients, constant = utils.parse_linear_expression(str(lhs), self.symbolic_fallback)
+        if isinstance(rhs, str):
+            rhs_coefficients, rhs_constant = utils.parse_linear_expression(rhs, self.symbolic_fallback)
+            for var_name, coeff in rhs_coefficients.items():
+                coefficients[var_name] = coefficients.get(var_name, 0.0) - coeff
+        else:
+            rhs_constant = float(rhs)
+        unknown = [var_name for var_name in coefficients if var_name not in self.variables]
+        if unknown:
+            raise ValueError(f"Variables no definidas en la función objetivo: {', '.join(unknown)}")
+        return coefficients, SENSES[operator], rhs_constant - constant
 
     def add_constraint(self, lhs, operator, rhs):
-        lhs = utils.format_to_sympy(lhs)
-        variables = utils.extract_variables(lhs)
-        coeffs = utils.extract_coefficients(lhs, variables)
-        name = f"Restriccion_{self.i}"
-        self.i += 1
-        lhs_rest = sum([self.variables[str(var)] * coeff for var, coeff in zip(variables, coeffs)])
-        rhs_rest = float(rhs)
-        if operator == "<=":
-            self.problem += lhs_rest <= rhs_rest, name
-        elif operator == "=":
-            self.problem += lhs_rest == rhs_rest, name
-        elif operator == ">=":
-            self.problem += lhs_rest >= rhs_rest, name
-
-    def remove_constraint(self, constraint_name):
-        """Elimina una restricción del problema."""
-        del self.problem.constraints[constraint_name]
-
-        # Renombrar las restricciones restantes
-        for idx, (name, constraint) in enumerate(self.problem.constraints.items()):
-            new_name = f"Restriccion_{idx+1}"
-            self.problem.constraints[name].name = new_name
-            self.i = idx + 1
-
-    def solve(self):
-        """Resuelve el problema y retorna el estado."""
-        self.problem.solve()
+        """
+        Agrega una restricción lhs (operador) rhs, con operador '<=', '=', '==' o '>='.
+
+        Retorna:
+        - El nombre de la restricción creada.
+        """
+        with stats.timed(self.model_times, "parse"):
+            coefficients, sense, value = self._parse_row(lhs, operator, rhs)
+            position = {var_name: j for j, var_name in enumerate(self.variables)}
+            indices = [position[var_name] for var_name in coefficients]
+        return self._add_rows([0, len(indices)], indices, list(coefficients.values()), [sense], [value])[0]
+
+    def add_constraints_bulk(self, source):
+        """
+        Agrega un lote de restricciones en una sola operación. Primero se interpreta y valida
+        todo el lote; si hay errores no se agrega ninguna restricción y se lanza un
+        ConstraintBatchError con todos ellos.
+
+        Parámetros:
+        - source: Una de las siguientes fuentes:
+          - Un bloque de texto con una restricción por línea, como '2x + y <= 10'. Las líneas
+            vacías y el texto después de '#' se ignoran.
+          - Una ruta u objeto tipo archivo CSV o Parquet, o un DataFrame de pandas, con una
+            columna por variable (coeficientes; las celdas vacías valen 0) y las columnas
+            'operator' y 'rhs'.
+          - Un iterable de tuplas (lhs, operador, rhs), con lhs en texto o como diccionario
+            {variable: coeficiente}.
+
+        Retorna:
+        - La lista con los nombres de las restricciones creadas.
+        """
+        with stats.timed(self.model_times, "parse"):
+            rows = self._parse_constraints(source)
+        return self._add_rows(*rows)
+
+    def _parse_constraints(self, source):
+        """Interpreta y valida un lote de add_constraints_bulk y lo retorna en CSR."""
+        if hasattr(source, "columns"):
+            return self._parse_constraint_table(source)
+        is_path = isinstance(source, (str, os.PathLike)) and str(source).lower().endswith((".csv", ".parquet"))
+        if is_path or hasattr(source, "read"):
+            return self._parse_constraint_table(loaders.read_table(source))
+
+        if isinstance(source, str):
+            rows = ((f"Línea {number}", line.split("#")[0].strip()) for number, line in enumerate(source.splitlines(), start=1))
+            rows = ((label, line) for label, line in rows if line)
+        else:
+            rows = ((f"Restricción {number}", row) for number, row in enumerate(source, start=1))
+
+        position = {var_name: j for j, var_name in enumerate(self.variables)}
+        indptr, indices, data, senses, rhs, errors = [0], [], [], [], [], []
+        for label, row in rows:
+            try:
+                if not isinstance(row, str) and len(row) != 3:
+                    raise ValueError("Se esperaba una tupla (lhs, operador, rhs).")
+                lhs, operator, value = utils.split_constraint(row) if isinstance(row, str) else row
+                coefficients, sense, constant = self._parse_row(lhs, operator, value)
+            except ValueError as e:
+                errors.append(f"{label}: {e}")
+                continue
+            indices.extend(position[var_name] for var_name in coefficients)
+            data.extend(coefficients.values())
+            indptr.append(len(indices))
+            senses.append(sense)
+            rhs.append(constant)
+
+        if errors:
+            raise ConstraintBatchError(errors)
+        return indptr, indices, data, senses, rhs
+
+    def _parse_constraint_table(self, table):
+        """Valida con operaciones vectorizadas una tabla de coeficientes y la retorna en CSR."""
+        import pandas as pd
+
+        errors = []
+        missing = [column for column in ("operator", "rhs") if column not in table.columns]
+        unknown = [column for column in table.columns if column not in self.variables and column not in ("operator", "rhs")]
+        if missing:
+            errors.append(f"Faltan las columnas: {', '.join(missing)}")
+        if unknown:
+            errors.append(f"Variables no definidas en la función objetivo: {', '.join(map(str, unknown))}")
+        if errors:
+            raise ConstraintBatchError(errors)
+
+        var_columns = [column for column in table.columns if column in self.variables]
+        raw = table[var_columns]
+        coefficients = raw.apply(pd.to_numeric, errors="coerce")
+        operators = table["operator"].astype(str).str.strip()
+        rhs = pd.to_numeric(table["rhs"], errors="coerce")
+
+        bad_cells = (coefficients.isna() & raw.notna()).to_numpy()
+        for row, col in np.argwhere(bad_cells):
+            errors.append(f"Fila {row + 1}: coeficiente no numérico en la columna {var_columns[col]}")
+        for row in np.flatnonzero(~operators.isin(list(SENSES)).to_numpy()):
+            errors.append(f"Fila {row + 1}: operador no válido: {operators.iloc[row]}")
+        for row in np.flatnonzero(rhs.isna().to_numpy()):
+            errors.append(f"Fila {row + 1}: lado derecho no numérico")
+        if errors:
+            raise ConstraintBatchError(errors)
+
+        # Reordenar las columnas de la tabla al orden de self.variables
+        position = {var_name: j for j, var_name in enumerate(self.variables)}
+        indptr, indices, data = utils.to_csr_arrays(coefficients.fillna(0.0).to_numpy(dtype=float))
+        indices = np.array([position[column] for column in var_columns], dtype=np.int64)[indices]
+        senses = [SENSES[operator] for operator in operators.tolist()]
+        return indptr, indices, data, senses, rhs.to_numpy(dtype=float)
+
+    def _constraint_key(self, constraint):
+        """Nombre de una restricción dada por nombre o por su identificador numérico."""
+        return f"Restriccion_{constraint}" if isinstance(constraint, (int, np.integer)) else constraint
+
+    def get_constraint(self, constraint):
+        """Retorna la restricción de PuLP con el nombre o identificador dado (O(1))."""
+        name = self._constraint_key(constraint)
+        if name not in self.problem.constraints:
+            raise ValueError(f"No existe la restricción {name}.")
+        return self.problem.constraints[name]
+
+    def remove_constraint(self, constraint):
+        """
+        Elimina una restricción por nombre ('Restriccion_3') o identificador (3) en O(1).
+
+        Los nombres Restriccion_{i} son estables: nunca se renombran ni se reutilizan, de modo
+        que la base guardada sigue identificando a las restricciones restantes y la siguiente
+        resolución puede partir de ella.
+        """
+        self.remove_constraints([constraint])
+
+    def remove_constraints(self, constraints):
+        """
+        Elimina varias restricciones (nombres o identificadores). Si alguna no existe no se
+        elimina ninguna.
+        """
+        names = list(dict.fromkeys(self._constraint_key(constraint) for constraint in constraints))
+        missing = [name for name in names if name not in self.problem.constraints]
+        if missing:
+            raise ValueError(f"No existen las restricciones: {', '.join(map(str, missing))}")
+        for name in names:
+            del self.problem.constraints[name]
+            if self.basis is not None:
+                self.basis["constraints"].pop(name, None)
+
+    def solve(self, warm_start=True, presolve=False, time_limit=None, gap_rel=None, gap_abs=None, threads=None, callback=None, cancel=None):
+        """
+        Resuelve el problema y retorna el estado.
+
+        Después de cada resolución se guarda la base óptima. Si warm_start es True y hay una
+        base previa, CBC reoptimiza con el simplex dual a partir de ella en lugar de empezar
+        de cero; esto aplica cuando se agregan o eliminan restricciones o cambian los límites
+        o el lado derecho. self.warm_started indica si se usó la base anterior.
+
+        Con backend='simplex' el problema se resuelve en memoria con el simplex revisado de
+        simplex.py, sin archivos temporales ni procesos externos; los problemas enteros
+        requieren backend='cbc'.
+
+        Con presolve=True el modelo se reduce antes de resolverlo (filas duplicadas, filas
+        de una sola variable, variables fijas, restricciones redundantes; ver
+        presolve.Presolve) y la solución y los duales se llevan de vuelta a las variables y
+        restricciones originales. Lo eliminado queda en self.presolve_report. Estas
+        resoluciones no guardan base para el arranque en caliente.
+
+        En los problemas enteros, time_limit (segundos), gap_rel y gap_abs detienen la
+        búsqueda de CBC antes de probar la optimalidad y threads fija sus hilos; el estado es
+        1 si hay una solución entera, aunque no esté probada óptima. callback(incumbent)
+        recibe cada solución mejorada mientras CBC busca (ver mip.Incumbent), y la cota y la
+        brecha finales quedan en self.mip_result.
+
+        cancel es un mip.CancelToken opcional para detener CBC desde otro hilo (se lanza
+        mip.SolveCancelled); el simplex en memoria no se puede cancelar.
+
+        Los tiempos de cada fase, el tamaño del modelo y las iteraciones quedan en
+        self.last_run_stats (ver stats.RunStats) y se publican en los hooks de stats.add_hook.
+        """
+        mip_options = {"time_limit": time_limit, "gap_rel": gap_rel, "gap_abs": gap_abs, "threads": threads, "cancel": cancel}
+        run = stats.RunStats("lp", self.backend, presolve, *stats.take_model_times(self.model_times))
+        self.mip_result = None
+        status = stats.FAILED
+        try:
+            if presolve:
+                result = self._solve_presolved(run, callback, mip_options)
+            else:
+                self.presolve_report = None
+                if self.backend == "simplex":
+                    result = self._solve_in_process(run, warm_start)
+                else:
+                    result = self._solve_cbc(run, warm_start, callback, mip_options)
+            status = self.problem.status
+        except mip.SolveCancelled:
+            status = stats.CANCELLED
+            raise
+        finally:
+            # Una resolución cancelada o fallida también reemplaza las métricas anteriores
+            self.last_run_stats = run.finish(status)
+        return result
+
+    def _solve_cbc(self, run, warm_start, callback, mip_options):
+        constraints = self.problem.constraints
+        run.set_size(len(self.variables), len(constraints), sum(len(constraint) for constraint in constraints.values()))
+        self.warm_started = False
+        if self.problem.isMIP():
+            self.basis = None
+            self.mip_result = mip.solve(self.problem, callback, **mip_options)
+            run.add_mip_result(self.mip_result)
+            return self.problem.status, self.problem.objective.value()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with run.timed("io_time"):
+                constraint_names, variable_names, _ = self.problem.normalisedNames()
+                basis_in = os.path.join(tmp_dir, "warm.bas")
+                basis_out = os.path.join(tmp_dir, "optimal.bas")
+                if warm_start and self.basis is not None:
+                    self.warm_started = utils.write_mps_basis(basis_in, self.basis, variable_names, constraint_names)
+            # CBC procesa las opciones en orden: la base se exporta después de optimizar
+            options = [f"basisI {basis_in}", "dualSimplex"] if self.warm_started else ["initialSolve"]
+            options.append(f"basisO {basis_out}")
+            run.add_mip_result(mip.solve(self.problem, options=options, cancel=mip_options["cancel"]))
+            with run.timed("readback_time"):
+                self.basis = utils.read_mps_basis(basis_out, variable_names, constraint_names) if os.path.exists(basis_out) else None
+        return self.problem.status, self.problem.objective.value()
+
+    def to_compact_model(self):
+        """Retorna el modelo como CompactModel, con las columnas en el orden de self.variables."""
+        return CompactModel.from_pulp(self.problem, self.variables.values())
+
+    def canonical_key(self):
+        """
+        Clave canónica del modelo: un hash que solo depende de la función objetivo, el
+        sentido, las restricciones (sin importar su orden ni nombre) y los límites y tipos
+        de las variables. Dos modelos equivalentes construidos de formas distintas comparten
+        la misma clave.
+        """
+        def terms(expression):
+            return sorted((var.name, float(coeff)) for var, coeff in expression.items() if coeff != 0)
+
+        def bound(value):
+            return None if value is None else float(value)
+
+        objective = self.problem.objective
+        constraints = sorted(
+            (terms(constraint), constraint.sense, float(-constraint.constant))
+            for constraint in self.problem.constraints.values()
+        )
+        canonical = (
+            self.problem.sense,
+            terms(objective) if objective is not None else [],
+            float(objective.constant) if objective is not None else 0.0,
+            constraints,
+            sorted((var.name, bound(var.lowBound), bound(var.upBound), var.cat) for var in self.variables.values()),
+        )
+        return hashlib.sha256(repr(canonical).encode()).hexdigest()
+
+    def _solve_in_process(self, run, warm_start):
+        with run.timed("build_time"):
+            model = self.to_compact_model()
+            basis = self._basis_array(model) if warm_start and self.basis is not None else None
+        run.set_size(model.num_variables, model.num_constraints, model.nnz)
+        with run.timed("solve_time"):
+            result = simplex.solve_model(model, basis)
+        run.iterations = result.iterations
+
+        with run.timed("readback_time"):
+            self._store_solution(model, result.status, result.x, result.duals, result.reduced_costs)
+            n = model.num_variables
+            self.basis = {
+                "variables": dict(zip(model.var_names, result.basis[:n].tolist())),
+                "constraints": dict(zip(model.row_names, result.basis[n:].tolist())),
+            }
+        self.warm_started = result.warm_started
         return self.problem.status, self.problem.objective.value()
 
+    def _solve_presolved(self, run, callback, mip_options):
+        with run.timed("build_time"):
+            model = self.to_compact_model()
+        run.set_size(model.num_variables, model.num_constraints, model.nnz)
+        reduction = Presolve(model)
+        run.presolve_time = reduction.report["time"]
+        self.presolve_report = reduction.report
+        self.basis = None
+        self.warm_started = False
+        if reduction.status is not None:
+            self.problem.assignStatus(reduction.status)
+            return self.problem.status, None
+
+        reduced = reduction.reduced
+        if reduced.num_variables == 0:
+            # El presolve fijó todas las variables
+            status, x, duals = 1, np.zeros(0), np.zeros(0)
+        elif self.backend == "simplex":
+            with run.timed("solve_time"):
+                result = simplex.solve_model(reduced)
+            run.iterations = result.iterations
+            status, x, duals = result.status, result.x, result.duals
+        else:
+            # El modelo reducido va a CBC desde sus arreglos, sin crear un LpProblem
+            result = mip.solve_model(reduced, callback, **mip_options)
+            run.add_mip_result(result)
+            self.mip_result = result if reduced.is_mip() else None
+            status, x, duals = result.status, result.x, result.duals
+        if status != 1:
+            self.problem.assignStatus(status)
+            return self.problem.status, None
+
+        with run.timed("readback_time"):
+            x, duals, reduced_costs = reduction.postsolve(x, None if model.is_mip() else duals)
+            self._store_solution(model, status, x, duals, reduced_costs)
+        return self.problem.status, self.problem.objective.value()
+
+    def _store_solution(self, model, status, x, duals, reduced_costs):
+        """Vuelca una solución en arreglos sobre los objetos de PuLP, como lo haría CBC."""
+        variables = self.problem.variablesDict()
+        reduced_costs = reduced_costs.tolist() if reduced_costs is not None else [None] * model.num_variables
+        for name, value, reduced_cost in zip(model.var_names, x.tolist(), reduced_costs):
+            variables[name].varValue = value
+            variables[name].dj = reduced_cost
+        duals = duals.tolist() if duals is not None else [None] * model.num_constraints
+        for name, dual, activity in zip(model.row_names, duals, model.activity(x).tolist()):
+            constraint = self.problem.constraints[name]
+            constraint.pi = dual
+            constraint.slack = -constraint.constant - activity
+        self.problem.assignStatus(status)
+
+    def _basis_array(self, model):
+        """Ordena la base guardada según las columnas y filas de un CompactModel."""
+        basis = [self.basis["variables"].get(name, simplex.AT_LOWER) for name in model.var_names]
+        basis += [self.basis["constraints"].get(name, simplex.BASIC) for name in model.row_names]
+        return basis
+
+    def sensitivity_analysis(self):
+        """
+        Análisis de sensibilidad de la última resolución, calculado a partir de la base
+        óptima guardada y sin volver a resolver el problema.
+
+        Retorna:
+        - Un diccionario con dos entradas:
+          - "constraints": {Restriccion_i: {"activity", "rhs", "slack", "shadow_price", "rhs_range"}}
+          - "variables": {variable: {"value", "cost", "reduced_cost", "cost_range"}}
+          rhs_range y cost_range son los intervalos (inferior, superior) en los que la base
+          actual sigue siendo óptima al variar un solo coeficiente.
+        """
+        if self.problem.status != 1 or self.basis is None:
+            raise ValueError("El análisis de sensibilidad requiere una solución óptima de un problema continuo.")
+        model = self.to_compact_model()
+        return sensitivity.analyze(model, self._basis_array(model))
+
+    def solve_batch(self, scenarios, workers=None, chunk_size=None, callback=None):
+        """
+        Resuelve variantes del modelo actual en un pool de procesos con el simplex en memoria.
+
+        Parámetros:
+        - scenarios: Lista de diccionarios con los cambios de cada escenario: 'c' (vector o
+          {variable: costo}), 'rhs' (vector o {restricción: valor}) y/o 'bounds'
+          ({variable: (inferior, superior)}).
+        - workers: Número de procesos (por defecto, uno por núcleo).
+        - chunk_size: Escenarios por tarea enviada al pool.
+        - callback: Función opcional callback(índice, estado, objetivo, solución) que se
+          llama apenas termina cada escenario.
+
+        Retorna:
+        - Un batch.BatchResult con los estados, objetivos y soluciones en arreglos. Un
+          escenario no válido queda con estado 0 y su mensaje en errors.
+        """
+        model = self.to_compact_model()
+        if model.is_mip():
+            raise ValueError("solve_batch solo resuelve problemas continuos.")
+        return batch.solve_batch(batch.solve_lp_scenario, model, scenarios, model.var_names, workers, chunk_size, callback)
+
     def get_solution(self):
         """Retorna los valores de las variables de decisión."""
         return {name: var.varValue for name, var in self.variables.items()}
     
-    def plot_feasible_region(self, resolution=300):
+    def _planar_constraints(self):
+        """Rectas (a, b, c) y operadores de las restricciones y de los límites de x e y."""
+        if len(self.variables) > 2:
+            raise ValueError("No se puede graficar un problema con más de dos variables.")
+        x, y = self.variables.get("x"), self.variables.get("y")
+        operators = {LpConstraintLE: "<=", LpConstraintEQ: "=", LpConstraintGE: ">="}
+        constraints = list(self.problem.constraints.values())
+        # Las rectas salen directamente de los coeficientes ya conocidos de cada restricción
+        lines = [(constraint.get(x, 0.0), constraint.get(y, 0.0), -constraint.constant) for constraint in constraints]
+        senses = [operators[constraint.sense] for constraint in constraints]
+        for var, direction in ((x, (1.0, 0.0)), (y, (0.0, 1.0))):
+            if var is not None and var.lowBound is not None:
+                lines.append((*direction, var.lowBound))
+                senses.append(">=")
+            if var is not None and var.upBound is not None:
+                lines.append((*direction, var.upBound))
+                senses.append("<=")
+        return constraints, lines, senses
+
+    def feasible_polygon(self):
         """
-        Grafica la región factible y las restricciones para un problema de programación lineal.
-        
-        Parámetros:
-        - constraints: Lista de restricciones, cada una en forma de .
-        - resolution: Resolución de la cuadrícula para calcular la región factible.
+        Calcula exactamente la región factible de un problema con variables x e y.
+
+        Retorna:
+        - Un arreglo (vértices, 2) con los vértices del polígono en orden antihorario; vacío
+          si el problema no es factible. Las regiones no acotadas se recortan con una caja
+          mayor que la escala del problema.
         """
-        constraints = list(self.problem.constraints.values())
+        _, lines, senses = self._planar_constraints()
+        return utils.feasible_region(lines, senses)[0]
 
-        lambda_constraints = [utils.str_to_lambda(str(constraint)) for constraint in constraints]
-        str_constraints = [str(constraint) for constraint in constraints]
+    def plot_feasible_region(self):
+        """
+        Grafica la región factible exacta, las restricciones y el óptimo de un problema con
+        variables x e y. Los ejes se ajustan a los vértices de la región y al óptimo.
+        """
+        constraints, lines, senses = self._planar_constraints()
         optimal_values = self.get_solution()
-        if len(optimal_values.values()) > 2:
-            raise ValueError("No se puede graficar un problema con más de dos variables.")
-        fig = utils.plot_feasible_region_and_constraints(lambda_constraints, str_constraints, optimal_values)
-        return fig
+        optimum = (optimal_values.get("x"), optimal_values.get("y"))
+        region = utils.feasible_region(lines, senses, [optimum])
+        count = len(constraints)
+        return utils.plot_feasible_region_and_constraints(
+            [str(constraint) for constraint in constraints], {"x": optimum[0], "y": optimum[1]},
+            lines=lines[:count], senses=senses[:count], region=region,
+        )
 
 
 class ResourceAssignmentSolver:
-    def __init__(self, cost_matrix, max_resources_per_task=1, max_tasks_per_resource=1, allow_unassigned_tasks=False, variable_type="Binary"):
-        if any(len(row) != len(cost_matrix[0]) for row in cost_matrix):
-            raise ValueError("cost_matrix debe ser una matriz rectangular.")
-        
-        self.cost_matrix = cost_matrix
+    def __init__(self, cost_matrix, max_resources_per_task=1, max_tasks_per_resource=1, allow_unassigned_tasks=False, variable_type="Binary", method="auto", allowed=None, backend="cbc"):
+        """
+        Parámetros:
+        - cost_matrix: Matriz de costos (recursos x tareas). Puede ser una lista de listas, un
+          arreglo de NumPy o una matriz dispersa de SciPy; en este último caso solo los
+          elementos almacenados son pares permitidos. Los costos infinitos son pares prohibidos.
+        - max_resources_per_task: Recursos que debe recibir cada tarea.
+        - max_tasks_per_resource: Máximo de tareas por recurso.
+        - allow_unassigned_tasks: Agrega la restricción de a lo sumo un recurso por tarea.
+        - variable_type: Tipo de las variables de asignación (por defecto 'Binary').
+        - method: 'auto', 'combinatorial' o 'mip'.
+        - allowed: Máscara booleana opcional (recursos x tareas) con los pares permitidos.
+        - backend: Solver para el camino no combinatorio: 'cbc' o 'simplex' (en memoria, solo
+          para variables binarias o continuas).
+        """
+        start = time.perf_counter()
+        if hasattr(cost_matrix, "tocoo"):
+            coo = cost_matrix.tocoo()
+            rows, cols, costs = coo.row, coo.col, coo.data
+            num_resources, num_tasks = coo.shape
+        else:
+            dense = loaders.validate_cost_matrix(cost_matrix)
+            mask = ~np.isinf(dense)
+            if allowed is not None:
+                mask &= np.asarray(allowed, dtype=bool)
+            rows, cols = np.nonzero(mask)
+            costs = dense[rows, cols]
+            num_resources, num_tasks = dense.shape
+
+        parse_time = time.perf_counter() - start
+
+        self._setup(rows, cols, costs, num_resources, num_tasks, max_resources_per_task,
+                    max_tasks_per_resource, allow_unassigned_tasks, variable_type, method, backend)
+        self.model_times["parse"] += parse_time
+
+    def _setup(self, rows, cols, costs, num_resources, num_tasks, max_resources_per_task=1,
+               max_tasks_per_resource=1, allow_unassigned_tasks=False, variable_type="Binary", method="auto", backend="cbc"):
+        if method not in ("auto", "combinatorial", "mip"):
+            raise ValueError("method debe ser 'auto', 'combinatorial' o 'mip'.")
+        if backend not in ("cbc", "simplex"):
+            raise ValueError("backend debe ser 'cbc' o 'simplex'.")
+
         self.max_resources_per_task = max_resources_per_task
         self.max_tasks_per_resource = max_tasks_per_resource
         self.allow_unassigned_tasks = allow_unassigned_tasks
         self.variable_type = variable_type
+        self.method = method
+        self.backend = backend
 
         self.problem = LpProblem("Resource_Assignment", LpMinimize)
-        self.num_tasks = len(cost_matrix[0])
-        self.num_resources = len(cost_matrix)
-        self.x = [[LpVariable(f"x_{i}_{j}", cat=self.variable_type) for j in range(self.num_tasks)] for i in range(self.num_resources)]
-    
-    def add_resource(self, default_cost=1e6):
-        self.cost_matrix.append([default_cost] * self.num_tasks)
-        self.x.append([LpVariable(f"x_{self.num_resources}_{j}", cat=self.variable_type) for j in range(self.num_tasks)])
+        self.num_tasks = num_tasks
+        self.num_resources = num_resources
+        # Segundos en interpretar y construir el modelo desde la última resolución (ver stats.RunStats)
+        self.model_times = {"parse": 0.0, "build": 0.0}
+        self.last_run_stats = None
+        with stats.timed(self.model_times, "parse"):
+            self._set_pairs(rows, cols, costs)
+        # Las variables de PuLP solo se crean si el problema se resuelve como MIP
+        self.x = None
+        self.model_built = False
+        self.solution = None
+        self.status = None
+        self.objective_value = None
+        self.presolve_report = None
+        self.mip_result = None
+
+    @classmethod
+    def from_edges(cls, edges, num_resources=None, num_tasks=None, **kwargs):
+        """
+        Crea el solver a partir de una lista de pares permitidos (recurso, tarea, costo).
+        Los demás argumentos se pasan al constructor.
+        """
+        edges = list(edges)
+        rows, cols, costs = zip(*edges) if edges else ((), (), ())
+        return cls.from_coo(rows, cols, costs, num_resources, num_tasks, **kwargs)
+
+    @classmethod
+    def from_coo(cls, rows, cols, costs, num_resources=None, num_tasks=None, **kwargs):
+        """
+        Crea el solver a partir de un triple COO (filas, columnas, costos) con los pares
+        permitidos. Solo se crean variables y términos de restricción para esos pares.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        costs = np.asarray(costs, dtype=float)
+        num_resources = int(rows.max()) + 1 if num_resources is None else num_resources
+        num_tasks = int(cols.max()) + 1 if num_tasks is None else num_tasks
+
+        solver = cls.__new__(cls)
+        solver._setup(rows, cols, costs, num_resources, num_tasks, **kwargs)
+        return solver
+
+    def _set_pairs(self, rows, cols, costs):
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        costs = np.asarray(costs, dtype=float)
+        if not (rows.shape == cols.shape == costs.shape):
+            raise ValueError("Las filas, columnas y costos deben tener la misma longitud.")
+        if rows.size and (rows.min() < 0 or rows.max() >= self.num_resources or cols.min() < 0 or cols.max() >= self.num_tasks):
+            raise ValueError("Hay pares (recurso, tarea) fuera de las dimensiones del problema.")
+        keys = rows * self.num_tasks + cols
+        # Los pares de una matriz densa ya vienen ordenados: basta una pasada para ver que no se repiten
+        if keys.size > 1 and not np.all(keys[1:] > keys[:-1]):
+            keys = np.sort(keys)
+        if keys.size > 1 and np.any(keys[1:] == keys[:-1]):
+            raise ValueError("Hay pares (recurso, tarea) duplicados.")
+        self.rows, self.cols, self.costs = rows, cols, costs
+
+    @property
+    def num_pairs(self):
+        """Número de pares (recurso, tarea) permitidos."""
+        return self.rows.size
+
+    @property
+    def cost_matrix(self):
+        """Matriz densa de costos, con infinito en los pares prohibidos."""
+        dense = np.full((self.num_resources, self.num_tasks), np.inf)
+        dense[self.rows, self.cols] = self.costs
+        return dense.tolist()
+
+    def _new_pairs(self, costs, default_cost, size):
+        """Interpreta los costos de una fila o columna nueva como índices y valores."""
+        if costs is None:
+            if default_cost is None:
+                return np.zeros(0, dtype=np.int64), np.zeros(0)
+            return np.arange(size), np.full(size, float(default_cost))
+        if isinstance(costs, dict):
+            return np.fromiter(costs.keys(), dtype=np.int64, count=len(costs)), np.fromiter(costs.values(), dtype=float, count=len(costs))
+        values = np.array([np.inf if c is None else c for c in costs], dtype=float)
+        if values.size != size:
+            raise ValueError(f"Se esperaban {size} costos, pero se recibieron {values.size}.")
+        indices = np.flatnonzero(~np.isinf(values))
+        return indices, values[indices]
+
+    def _append_pairs(self, rows, cols, costs):
+        start = self.rows.size
+        self.rows = np.concatenate([self.rows, rows])
+        self.cols = np.concatenate([self.cols, cols])
+        self.costs = np.concatenate([self.costs, costs])
+        if self.x is not None:
+            for i, j, cost in zip(self.rows[start:].tolist(), self.cols[start:].tolist(), self.costs[start:].tolist()):
+                self._add_pair_variable(i, j, cost)
+
+    def _add_pair_variable(self, i, j, cost):
+        """
+        Crea la variable de un par nuevo. Si el modelo ya está construido, solo se agregan
+        su término del objetivo y sus términos en las restricciones de la tarea y del recurso.
+        """
+        var = self.x[(i, j)] = LpVariable(f"x_{i}_{j}", cat=self.variable_type)
+        if self.model_built:
+            self.problem.objective.addterm(var, cost)
+            for name in (f"Tarea_{j}_asignada", f"Tarea_{j}_opcional", f"Recurso_{i}_limite_tareas"):
+                if name in self.problem.constraints:
+                    self.problem.constraints[name].addInPlace(var)
+        return var
+
+    def set_cost(self, resource, task, cost):
+        """
+        Cambia el costo de un par (recurso, tarea). Un costo None o infinito prohíbe el par.
+        Si el modelo ya está construido, solo se modifica el término afectado.
+        """
+        cost = np.inf if cost is None else float(cost)
+        position = np.flatnonzero((self.rows == resource) & (self.cols == task))
+        if position.size == 0:
+            if not np.isinf(cost):
+                self._append_pairs(np.array([resource]), np.array([task]), np.array([cost]))
+            return
+        self.costs[position[0]] = cost
+
+        if self.x is None:
+            return
+        var = self.x.get((resource, task))
+        if var is None:
+            var = self._add_pair_variable(resource, task, 0.0)
+        # Los pares prohibidos conservan su variable, fijada en cero
+        var.upBound = 0 if np.isinf(cost) else (1 if self.variable_type == "Binary" else None)
+        if self.model_built:
+            self.problem.objective[var] = 0.0 if np.isinf(cost) else cost
+
+    def add_resource(self, costs=None, default_cost=1e6):
+        """
+        Agrega un recurso. costs puede ser una fila completa de costos (None o infinito para
+        pares prohibidos) o un diccionario {tarea: costo} con solo los pares permitidos. Si no
+        se indica, el recurso puede atender todas las tareas con costo default_cost.
+        """
+        tasks, values = self._new_pairs(costs, default_cost, self.num_tasks)
+        if tasks.size and (tasks.min() < 0 or tasks.max() >= self.num_tasks):
+            raise ValueError("Hay tareas fuera de las dimensiones del problema.")
         self.num_resources += 1
+        if self.model_built:
+            self._add_resource_constraint(self.num_resources - 1, [])
+        self._append_pairs(np.full(tasks.size, self.num_resources - 1), tasks, values)
     
-    def add_task(self, default_cost=1e6):
-        for row in self.cost_matrix:
-            row.append(default_cost)
-        for i in range(self.num_resources):
-            self.x[i].append(LpVariable(f"x_{i}_{self.num_tasks}", cat=self.variable_type))
+    def add_task(self, costs=None, default_cost=1e6):
+        """
+        Agrega una tarea. costs puede ser una columna completa de costos (None o infinito
+        para pares prohibidos) o un diccionario {recurso: costo} con solo los pares
+        permitidos. Si no se indica, todos los recursos pueden atenderla con costo default_cost.
+        """
+        resources, values = self._new_pairs(costs, default_cost, self.num_resources)
+        if resources.size and (resources.min() < 0 or resources.max() >= self.num_resources):
+            raise ValueError("Hay recursos fuera de las dimensiones del problema.")
         self.num_tasks += 1
+        if self.model_built:
+            self._add_task_constraints(self.num_tasks - 1, [])
+        self._append_pairs(resources, np.full(resources.size, self.num_tasks - 1), values)
+
+    def _build_variables(self):
+        if self.x is None:
+            allowed = ~np.isinf(self.costs)
+            self.x = {(i, j): LpVariable(f"x_{i}_{j}", cat=self.variable_type) for i, j in zip(self.rows[allowed].tolist(), self.cols[allowed].tolist())}
     
     def set_objective(self):
-        self.problem += lpSum(self.cost_matrix[i][j] * self.x[i][j] for i in range(self.num_resources) for j in range(self.num_tasks)), "Costo_Total"
+        self._build_variables()
+        terms = [(self.x[(i, j)], cost) for i, j, cost in zip(self.rows.tolist(), self.cols.tolist(), self.costs.tolist()) if (i, j) in self.x]
+        self.problem += LpAffineExpression(terms), "Costo_Total"
+
+    def _add_task_constraints(self, j, variables):
+        self.problem += lpSum(variables) == self.max_resources_per_task, f"Tarea_{j}_asignada"
+        if self.allow_unassigned_tasks:
+            self.problem += lpSum(variables) <= 1, f"Tarea_{j}_opcional"
+
+    def _add_resource_constraint(self, i, variables):
+        self.problem += lpSum(variables) <= self.max_tasks_per_resource, f"Recurso_{i}_limite_tareas"
     
     def add_constraints(self):
+        self._build_variables()
+        by_task = [[] for _ in range(self.num_tasks)]
+        by_resource = [[] for _ in range(self.num_resources)]
+        for (i, j), var in self.x.items():
+            by_task[j].append(var)
+            by_resource[i].append(var)
+
         for j in range(self.num_tasks):
-            self.problem += lpSum(self.x[i][j] for i in range(self.num_resources)) == self.max_resources_per_task, f"Tarea_{j}_asignada"
+            self._add_task_constraints(j, by_task[j])
         for i in range(self.num_resources):
-            self.problem += lpSum(self.x[i][j] for j in range(self.num_tasks)) <= self.max_tasks_per_resource, f"Recurso_{i}_limite_tareas"
+            self._add_resource_constraint(i, by_resource[i])
+
+    def build_model(self):
+        """
+        Construye el modelo de PuLP una sola vez. Después, add_resource, add_task y set_cost
+        modifican solo los términos y restricciones afectados.
+        """
+        if not self.model_built:
+            self.set_objective()
+            self.add_constraints()
+            self.model_built = True
+
+    def save(self, path, include_solution=True):
+        """
+        Guarda el problema compilado en el formato binario de modelfile: los pares (recurso,
+        tarea, costo), las opciones, el modelo lineal en CSR (útil como intercambio para
+        lotes y otros solvers) y, si include_solution es True, la última asignación.
+        Se vuelve a abrir con ResourceAssignmentSolver.load.
+        """
+        metadata = {
+            "solver": "ResourceAssignmentSolver",
+            "num_resources": self.num_resources, "num_tasks": self.num_tasks,
+            "max_resources_per_task": self.max_resources_per_task,
+            "max_tasks_per_resource": self.max_tasks_per_resource,
+            "allow_unassigned_tasks": self.allow_unassigned_tasks,
+            "variable_type": self.variable_type, "method": self.method, "backend": self.backend,
+        }
+        arrays = {"rows": self.rows, "cols": self.cols, "costs": self.costs}
+        if include_solution and self.solution is not None and self.status == 1:
+            metadata["status"] = self.status
+            metadata["objective_value"] = self.objective_value
+            arrays.update(result_rows=self.solution.rows, result_cols=self.solution.cols, result_values=self.solution.values)
+        modelfile.save(path, modelfile.ModelFile(self.to_compact_model(), metadata, arrays=arrays))
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Carga un problema guardado con save.
+
+        Parámetros:
+        - path: Ruta del archivo o un objeto tipo archivo binario.
+        - mmap: Mapear el archivo en memoria en lugar de leerlo completo.
+
+        Retorna:
+        - Un ResourceAssignmentSolver con la última asignación guardada, si la hay.
+        """
+        stored = modelfile.load(path, mmap)
+        metadata, arrays = stored.metadata, stored.arrays
+        if metadata.get("solver") != "ResourceAssignmentSolver":
+            raise ValueError("El archivo no contiene un problema de asignación.")
+        options = {key: metadata[key] for key in (
+            "max_resources_per_task", "max_tasks_per_resource", "allow_unassigned_tasks", "variable_type", "method", "backend",
+        )}
+        # Copias en memoria: set_cost, add_resource y add_task modifican los pares
+        solver = cls.from_coo(np.array(arrays["rows"]), np.array(arrays["cols"]), np.array(arrays["costs"]), metadata["num_resources"], metadata["num_tasks"], **options)
+        if "result_rows" in arrays:
+            solver.status = metadata["status"]
+            solver.objective_value = metadata["objective_value"]
+            solver.solution = assignment.AssignmentResult(
+                arrays["result_rows"], arrays["result_cols"], arrays["result_values"],
+                solver.objective_value, solver.num_resources, solver.num_tasks,
+            )
+        return solver
+
+    def canonical_key(self):
+        """
+        Clave canónica del problema: un hash de los pares permitidos con sus costos (sin
+        importar su orden) y de las opciones del modelo.
+        """
+        order = np.lexsort((self.cols, self.rows))
+        digest = hashlib.sha256()
+        for array, dtype in ((self.rows, np.int64), (self.cols, np.int64), (self.costs, float)):
+            digest.update(np.ascontiguousarray(array[order], dtype=dtype).tobytes())
+        digest.update(repr((
+            self.num_resources, self.num_tasks, self.max_resources_per_task, self.max_tasks_per_resource,
+            self.allow_unassigned_tasks, self.variable_type, self.method, self.backend,
+        )).encode())
+        return digest.hexdigest()
+
+    def uses_combinatorial_solver(self):
+        """
+        Indica si el problema se resuelve con un algoritmo combinatorio en memoria.
+        Con variables binarias la matriz de restricciones es totalmente unimodular, por lo
+        que el algoritmo húngaro o el flujo de costo mínimo dan el mismo óptimo que el MIP.
+        """
+        if self.method == "mip":
+            return False
+        if self.variable_type != "Binary":
+            if self.method == "combinatorial":
+                raise ValueError("El método combinatorio requiere variables binarias.")
+            return False
+        return True
+
+    def to_compact_model(self):
+        """
+        Construye el modelo directamente desde los pares permitidos como CompactModel, sin
+        crear objetos de PuLP. Las variables binarias se relajan a [0, 1], lo que es exacto
+        por la unimodularidad total de la matriz de restricciones; las enteras se marcan
+        como tales.
+        """
+        allowed = ~np.isinf(self.costs)
+        rows, cols, costs = self.rows[allowed], self.cols[allowed], self.costs[allowed]
+        variables = np.arange(rows.size)
+
+        # Filas: tareas asignadas, límite por recurso y, opcionalmente, tareas opcionales
+        entry_rows = [cols, self.num_tasks + rows]
+        row_lower = [np.full(self.num_tasks, float(self.max_resources_per_task)), np.full(self.num_resources, -np.inf)]
+        row_upper = [np.full(self.num_tasks, float(self.max_resources_per_task)), np.full(self.num_resources, float(self.max_tasks_per_resource))]
+        row_names = [f"Tarea_{j}_asignada" for j in range(self.num_tasks)] + [f"Recurso_{i}_limite_tareas" for i in range(self.num_resources)]
         if self.allow_unassigned_tasks:
-            for j in range(self.num_tasks):
-                self.problem += lpSum(self.x[i][j] for i in range(self.num_resources)) <= 1, f"Tarea_{j}_opcional"
-
-    def solve(self):
-        self.set_objective()
-        self.add_constraints()
-        self.problem.solve()
-        if self.problem.status != 1:
-            raise Exception(f"Problema no factible o sin solución. Estado: {self.problem.status}")
-        return self.problem.status, self.problem.objective.value()
+            entry_rows.append(self.num_tasks + self.num_resources + cols)
+            row_lower.append(np.full(self.num_tasks, -np.inf))
+            row_upper.append(np.ones(self.num_tasks))
+            row_names += [f"Tarea_{j}_opcional" for j in range(self.num_tasks)]
+
+        entry_rows = np.concatenate(entry_rows)
+        entry_cols = np.tile(variables, len(row_lower))
+        order = np.argsort(entry_rows, kind="stable")
+        num_rows = len(row_names)
+        indptr = np.zeros(num_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(entry_rows, minlength=num_rows), out=indptr[1:])
+
+        binary = self.variable_type == "Binary"
+        return CompactModel(
+            costs, indptr, entry_cols[order], np.ones(order.size),
+            np.concatenate(row_lower), np.concatenate(row_upper),
+            lower=np.zeros(rows.size) if binary else np.full(rows.size, -np.inf),
+            upper=np.ones(rows.size) if binary else np.full(rows.size, np.inf),
+            var_names=[f"x_{i}_{j}" for i, j in zip(rows.tolist(), cols.tolist())],
+            row_names=row_names,
+            integer=np.full(rows.size, self.variable_type == "Integer"),
+        )
+
+    def solve(self, presolve=False, time_limit=None, gap_rel=None, gap_abs=None, threads=None, callback=None, cancel=None):
+        """
+        Resuelve el problema y retorna (estado, valor objetivo).
+
+        Parámetros:
+        - presolve: En el camino no combinatorio, reduce el modelo antes de resolverlo (ver
+          presolve.Presolve); lo eliminado queda en self.presolve_report.
+        - time_limit, gap_rel, gap_abs, threads: Detienen la búsqueda de CBC al agotar el
+          tiempo (segundos) o alcanzar la brecha relativa o absoluta, y fijan sus hilos. Se
+          retorna la mejor solución encontrada; su cota y su brecha quedan en self.mip_result.
+        - callback: Función que recibe cada solución mejorada (mip.Incumbent) mientras CBC busca.
+        - cancel: mip.CancelToken opcional para detener CBC desde otro hilo.
+
+        Lanza NoSolutionError si no se encontró ninguna solución factible y mip.SolveCancelled
+        si se canceló. Los tiempos de cada fase y el tamaño del modelo quedan en
+        self.last_run_stats (ver stats.RunStats).
+        """
+        mip_options = {"time_limit": time_limit, "gap_rel": gap_rel, "gap_abs": gap_abs, "threads": threads, "cancel": cancel}
+        self.presolve_report = None
+        self.mip_result = None
+        combinatorial = self.uses_combinatorial_solver()
+        run = stats.RunStats("assignment", "combinatorial" if combinatorial else self.backend, presolve and not combinatorial,
+                             *stats.take_model_times(self.model_times))
+        allowed = int(np.count_nonzero(~np.isinf(self.costs)))
+        optional = self.num_tasks if self.allow_unassigned_tasks else 0
+        run.set_size(allowed, self.num_tasks + self.num_resources + optional, (3 if optional else 2) * allowed)
+        status = stats.FAILED
+        try:
+            if combinatorial:
+                with run.timed("build_time"):
+                    cost = np.full((self.num_resources, self.num_tasks), np.inf)
+                    cost[self.rows, self.cols] = self.costs
+                with run.timed("solve_time"):
+                    self.status, self.objective_value, rows, cols = assignment.solve_assignment(
+                        cost,
+                        self.max_resources_per_task,
+                        self.max_tasks_per_resource,
+                        self.allow_unassigned_tasks,
+                    )
+                with run.timed("readback_time"):
+                    self.solution = assignment.AssignmentResult(rows, cols, 1.0, self.objective_value, self.num_resources, self.num_tasks)
+            else:
+                self._solve_compact(run, presolve, callback, mip_options)
+            status = self.status
+        except mip.SolveCancelled:
+            status = stats.CANCELLED
+            raise
+        finally:
+            # Una resolución cancelada o fallida también reemplaza las métricas anteriores
+            self.last_run_stats = run.finish(status)
+        if self.status != 1:
+            raise NoSolutionError(self.status)
+        return self.status, self.objective_value
     
+    def _solve_compact(self, run, presolve, callback, mip_options):
+        """
+        Resuelve desde el CompactModel, con el simplex en memoria o con CBC. CBC recibe el
+        MPS escrito directamente desde los arreglos (ver mps.write_mps), así que los objetos
+        de PuLP solo se crean si se piden con build_model.
+        """
+        with run.timed("build_time"):
+            model = self.to_compact_model()
+            warm_start = None
+            if not presolve and self.backend == "cbc":
+                # Sin presolve se resuelve el MIP binario, como en el modelo de PuLP
+                model.integer |= self.variable_type == "Binary"
+                # Con una solución previa, CBC parte de la asignación anterior
+                if self.solution is not None and self.status == 1:
+                    warm_start = self._previous_assignment()
+        if presolve:
+            reduction = Presolve(model)
+            run.presolve_time = reduction.report["time"]
+            self.presolve_report = reduction.report
+            reduced = reduction.reduced
+        else:
+            reduction, reduced = None, model
+
+        if reduction is not None and reduction.status is not None:
+            status, x = reduction.status, None
+        elif reduced.num_variables == 0:
+            # Sin variables, cada fila debe admitir actividad cero (el presolve ya lo comprobó)
+            feasible = reduction is not None or bool(np.all((reduced.row_lower <= 0) & (reduced.row_upper >= 0)))
+            status, x = (1, np.zeros(0)) if feasible else (-1, None)
+        elif self.backend == "simplex":
+            # Con variables binarias la relajación lineal ya tiene óptimos enteros
+            if reduced.is_mip():
+                raise ValueError("Las variables enteras requieren backend='cbc'.")
+            with run.timed("solve_time"):
+                result = simplex.solve_model(reduced)
+            run.iterations = result.iterations
+            status, x = result.status, result.x
+        else:
+            self.mip_result = mip.solve_model(reduced, callback, warm_start=warm_start, **mip_options)
+            run.add_mip_result(self.mip_result)
+            status, x = self.mip_result.status, self.mip_result.x
+
+        with run.timed("readback_time"):
+            if status == 1 and reduction is not None:
+                x, _, _ = reduction.postsolve(x)
+            self.status = status
+            self.objective_value = float(model.c @ x + model.offset) if status == 1 else None
+            allowed = ~np.isinf(self.costs)
+            values = np.where(np.abs(x) > 1e-9, x, 0.0) if x is not None and status == 1 else 0.0
+            self.solution = assignment.AssignmentResult(
+                self.rows[allowed], self.cols[allowed], values, self.objective_value, self.num_resources, self.num_tasks
+            )
+            if self.x is not None:
+                self._store_pulp_values(status)
+
+    def _previous_assignment(self):
+        """Valores de la última solución sobre los pares permitidos actuales (cero en los nuevos)."""
+        allowed = ~np.isinf(self.costs)
+        keys = self.rows[allowed] * self.num_tasks + self.cols[allowed]
+        x0 = np.zeros(keys.size)
+        if keys.size == 0:
+            return x0
+        previous = self.solution.rows * self.num_tasks + self.solution.cols
+        order = np.argsort(keys)
+        positions = np.searchsorted(keys[order], previous).clip(max=keys.size - 1)
+        found = keys[order][positions] == previous
+        x0[order[positions[found]]] = self.solution.values[found]
+        return x0
+
+    def _store_pulp_values(self, status):
+        """Lleva la última solución a las variables de PuLP creadas con build_model."""
+        values = dict(zip(zip(self.solution.rows.tolist(), self.solution.cols.tolist()), self.solution.values.tolist()))
+        for pair, var in self.x.items():
+            var.varValue = values.get(pair, 0.0)
+        self.problem.assignStatus(status)
+
+    def solve_batch(self, scenarios, workers=None, chunk_size=None, callback=None):
+        """
+        Resuelve variantes del problema de asignación en un pool de procesos.
+
+        Parámetros:
+        - scenarios: Lista de diccionarios con los cambios de cada escenario: 'costs' (un
+          costo por par permitido, en el orden de self.rows/self.cols, o {(recurso, tarea): costo}),
+          'max_resources_per_task' y/o 'max_tasks_per_resource'.
+        - workers, chunk_size, callback: Ver LinearProgrammingSolver.solve_batch.
+
+        Retorna:
+        - Un batch.BatchResult cuya matriz de soluciones tiene una columna por par permitido.
+          Un escenario no válido (por ejemplo, un costo para un par no permitido) queda con
+          estado 0 y su mensaje en errors.
+        """
+        base = {
+            "rows": self.rows, "cols": self.cols, "costs": self.costs,
+            "num_resources": self.num_resources, "num_tasks": self.num_tasks,
+            "max_resources_per_task": self.max_resources_per_task,
+            "max_tasks_per_resource": self.max_tasks_per_resource,
+            "allow_unassigned_tasks": self.allow_unassigned_tasks,
+            "variable_type": self.variable_type, "method": self.method, "backend": self.backend,
+        }
+        pair_names = [f"x_{i}_{j}" for i, j in zip(self.rows.tolist(), self.cols.tolist())]
+        return batch.solve_batch(_solve_assignment_scenario, base, scenarios, pair_names, workers, chunk_size, callback)
+
+    def get_result(self):
+        """Retorna la última solución como assignment.AssignmentResult (arreglos de NumPy)."""
+        if self.solution is None:
+            raise ValueError("El problema aún no se ha resuelto.")
+        return self.solution
+
     def get_solution(self):
-        return {(i, j): self.x[i][j].varValue for i in range(self.num_resources) for j in range(self.num_tasks) if self.x[i][j].varValue > 0}
+        """Retorna la última solución como diccionario {(recurso, tarea): valor}."""
+        return self.get_result().to_dict()
+
+
+def _solve_assignment_scenario(base, scenario):
+    """Resuelve un escenario de ResourceAssignmentSolver en un proceso del pool."""
+    base = dict(base)
+    costs = scenario.get("costs")
+    if isinstance(costs, dict):
+        keys = base["rows"] * base["num_tasks"] + base["cols"]
+        order = np.argsort(keys)
+        pairs = list(costs)
+        requested = np.array([i * base["num_tasks"] + j if 0 <= j < base["num_tasks"] else -1 for i, j in pairs], dtype=np.int64)
+        positions = np.zeros(len(pairs), dtype=np.int64)
+        allowed = np.zeros(len(pairs), dtype=bool)
+        if keys.size:
+            positions = order[np.searchsorted(keys, requested, sorter=order).clip(max=keys.size - 1)]
+            # Solo se pueden cambiar los costos de pares permitidos
+            allowed = (requested >= 0) & (keys[positions] == requested) & ~np.isinf(base["costs"][positions])
+        if not allowed.all():
+            raise ValueError(f"El par (recurso, tarea) {pairs[int(np.flatnonzero(~allowed)[0])]} no es un par permitido.")
+        base["costs"] = base["costs"].copy()
+        base["costs"][positions] = list(costs.values())
+    elif costs is not None:
+        base["costs"] = np.asarray(costs, dtype=float)
+    for option in ("max_resources_per_task", "max_tasks_per_resource"):
+        base[option] = scenario.get(option, base[option])
 
- 
+    solver = ResourceAssignmentSolver.from_coo(**base)
+    try:
+        solver.solve()
+    except ValueError:
+        return solver.status or 0, None, None
+    x = np.zeros(solver.num_pairs)
+    keys = solver.rows * solver.num_tasks + solver.cols
+    order = np.argsort(keys)
+    result = solver.get_result()
+    x[order[np.searchsorted(keys, result.rows * solver.num_tasks + result.cols, sorter=order)]] = result.values
+    return solver.status, solver.objective_value, x
@@ -0,0 +1,197 @@
+import numpy as np
+
+from pulp import (LpSolutionInfeasible, LpSolutionIntegerFeasible, LpSolutionNoSolutionFound, LpSolutionOptimal,
+                  LpSolutionUnbounded, LpStatusInfeasible, LpStatusNotSolved, LpStatusOptimal, LpStatusUnbounded,
+                  LpStatusUndefined)
+
+# Escritura del MPS de CBC y lectura de su archivo de solución directamente desde los arreglos
+# de un CompactModel, sin crear objetos de PuLP. Las columnas se llaman C0000000, C0000001, ...
+# y las filas R0000000, ...: CBC escribe la solución en el mismo orden, así que se lee por posición.
+# Cada sección se arma como una matriz de bytes (una fila por línea, campos de ancho fijo)
+# llenada con operaciones de NumPy, sin formatear las líneas una por una.
+
+# Valor que CBC considera infinito
+INFINITY = 1e30
+
+# Líneas por bloque de escritura: acota la memoria de los búferes intermedios
+CHUNK_SIZE = 1 << 18
+
+_CBC_STATUS = {
+    "Optimal": (LpStatusOptimal, LpSolutionOptimal),
+    "Infeasible": (LpStatusInfeasible, LpSolutionInfeasible),
+    "Integer": (LpStatusInfeasible, LpSolutionInfeasible),
+    "Unbounded": (LpStatusUnbounded, LpSolutionUnbounded),
+    "Stopped": (LpStatusNotSolved, LpSolutionNoSolutionFound),
+}
+
+_MARKER = b"    MARKER                 'MARKER'                 '%s'\n"
+
+
+def _digits(numbers, width):
+    """Matriz de bytes con los números en decimal, rellenos con ceros a la izquierda."""
+    powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+    return (np.asarray(numbers, dtype=np.int64)[:, None] // powers % 10 + ord("0")).astype(np.uint8)
+
+
+def _names(prefix, count):
+    """Nombres de ancho fijo (prefijo y al menos 7 dígitos) como matriz de bytes."""
+    width = max(7, len(str(max(count - 1, 0))))
+    return np.hstack([np.full((count, 1), ord(prefix), dtype=np.uint8), _digits(np.arange(count), width)])
+
+
+def _values(values):
+    """Valores en su representación exacta de Python, como matriz de bytes rellena con espacios."""
+    unique, inverse = np.unique(np.asarray(values, dtype=float), return_inverse=True)
+    strings = [repr(value).encode() for value in unique.tolist()]
+    width = max((len(s) for s in strings), default=1)
+    table = np.frombuffer(b"".join(s.ljust(width) for s in strings), dtype=np.uint8).reshape(-1, width)
+    return table[inverse.ravel()]
+
+
+def _lines(*fields):
+    """
+    Une campos en líneas terminadas en salto de línea. Cada campo es un bytes constante o
+    una matriz de bytes con una fila por línea.
+    """
+    count = next(field.shape[0] for field in fields if isinstance(field, np.ndarray))
+    widths = [field.shape[1] if isinstance(field, np.ndarray) else len(field) for field in fields]
+    out = np.empty((count, sum(widths) + 1), dtype=np.uint8)
+    position = 0
+    for field, width in zip(fields, widths):
+        out[:, position:position + width] = field if isinstance(field, np.ndarray) else np.frombuffer(field, dtype=np.uint8)
+        position += width
+    out[:, -1] = ord("\n")
+    return out.tobytes()
+
+
+def _write_lines(f, count, make_fields):
+    """Escribe count líneas por bloques; make_fields(slice) retorna los campos de cada bloque."""
+    for start in range(0, count, CHUNK_SIZE):
+        f.write(_lines(*make_fields(slice(start, min(start + CHUNK_SIZE, count)))))
+
+
+def write_mps(model, path):
+    """
+    Escribe un CompactModel en formato MPS con operaciones vectorizadas sobre sus arreglos.
+
+    Las filas con dos límites finitos distintos se escriben con RANGES y las filas libres
+    con un lado derecho infinito. La constante del objetivo no se escribe: quien lea la
+    solución debe sumarla.
+
+    Parámetros:
+    - model: El CompactModel.
+    - path: Ruta del archivo a escribir.
+    """
+    n, m = model.num_variables, model.num_constraints
+    row_names = _names("R", m)
+    col_names = _names("C", n)
+    # El objetivo ocupa la última posición de las etiquetas de fila, con el mismo ancho
+    labels = np.vstack([row_names, np.frombuffer(b"OBJ".ljust(row_names.shape[1]), dtype=np.uint8)])
+    lower, upper = model.row_lower, model.row_upper
+    has_lower, has_upper = np.isfinite(lower), np.isfinite(upper)
+    equality = has_lower & has_upper & (lower == upper)
+    ranged = has_lower & has_upper & ~equality
+    # Tipo y lado derecho de cada fila: E, G (solo límite inferior) o L (el resto)
+    kinds = np.where(equality, ord("E"), np.where(has_lower & ~has_upper, ord("G"), ord("L"))).astype(np.uint8)[:, None]
+    rhs = np.where(has_upper, upper, np.where(has_lower, lower, INFINITY))
+
+    # Entradas por columna (CSC), con el coeficiente del objetivo (fila -1) antes que las filas.
+    # Una columna sin coeficientes se escribe igual, con costo 0, para que CBC la conserve.
+    present = np.bincount(model.indices[model.data != 0], minlength=n) > 0
+    entry_rows = np.concatenate([np.full(n, -1, dtype=np.int64), model.row_index])
+    entry_cols = np.concatenate([np.arange(n), model.indices])
+    entry_values = np.concatenate([model.c, model.data])
+    keep = (entry_values != 0) | np.concatenate([~present, np.zeros(model.nnz, dtype=bool)])
+    entry_rows, entry_cols, entry_values = entry_rows[keep], entry_cols[keep], entry_values[keep]
+    order = np.lexsort((entry_rows, entry_cols))
+    entry_rows, entry_cols, entry_values = entry_rows[order], entry_cols[order], entry_values[order]
+    column_start = np.searchsorted(entry_cols, np.arange(n + 1))
+
+    with open(path, "wb") as f:
+        f.write(b"NAME          MODEL\nROWS\n N  OBJ\n")
+        _write_lines(f, m, lambda s: (b" ", kinds[s], b"  ", row_names[s]))
+
+        f.write(b"COLUMNS\n")
+        # Las columnas enteras van entre marcadores; se recorren tramos del mismo tipo
+        integer = model.integer.astype(bool)
+        boundaries = (np.flatnonzero(np.diff(integer.astype(np.int8))) + 1).tolist()
+        for first, last in zip([0] + boundaries, boundaries + [n]):
+            if first == last:
+                continue
+            if integer[first]:
+                f.write(_MARKER % b"INTORG")
+            cols, rows, values = (array[column_start[first]:column_start[last]] for array in (entry_cols, entry_rows, entry_values))
+            _write_lines(f, cols.size, lambda s: (b"    ", col_names[cols[s]], b"  ", labels[rows[s]], b"  ", _values(values[s])))
+            if integer[first]:
+                f.write(_MARKER % b"INTEND")
+
+        f.write(b"RHS\n")
+        rows = np.flatnonzero(rhs != 0)
+        _write_lines(f, rows.size, lambda s: (b"    RHS       ", row_names[rows[s]], b"  ", _values(rhs[rows[s]])))
+        if ranged.any():
+            f.write(b"RANGES\n")
+            ranges = np.flatnonzero(ranged)
+            _write_lines(f, ranges.size, lambda s: (b"    RNG       ", row_names[ranges[s]], b"  ", _values((upper - lower)[ranges[s]])))
+
+        f.write(b"BOUNDS\n")
+        for kind, columns, values in _bounds(model):
+            value_fields = (lambda s: (b"  ", _values(values[s]))) if values is not None else (lambda s: ())
+            _write_lines(f, columns.size, lambda s: (b" " + kind + b" BND       ", col_names[columns[s]], *value_fields(s)))
+        f.write(b"ENDATA\n")
+
+
+def _bounds(model):
+    """Secciones de BOUNDS como (tipo, columnas, valores o None), en el orden en que se escriben."""
+    lower, upper, integer = model.lower, model.upper, model.integer.astype(bool)
+    fixed = np.isfinite(lower) & (lower == upper)
+    free_lower = ~np.isfinite(lower)
+    finite_upper = np.isfinite(upper) & ~fixed
+    # COIN toma como binarias las columnas enteras sin límites: el inferior se escribe siempre
+    write_lower = ~fixed & ~free_lower & ((lower != 0) | integer)
+    fixed, write_lower, minus, free, up = (np.flatnonzero(mask) for mask in (
+        fixed, write_lower, free_lower & finite_upper, free_lower & ~finite_upper, finite_upper,
+    ))
+    return [
+        (b"FX", fixed, lower[fixed]),
+        (b"LO", write_lower, lower[write_lower]),
+        (b"MI", minus, None),
+        (b"FR", free, None),
+        (b"UP", up, upper[up]),
+    ]
+
+
+def write_start(path, x):
+    """Escribe una solución inicial para la opción -mips de CBC, con los nombres de write_mps."""
+    x = np.asarray(x, dtype=float)
+    names = _names("C", x.size)
+    with open(path, "wb") as f:
+        f.write(b"Stopped on time - objective value 0\n")
+        _write_lines(f, x.size, lambda s: (names[s, 1:], b" ", names[s], b" ", _values(x[s]), b" 0"))
+
+
+def read_solution(path, num_constraints, num_variables):
+    """
+    Lee el archivo de solución que CBC escribe con '-printingOptions all -solution'.
+
+    Retorna:
+    - Una tupla (estado, estado de la solución, x, actividad, duales, costos reducidos) con
+      los estados en códigos de PuLP y los valores en arreglos, en el orden de las columnas
+      y filas del modelo.
+    """
+    with open(path) as f:
+        header = f.readline().split()
+        # Los valores que violan un límite van precedidos de '**'
+        tokens = f.read().replace("**", " ").split()
+
+    status, solution_status = _CBC_STATUS.get(header[0] if header else "", (LpStatusUndefined, LpSolutionNoSolutionFound))
+    if status == LpStatusNotSolved and len(header) >= 5 and header[4] == "objective":
+        # Búsqueda detenida con una solución entera
+        status, solution_status = LpStatusOptimal, LpSolutionIntegerFeasible
+
+    expected = 4 * (num_constraints + num_variables)
+    if len(tokens) != expected:
+        raise ValueError(f"El archivo de solución de CBC tiene {len(tokens) // 4} entradas; se esperaban {expected // 4}.")
+    values = np.array(tokens[2::4], dtype=float)
+    duals = np.array(tokens[3::4], dtype=float)
+    m = num_constraints
+    return status, solution_status, values[m:], values[:m], duals[:m], duals[m:]
@@ -1 +1,136 @@
-import streamlit as st
\ No newline at end of file
+import streamlit as st
+import pandas as pd
+from cpm import ProjectNetwork
+import time
+
+# Use CSS to modify the container size
+st.markdown(
+    """
+    <style>
+        .block-container {
+            max-width: 1000px;
+        }
+    </style>
+    """, unsafe_allow_html=True)
+
+# Actividades de la ruta crítica que se muestran por página
+PATH_ROWS = 50
+
+
+def activity_rows(network, activities):
+    """Tabla con los tiempos de un subconjunto de actividades (nunca de la red completa)."""
+    return pd.DataFrame({
+        "Actividad": [network.names[i] for i in activities.tolist()],
+        "Duración": network.durations[activities],
+        "Inicio temprano": network.earliest_start[activities],
+        "Fin temprano": network.earliest_finish[activities],
+        "Inicio tardío": network.latest_start[activities],
+        "Fin tardío": network.latest_finish[activities],
+    })
+
+
+def app():
+
+    st.title("Solver de Ruta Crítica (CPM)")
+    st.write("Sube un CSV con una actividad por fila: identificador, duración y predecesoras separadas por ';' (por ejemplo `D,4,B;C`).")
+
+    uploaded_file = st.file_uploader("Selecciona un archivo CSV", type=["csv"])
+    if uploaded_file is None:
+        return
+
+    # El archivo se lee fila por fila y la red se calcula una sola vez por archivo
+    file_key = (uploaded_file.name, uploaded_file.size)
+    if st.session_state.get("cpm_file") != file_key:
+        start = time.perf_counter()
+        try:
+            st.session_state["cpm_network"] = ProjectNetwork.from_csv(uploaded_file)
+        except ValueError as e:
+            st.error(f"No se pudo cargar el proyecto: {e}")
+            return
+        st.session_state["cpm_file"] = file_key
+        st.session_state["cpm_load_time"] = time.perf_counter() - start
+        st.session_state.pop("cpm_update_time", None)
+    network = st.session_state["cpm_network"]
+
+    # Resumen
+    summary = network.summary()
+    metrics = st.columns(4)
+    metrics[0].metric("Actividades", f"{summary['num_activities']:,}")
+    metrics[1].metric("Dependencias", f"{summary['num_dependencies']:,}")
+    metrics[2].metric("Duración del proyecto", f"{summary['project_duration']:g}")
+    metrics[3].metric("Actividades críticas", f"{summary['num_critical']:,}")
+    st.caption(
+        f"Niveles de la red: {summary['depth']:,} · holgura total media: {summary['mean_total_float']:.2f} · "
+        f"cargado y calculado en {st.session_state['cpm_load_time'] * 1000:.0f} ms."
+    )
+
+    # Ruta crítica, por páginas
+    path = network.critical_path()
+    st.subheader(f"Ruta crítica ({path.size:,} actividades)")
+    first = st.number_input("Primera actividad", min_value=1, max_value=max(path.size, 1), step=PATH_ROWS, value=1) - 1
+    st.dataframe(activity_rows(network, path[first:first + PATH_ROWS]), hide_index=True)
+    st.download_button(
+        label="Descargar ruta crítica",
+        data=activity_rows(network, path).to_csv(index=False).encode("utf-8"),
+        file_name="ruta_critica.csv",
+        mime="text/csv",
+    )
+
+    # Consulta de una actividad
+    st.subheader("Consultar actividad")
+    name = st.text_input("Identificador de la actividad")
+    if name:
+        try:
+            info = network.activity(name)
+        except ValueError as e:
+            st.error(str(e))
+        else:
+            st.table(pd.DataFrame([{
+                "Duración": info["duration"],
+                "Inicio temprano": info["earliest_start"],
+                "Fin temprano": info["earliest_finish"],
+                "Inicio tardío": info["latest_start"],
+                "Fin tardío": info["latest_finish"],
+                "Holgura total": info["total_float"],
+                "Holgura libre": info["free_float"],
+            }]))
+            st.write(f"Predecesoras: {', '.join(info['predecessors']) or '—'}")
+            st.write(f"Sucesoras: {', '.join(info['successors']) or '—'}")
+
+    # Cambios incrementales: solo se recalculan las actividades afectadas
+    with st.expander("**Modificar el proyecto**"):
+        with st.form("cpm_duration"):
+            duration_cols = st.columns(2)
+            with duration_cols[0]:
+                activity = st.text_input("Actividad")
+            with duration_cols[1]:
+                duration = st.number_input("Nueva duración", min_value=0.0, step=1.0)
+            change_duration = st.form_submit_button("Cambiar duración")
+        with st.form("cpm_dependency"):
+            dependency_cols = st.columns(3)
+            with dependency_cols[0]:
+                predecessor = st.text_input("Predecesora")
+            with dependency_cols[1]:
+                successor = st.text_input("Sucesora")
+            with dependency_cols[2]:
+                action = st.radio("Acción", ("Agregar", "Eliminar"), horizontal=True)
+            change_dependency = st.form_submit_button("Aplicar dependencia")
+
+        if change_duration or change_dependency:
+            start = time.perf_counter()
+            try:
+                if change_duration:
+                    network.set_duration(activity, duration)
+                elif action == "Agregar":
+                    network.add_dependency(predecessor, successor)
+                else:
+                    network.remove_dependency(predecessor, successor)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                st.session_state["cpm_update_time"] = time.perf_counter() - start
+                st.rerun()
+        if "cpm_update_time" in st.session_state:
+            st.caption(f"Último cambio recalculado en {st.session_state['cpm_update_time'] * 1000:.1f} ms.")
+
+app()
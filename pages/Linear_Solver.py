@@ -1,13 +1,73 @@
 import streamlit as st
 from models import LinearProgrammingSolver
+from cache import SolveCache
+import jobs
+import stats
+import utils
+import matplotlib.pyplot as plt
 import time
 import io
+import os
+import copy
+import hashlib
 
 operator_map = {
     "≤": "<=",
     "=": "==",
     "≥": ">="
 }
+
+@st.cache_resource
+def get_solve_cache():
+    """Caché de resoluciones compartida por todas las sesiones; LP_SOLVER_CACHE_DIR activa el nivel en disco."""
+    return SolveCache(max_entries=128, directory=os.environ.get("LP_SOLVER_CACHE_DIR"))
+
+
+def result_key(solver, presolve):
+    """
+    Clave del resultado: el modelo canónico, sus restricciones en orden y con su nombre
+    (la sensibilidad y el gráfico las muestran por nombre) y si se resolvió con presolve.
+    """
+    rows = [
+        (name, sorted((var.name, float(coeff)) for var, coeff in constraint.items()), constraint.sense, float(-constraint.constant))
+        for name, constraint in solver.problem.constraints.items()
+    ]
+    digest = hashlib.sha256(repr((solver.canonical_key(), rows)).encode()).hexdigest()
+    return f"{digest}-{'presolve' if presolve else 'full'}"
+
+
+def solve_and_render(solver, presolve=False, cancel=None):
+    """Resuelve el problema y prepara todo lo que se muestra: solución, sensibilidad y gráfico en PNG."""
+    solver.solve(presolve=presolve, cancel=cancel)
+    entry = {
+        "status": solver.problem.status,
+        "objective": solver.problem.objective.value(),
+        "solution": solver.get_solution(),
+        "warm_started": solver.warm_started,
+        "presolve_report": solver.presolve_report,
+        "stats": solver.last_run_stats.as_dict(),
+        "sensitivity": None,
+        "figure": None,
+        "notes": [],
+    }
+    if entry["status"] == 1:
+        try:
+            entry["sensitivity"] = solver.sensitivity_analysis()
+        except ValueError as e:
+            entry["notes"].append(str(e))
+
+    # Testing de la region factible
+    try:
+        fig = solver.plot_feasible_region()
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", bbox_inches="tight")
+        plt.close(fig)
+        entry["figure"] = buffer.getvalue()
+    except Exception as e:
+        entry["notes"].append(str(e))
+    return entry
+
+
 # Usar CSS para modificar el tamaño del contenedor del gráfico
 st.markdown(
     """
@@ -97,42 +157,150 @@ with col1:
     if st.button("Agregar Restricción"):
         if lhs.strip():  # Verifica que el LHS no esté vacío
             new_restriction = {"lhs": lhs, "operator": operator, "rhs": str(rhs), "op_choice": operator_choice}
-            if new_restriction in st.session_state["restrictions"]:
+            existing = [{key: value for key, value in r.items() if key != "name"} for r in st.session_state["restrictions"]]
+            if new_restriction in existing:
                 st.warning("Esta restricción ya existe.")
             else:
-                st.session_state["solver"].add_constraint(lhs, operator, rhs)
-                st.session_state["restrictions"].append(new_restriction)
-                st.success("Restricción agregada exitosamente.")
-                st.rerun()
+                try:
+                    new_restriction["name"] = st.session_state["solver"].add_constraint(lhs, operator, rhs)
+                except ValueError as e:
+                    st.error(str(e))
+                else:
+                    st.session_state["restrictions"].append(new_restriction)
+                    st.success("Restricción agregada exitosamente.")
+                    st.rerun()
         else:
             st.error("El lado izquierdo no puede estar vacío.")
-    
+
+    # Agregar varias restricciones de una vez: bloque de texto o archivo de coeficientes
+    with st.expander("Agregar varias restricciones", expanded=False):
+        bulk_text = st.text_area("Una restricción por línea", placeholder="x + 2y <= 10\n3x - y >= 2")
+        bulk_file = st.file_uploader(
+            "O un archivo CSV/Parquet con una columna por variable y las columnas 'operator' y 'rhs'",
+            type=["csv", "parquet"],
+        )
+        if st.button("Agregar lote"):
+            try:
+                names = st.session_state["solver"].add_constraints_bulk(bulk_file if bulk_file is not None else bulk_text)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                symbols = {"<=": "≤", "=": "=", ">=": "≥"}
+                for name in names:
+                    lhs_text, operator_text, rhs_text = utils.split_constraint(str(st.session_state["solver"].problem.constraints[name]))
+                    st.session_state["restrictions"].append({
+                        "lhs": lhs_text, "operator": operator_map[symbols[operator_text]],
+                        "rhs": rhs_text, "op_choice": symbols[operator_text], "name": name,
+                    })
+                st.success(f"{len(names)} restricciones agregadas.")
+                st.rerun()
+
+    use_presolve = st.checkbox("Aplicar presolve", value=False, help="Elimina filas duplicadas, restricciones de una sola variable y restricciones redundantes antes de resolver.")
+
     # Botón para resolver el problema de programación lineal
     if st.button("Resolver Problema de Programación Lineal") and st.session_state["restrictions"]:
-        # Resolver el problema
-        st.session_state["solver"].solve()
+        # Reutilizar el resultado de un modelo equivalente ya resuelto, o resolver en segundo
+        # plano una copia del modelo para que la sesión siga respondiendo
+        solve_cache = get_solve_cache()
+        key = result_key(st.session_state["solver"], use_presolve)
+        result = solve_cache.get(key)
+        if result is not None:
+            st.session_state["solve_result"] = (key, result, True)
+        else:
+            solver_copy = copy.deepcopy(st.session_state["solver"])
+
+            def run(job):
+                entry = solve_and_render(solver_copy, use_presolve, job.token)
+                # Una resolución cancelada no se guarda aunque CBC haya alcanzado a terminar
+                if not job.token.cancelled:
+                    solve_cache.put(key, entry)
+                return entry, solver_copy.basis
+
+            job, is_new = jobs.default_manager().submit(key, run)
+            if not is_new:
+                st.info("Este modelo ya se está resolviendo; se muestra el trabajo en curso.")
+            st.session_state["solve_job"] = job
+
+    # Seguimiento del trabajo en curso
+    job = st.session_state.get("solve_job")
+    if job is not None:
+        if not job.done():
+            st.info(f"Resolviendo... ({jobs.LABELS[job.status]}, {job.elapsed:.1f} s)")
+            if job.status != jobs.CANCELLING and st.button("Cancelar resolución"):
+                job.cancel()
+            time.sleep(0.5)
+            st.rerun()
+        del st.session_state["solve_job"]
+        jobs.default_manager().forget(job)
+        if job.status == jobs.DONE:
+            entry, basis = job.result
+            # La base de la copia resuelta sirve para el próximo arranque en caliente
+            if result_key(st.session_state["solver"], use_presolve) == job.key:
+                st.session_state["solver"].basis = basis
+            st.session_state["solve_result"] = (job.key, entry, False)
+        elif job.status == jobs.FAILED:
+            st.error(f"Error al resolver: {job.error}")
+        else:
+            st.warning("Resolución cancelada.")
+
+    shown = st.session_state.get("solve_result")
+    if shown is not None and st.session_state["restrictions"] and shown[0] == result_key(st.session_state["solver"], use_presolve):
+        _, result, from_cache = shown
 
         # Mostrar la solución
         st.subheader("Solución")
         
-        if st.session_state["solver"].problem.status != 1:
+        if result["status"] != 1:
             st.error("El problema no tiene solución óptima.")
         else:
             st.success("Problema resuelto exitosamente.")
+            if from_cache:
+                st.caption("Resultado recuperado de la caché de resoluciones.")
+            elif result["warm_started"]:
+                st.caption("Reoptimizado a partir de la base de la resolución anterior.")
         
-            st.latex(r"\text{Valor Óptimo:}" + r"\quad " + str(st.session_state["solver"].problem.objective.value()))
-            solution = st.session_state["solver"].get_solution()
+            report = result.get("presolve_report")
+            if report is not None:
+                st.caption(
+                    f"Presolve: {report['removed_rows']} restricciones y {report['removed_columns']} variables "
+                    f"eliminadas en {report['time'] * 1000:.1f} ms."
+                )
+
+            st.latex(r"\text{Valor Óptimo:}" + r"\quad " + str(result["objective"]))
+            solution = result["solution"]
 
             st.latex(r"\text{Solución:}" + r"\quad " + r",\quad ".join([f"{key} = {value}" for key, value in solution.items()]))
 
-        
-        # Testing de la region factible
-        try:
-            fig = st.session_state["solver"].plot_feasible_region()
-            st.pyplot(fig=fig)
-        
-        except Exception as e:
-            st.write(f"Nota: {e}")
+            # Análisis de sensibilidad a partir de la base óptima
+            analysis = result["sensitivity"]
+            if analysis is not None:
+                with st.expander("Análisis de sensibilidad", expanded=False):
+                    st.write("Restricciones")
+                    st.dataframe([
+                        {"Restricción": name, "Actividad": row["activity"], "Holgura": row["slack"],
+                         "Precio sombra": row["shadow_price"],
+                         "LD mínimo": row["rhs_range"][0], "LD máximo": row["rhs_range"][1]}
+                        for name, row in analysis["constraints"].items()
+                    ])
+                    st.write("Variables")
+                    st.dataframe([
+                        {"Variable": name, "Valor": row["value"], "Costo reducido": row["reduced_cost"],
+                         "Coeficiente mínimo": row["cost_range"][0], "Coeficiente máximo": row["cost_range"][1]}
+                        for name, row in analysis["variables"].items()
+                    ])
+
+        # Dónde se fue el tiempo: interpretación, construcción o el solver
+        if result.get("stats") is not None:
+            with st.expander("Métricas de la resolución", expanded=False):
+                if from_cache:
+                    st.caption("Métricas de la resolución original; este resultado salió de la caché.")
+                st.table(stats.summary_rows(result["stats"]))
+
+        if result["figure"] is not None:
+            st.image(result["figure"])
+        for note in result["notes"]:
+            st.write(f"Nota: {note}")
+
 
 
 # Columna lateral (col2): Eliminar restricciones
@@ -155,17 +323,16 @@ with col2:
             format_func=lambda i: f"{i + 1}. {st.session_state['restrictions'][i]['lhs']} {st.session_state['restrictions'][i]['operator']} {st.session_state['restrictions'][i]['rhs']}"
         )
         # Botón para eliminar la restricción seleccionada
-        if st.button("Eliminar"):
-            del st.session_state["restrictions"][selected_index]
-            st.session_state["solver"].remove_constraint(f"Restriccion_{selected_index}")
+        if st.button("Eliminar") and selected_index is not None:
+            # Cada restricción guarda su nombre estable en el modelo
+            removed = st.session_state["restrictions"].pop(selected_index)
+            st.session_state["solver"].remove_constraint(removed["name"])
             st.rerun()
-            st.success("Restricción eliminada.")
         
         # Botón para eliminar todas las restricciones
         if st.button("Eliminar todas", key="reset_restrictions"):
+            st.session_state["solver"].remove_constraints([r["name"] for r in st.session_state["restrictions"]])
             st.session_state["restrictions"] = []
-            for constraint_name in list(st.session_state["solver"].problem.constraints.keys()):
-                del st.session_state["solver"].problem.constraints[constraint_name]
             st.success("Todas las restricciones han sido eliminadas.")
             st.rerun()
         
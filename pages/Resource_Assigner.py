@@ -1,6 +1,10 @@
 import streamlit as st
 import pandas as pd
 from models import ResourceAssignmentSolver
+import jobs
+import loaders
+import stats
+import time
 from st_aggrid import AgGrid, GridOptionsBuilder
 
 # Use CSS to modify the container size
@@ -17,6 +21,11 @@ variable_type = "Binaria"
 max_resources_per_task = 1
 max_tasks_per_resource = 1
 allow_unassigned_tasks = False
+variable_types = {"Binaria": "Binary", "Continua": "Continuous", "Entera": "Integer"}
+
+# Tamaño de la ventana de la matriz que se muestra en la tabla editable
+PREVIEW_ROWS = 50
+PREVIEW_COLUMNS = 20
 
 def app():
 
@@ -87,19 +96,53 @@ def app():
                 variable_type = st.selectbox("Tipo de variable", ["Binaria", "Continua", "Entera"], index=0)
 
             allow_unassigned_tasks = st.checkbox("Permitir tareas no asignadas", value=False)
+
+            # Límites de la búsqueda de CBC: se devuelve la mejor solución encontrada a tiempo
+            limit_options = st.columns(2)
+            with limit_options[0]:
+                time_limit = st.number_input("Tiempo máximo (s, 0 = sin límite)", min_value=0, step=5, value=0)
+            with limit_options[1]:
+                gap_percent = st.number_input("Brecha objetivo (%)", min_value=0.0, max_value=100.0, step=0.5, value=0.0)
         
         # Upload CSV file
-        st.subheader("Sube un archivo CSV")
-        uploaded_file = st.file_uploader("Selecciona un archivo CSV", type=["csv"])
+        st.subheader("Sube un archivo CSV o NPY")
+        uploaded_file = st.file_uploader("Selecciona un archivo CSV o NPY", type=["csv", "npy"])
 
         if uploaded_file is not None:
-            # Read CSV file
-            data = pd.read_csv(uploaded_file)
-            
+            # Cargar la matriz por bloques en un arreglo de NumPy, una sola vez por archivo
+            file_key = (uploaded_file.name, uploaded_file.size)
+            if st.session_state.get("cost_matrix_file") != file_key:
+                start = time.perf_counter()
+                try:
+                    st.session_state["cost_matrix"] = loaders.load_cost_matrix(uploaded_file)
+                except ValueError as e:
+                    st.error(f"No se pudo cargar la matriz: {e}")
+                    return
+                st.session_state["cost_matrix_file"] = file_key
+                st.session_state["cost_matrix_load_time"] = time.perf_counter() - start
+            cost_matrix = st.session_state["cost_matrix"]
+            num_resources, num_tasks = cost_matrix.shape
+            st.write(f"Matriz de {num_resources} recursos x {num_tasks} tareas.")
+
+            # Solo una ventana de la matriz pasa por la tabla editable
+            window_cols = st.columns(2)
+            with window_cols[0]:
+                first_row = st.number_input("Primera fila", min_value=1, max_value=num_resources, step=PREVIEW_ROWS, value=1) - 1
+            with window_cols[1]:
+                first_column = st.number_input("Primera columna", min_value=1, max_value=num_tasks, step=PREVIEW_COLUMNS, value=1) - 1
+            rows = slice(first_row, min(first_row + PREVIEW_ROWS, num_resources))
+            columns = slice(first_column, min(first_column + PREVIEW_COLUMNS, num_tasks))
+            data = pd.DataFrame(
+                cost_matrix[rows, columns],
+                columns=[f"Trabajador {j + 1}" for j in range(columns.start, columns.stop)],
+            )
+            data.insert(0, "Recurso", [f"Recurso {i + 1}" for i in range(rows.start, rows.stop)])
+
             # Display and edit CSV data
-            st.subheader("Editar datos del CSV")
+            st.subheader("Editar datos del archivo")
             gb = GridOptionsBuilder.from_dataframe(data)
             gb.configure_default_column(editable=True)
+            gb.configure_column("Recurso", editable=False)
             grid_options = gb.build()
 
             response = AgGrid(
@@ -112,9 +155,81 @@ def app():
 
             # Retrieve edited data
             if st.button("Procesar datos del CSV"):
-                edited_data = pd.DataFrame(response["data"])
-                st.write("Datos editados:")
-                st.dataframe(edited_data)
+                edited_data = pd.DataFrame(response["data"]).drop(columns="Recurso")
+                try:
+                    cost_matrix[rows, columns] = loaders.validate_cost_matrix(edited_data.to_numpy())
+                except ValueError as e:
+                    st.error(str(e))
+                else:
+                    st.write("Datos editados:")
+                    st.dataframe(edited_data)
+
+            # La matriz completa se pasa al solver como arreglo, sin convertirla a listas; la
+            # resolución corre en segundo plano para no bloquear la sesión
+            if st.button("Resolver asignación"):
+                solver = ResourceAssignmentSolver(
+                    cost_matrix,
+                    max_resources_per_task=max_resources_per_task,
+                    max_tasks_per_resource=max_tasks_per_resource,
+                    allow_unassigned_tasks=allow_unassigned_tasks,
+                    variable_type=variable_types[variable_type],
+                )
+                limits = {"time_limit": time_limit or None, "gap_rel": gap_percent / 100 or None}
+
+                def run(job):
+                    def publish(incumbent):
+                        job.progress = incumbent
+
+                    solver.solve(callback=publish, cancel=job.token, **limits)
+                    return solver
+
+                job, is_new = jobs.default_manager().submit((solver.canonical_key(), time_limit, gap_percent), run)
+                if not is_new:
+                    st.info("Este problema ya se está resolviendo; se muestra el trabajo en curso.")
+                st.session_state["assignment_job"] = job
+                st.session_state.pop("assignment_result", None)
+
+            # Progreso en vivo: estado, tiempo y la mejor solución que encontró CBC
+            job = st.session_state.get("assignment_job")
+            if job is not None:
+                if not job.done():
+                    message = f"Resolviendo... ({jobs.LABELS[job.status]}, {job.elapsed:.1f} s)"
+                    incumbent = job.progress
+                    if incumbent is not None:
+                        bound = "—" if incumbent.bound is None else f"{incumbent.bound:g}"
+                        gap = "—" if incumbent.gap is None else f"{incumbent.gap:.2%}"
+                        message += f" · mejor costo encontrado: {incumbent.objective:g} · cota: {bound} · brecha: {gap}"
+                    st.info(message)
+                    if job.status != jobs.CANCELLING and st.button("Cancelar resolución"):
+                        job.cancel()
+                    time.sleep(0.5)
+                    st.rerun()
+                del st.session_state["assignment_job"]
+                jobs.default_manager().forget(job)
+                if job.status == jobs.DONE:
+                    st.session_state["assignment_result"] = job.result
+                elif job.status == jobs.FAILED:
+                    st.error(str(job.error))
+                else:
+                    st.warning("Resolución cancelada.")
+
+            solver = st.session_state.get("assignment_result")
+            if solver is not None:
+                st.success(f"Costo total: {solver.objective_value}")
+                mip_result = solver.mip_result
+                if mip_result is not None and not mip_result.proven_optimal:
+                    gap = "desconocida" if mip_result.gap is None else f"{mip_result.gap:.2%}"
+                    st.warning(f"Búsqueda detenida antes de probar la optimalidad (brecha {gap} tras {mip_result.elapsed:.1f} s).")
+                result = solver.get_result()
+                st.dataframe(pd.DataFrame({
+                    "Recurso": result.rows + 1,
+                    "Trabajador": result.cols + 1,
+                    "Valor": result.values,
+                }))
+                with st.expander("Métricas de la resolución", expanded=False):
+                    load_time = st.session_state.get("cost_matrix_load_time")
+                    rows = [{"Métrica": "Lectura del archivo", "Valor": f"{load_time * 1000:.1f} ms"}] if load_time is not None else []
+                    st.table(rows + stats.summary_rows(solver.last_run_stats))
 
     # Option to save processed data
     if st.button("Descargar datos procesados"):
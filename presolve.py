@@ -0,0 +1,342 @@
+import time
+
+import numpy as np
+
+from compact import CompactModel
+
+# Códigos de estado compatibles con PuLP
+STATUS_INFEASIBLE = -1
+
+
+class Presolve:
+    """
+    Reducción de un CompactModel antes de resolverlo, y reconstrucción (postsolve) de la
+    solución y los duales del modelo original a partir de los del modelo reducido.
+
+    Reducciones, aplicadas en pasadas hasta que no haya cambios:
+
+    - Variables fijas (lower == upper): se sustituyen en las filas y el objetivo.
+    - Filas vacías: se eliminan (o se detecta que el problema no es factible).
+    - Filas con una sola variable: se convierten en límites de la variable.
+    - Filas duplicadas (proporcionales): se fusionan en una con los límites más ajustados.
+    - Filas dominadas: se eliminan si los límites de las variables ya las garantizan.
+    - Columnas vacías: se fijan en el límite que favorece el objetivo.
+
+    Al final cada fila se escala para que su mayor coeficiente valga 1.
+
+    Atributos:
+    - status: None, o STATUS_INFEASIBLE si la infactibilidad se detectó durante el presolve.
+    - reduced: El CompactModel reducido (None si no es factible).
+    - report: Diccionario con lo eliminado y el tiempo empleado.
+    """
+
+    max_passes = 20
+    tol = 1e-9
+
+    def __init__(self, model):
+        start = time.perf_counter()
+        self.model = model
+        self.status = None
+        self.reduced = None
+        self.report = {
+            "fixed_columns": 0, "empty_columns": 0, "empty_rows": 0, "singleton_rows": 0,
+            "duplicate_rows": 0, "redundant_rows": 0, "tightened_bounds": 0,
+        }
+
+        n, m = model.num_variables, model.num_constraints
+        self.row_of = model.row_index
+        self.lower, self.upper = model.lower.copy(), model.upper.copy()
+        self.row_lower, self.row_upper = model.row_lower.copy(), model.row_upper.copy()
+        self.offset = model.offset
+        self.row_alive = np.ones(m, dtype=bool)
+        self.col_alive = np.ones(n, dtype=bool)
+        self.fixed_value = np.zeros(n)
+        # Cada fila reducida R cumple R = multiplicador · fila original de la que sale su límite
+        self.lower_source = np.arange(m)
+        self.upper_source = np.arange(m)
+        self.lower_factor = np.ones(m)
+        self.upper_factor = np.ones(m)
+        # Fila de una sola variable que define cada límite de columna: (fila original, multiplicador, coeficiente)
+        self.column_lower_source = {}
+        self.column_upper_source = {}
+        # Columnas en el orden en que se ajustaron sus límites; postsolve las recorre al revés
+        self.tightened = []
+
+        try:
+            for _ in range(self.max_passes):
+                changed = self._fix_columns()
+                changed |= self._remove_empty_rows()
+                changed |= self._remove_singleton_rows()
+                changed |= self._merge_duplicate_rows()
+                changed |= self._remove_redundant_rows()
+                changed |= self._fix_empty_columns()
+                if not changed:
+                    break
+            self.reduced = self._build_reduced()
+        except _Infeasible:
+            self.status = STATUS_INFEASIBLE
+
+        self.report["removed_rows"] = int(m - self.row_alive.sum())
+        self.report["removed_columns"] = int(n - self.col_alive.sum())
+        self.report["time"] = time.perf_counter() - start
+
+    # Auxiliares
+
+    def _entry_alive(self):
+        return self.row_alive[self.row_of] & self.col_alive[self.model.indices]
+
+    def _row_counts(self, alive):
+        return np.bincount(self.row_of, weights=alive, minlength=self.model.num_constraints).astype(np.int64)
+
+    def _set_lower(self, j, value, source):
+        if self.model.integer[j]:
+            value = np.ceil(value - 1e-6)
+        if value > self.upper[j] + 1e-7 * (1 + abs(value)):
+            raise _Infeasible()
+        if value > self.lower[j]:
+            self.lower[j] = min(value, self.upper[j])
+            self.column_lower_source[j] = source
+            self.tightened.append(j)
+            self.report["tightened_bounds"] += 1
+
+    def _set_upper(self, j, value, source):
+        if self.model.integer[j]:
+            value = np.floor(value + 1e-6)
+        if value < self.lower[j] - 1e-7 * (1 + abs(value)):
+            raise _Infeasible()
+        if value < self.upper[j]:
+            self.upper[j] = max(value, self.lower[j])
+            self.column_upper_source[j] = source
+            self.tightened.append(j)
+            self.report["tightened_bounds"] += 1
+
+    # Reducciones
+
+    def _fix_columns(self):
+        fixed = np.flatnonzero(self.col_alive & (self.lower == self.upper) & np.isfinite(self.lower))
+        if fixed.size == 0:
+            return False
+        self._remove_columns(fixed, self.lower[fixed])
+        self.report["fixed_columns"] += fixed.size
+        return True
+
+    def _remove_columns(self, columns, values):
+        """Fija las columnas en los valores dados y pasa su aporte a los límites de las filas."""
+        self.fixed_value[columns] = values
+        value = np.zeros(self.model.num_variables)
+        value[columns] = values
+        in_columns = np.zeros(self.model.num_variables, dtype=bool)
+        in_columns[columns] = True
+        entries = self._entry_alive() & in_columns[self.model.indices]
+        shift = np.bincount(self.row_of[entries], weights=self.model.data[entries] * value[self.model.indices[entries]],
+                            minlength=self.model.num_constraints)
+        self.row_lower -= shift
+        self.row_upper -= shift
+        self.offset += float(self.model.c[columns] @ values)
+        self.col_alive[columns] = False
+
+    def _remove_empty_rows(self):
+        empty = np.flatnonzero(self.row_alive & (self._row_counts(self._entry_alive()) == 0))
+        if empty.size == 0:
+            return False
+        tol = self.tol * (1 + np.abs(self.row_lower[empty]))
+        if (self.row_lower[empty] > tol).any() or (self.row_upper[empty] < -self.tol * (1 + np.abs(self.row_upper[empty]))).any():
+            raise _Infeasible()
+        self.row_alive[empty] = False
+        self.report["empty_rows"] += empty.size
+        return True
+
+    def _remove_singleton_rows(self):
+        alive = self._entry_alive()
+        singletons = np.flatnonzero(self.row_alive & (self._row_counts(alive) == 1))
+        if singletons.size == 0:
+            return False
+        is_singleton = np.zeros(self.model.num_constraints, dtype=bool)
+        is_singleton[singletons] = True
+        entries = np.flatnonzero(alive & is_singleton[self.row_of])
+        for k in entries.tolist():
+            i, j, a = self.row_of[k], self.model.indices[k], self.model.data[k]
+            low, up = self.row_lower[i] / a, self.row_upper[i] / a
+            low_source = (self.lower_source[i], self.lower_factor[i], a)
+            up_source = (self.upper_source[i], self.upper_factor[i], a)
+            if a < 0:
+                low, up, low_source, up_source = up, low, up_source, low_source
+            if np.isfinite(low):
+                self._set_lower(j, low, low_source)
+            if np.isfinite(up):
+                self._set_upper(j, up, up_source)
+        self.row_alive[singletons] = False
+        self.report["singleton_rows"] += singletons.size
+        return True
+
+    def _merge_duplicate_rows(self):
+        alive = self._entry_alive()
+        candidates = self.row_alive & (self._row_counts(alive) >= 2)
+        if candidates.sum() < 2:
+            return False
+
+        representative = {}
+        merged = False
+        indptr, indices, data = self.model.indptr, self.model.indices, self.model.data
+        for i in np.flatnonzero(candidates).tolist():
+            start, end = indptr[i], indptr[i + 1]
+            keep = alive[start:end]
+            cols, coeffs = indices[start:end][keep], data[start:end][keep]
+            order = np.argsort(cols)
+            cols, coeffs = cols[order], coeffs[order]
+            scale = coeffs[0]
+            key = (cols.tobytes(), np.round(coeffs / scale, 10).tobytes())
+            if key not in representative:
+                representative[key] = (i, scale)
+                continue
+
+            # Fila i = k · fila r: sus límites, llevados a la escala de r, ajustan los de r
+            r, r_scale = representative[key]
+            k = scale / r_scale
+            low, up = self.row_lower[i] / k, self.row_upper[i] / k
+            low_source = (self.lower_source[i], self.lower_factor[i] / k)
+            up_source = (self.upper_source[i], self.upper_factor[i] / k)
+            if k < 0:
+                low, up, low_source, up_source = up, low, up_source, low_source
+            if low > self.row_lower[r]:
+                self.row_lower[r] = low
+                self.lower_source[r], self.lower_factor[r] = low_source
+            if up < self.row_upper[r]:
+                self.row_upper[r] = up
+                self.upper_source[r], self.upper_factor[r] = up_source
+            if self.row_lower[r] > self.row_upper[r] + 1e-7 * (1 + abs(self.row_upper[r])):
+                raise _Infeasible()
+            self.row_alive[i] = False
+            self.report["duplicate_rows"] += 1
+            merged = True
+        return merged
+
+    def _activity_bounds(self, alive):
+        """Actividad mínima y máxima de cada fila según los límites de las variables."""
+        a = np.where(alive, self.model.data, 0.0)
+        lb, ub = self.lower[self.model.indices], self.upper[self.model.indices]
+        with np.errstate(invalid="ignore"):
+            low_term = np.where(a > 0, lb, ub) * a
+            up_term = np.where(a > 0, ub, lb) * a
+        low_term[a == 0] = 0.0
+        up_term[a == 0] = 0.0
+        m = self.model.num_constraints
+        low_infinite = np.bincount(self.row_of, weights=~np.isfinite(low_term), minlength=m) > 0
+        up_infinite = np.bincount(self.row_of, weights=~np.isfinite(up_term), minlength=m) > 0
+        min_activity = np.bincount(self.row_of, weights=np.where(np.isfinite(low_term), low_term, 0.0), minlength=m)
+        max_activity = np.bincount(self.row_of, weights=np.where(np.isfinite(up_term), up_term, 0.0), minlength=m)
+        return np.where(low_infinite, -np.inf, min_activity), np.where(up_infinite, np.inf, max_activity)
+
+    def _remove_redundant_rows(self):
+        min_activity, max_activity = self._activity_bounds(self._entry_alive())
+        tol = 1e-9 * (1 + np.abs(self.row_lower)), 1e-9 * (1 + np.abs(self.row_upper))
+        if (self.row_alive & ((min_activity > self.row_upper + tol[1]) | (max_activity < self.row_lower - tol[0]))).any():
+            raise _Infeasible()
+        redundant = self.row_alive & (min_activity >= self.row_lower - tol[0]) & (max_activity <= self.row_upper + tol[1])
+        if not redundant.any():
+            return False
+        self.row_alive[redundant] = False
+        self.report["redundant_rows"] += int(redundant.sum())
+        return True
+
+    def _fix_empty_columns(self):
+        counts = np.bincount(self.model.indices, weights=self._entry_alive(), minlength=self.model.num_variables)
+        c = self.model.c if self.model.minimize else -self.model.c
+        empty = self.col_alive & (counts == 0)
+        # Valor que minimiza el aporte de cada columna vacía; sin límite en esa dirección se deja
+        value = np.where(c > 0, self.lower, np.where(c < 0, self.upper,
+                         np.where(np.isfinite(self.lower), self.lower, np.where(np.isfinite(self.upper), self.upper, 0.0))))
+        columns = np.flatnonzero(empty & np.isfinite(value))
+        if columns.size == 0:
+            return False
+        self._remove_columns(columns, value[columns])
+        self.report["empty_columns"] += columns.size
+        return True
+
+    def _build_reduced(self):
+        rows = np.flatnonzero(self.row_alive)
+        cols = np.flatnonzero(self.col_alive)
+        column_position = np.full(self.model.num_variables, -1)
+        column_position[cols] = np.arange(cols.size)
+
+        entries = self._entry_alive()
+        row_of, indices, data = self.row_of[entries], column_position[self.model.indices[entries]], self.model.data[entries]
+
+        # Escalar cada fila para que su mayor coeficiente en valor absoluto valga 1
+        largest = np.zeros(self.model.num_constraints)
+        np.maximum.at(largest, row_of, np.abs(data))
+        self.row_scale = np.where(largest > 0, 1.0 / np.where(largest > 0, largest, 1.0), 1.0)
+        data = data * self.row_scale[row_of]
+
+        row_position = np.full(self.model.num_constraints, -1)
+        row_position[rows] = np.arange(rows.size)
+        indptr = np.zeros(rows.size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(row_position[row_of], minlength=rows.size), out=indptr[1:])
+        self.rows, self.cols = rows, cols
+
+        return CompactModel(
+            self.model.c[cols], indptr, indices, data,
+            self.row_lower[rows] * self.row_scale[rows], self.row_upper[rows] * self.row_scale[rows],
+            self.lower[cols], self.upper[cols],
+            var_names=[self.model.var_names[j] for j in cols.tolist()],
+            row_names=[self.model.row_names[i] for i in rows.tolist()],
+            minimize=self.model.minimize, offset=self.offset, integer=self.model.integer[cols],
+        )
+
+    # Postsolve
+
+    def postsolve(self, x, duals=None):
+        """
+        Reconstruye la solución del modelo original.
+
+        Parámetros:
+        - x: Solución del modelo reducido.
+        - duals: Precios sombra del modelo reducido (opcional).
+
+        Retorna:
+        - Una tupla (x, duales, costos_reducidos) del modelo original. Los duales y costos
+          reducidos son None si no se indicaron duales.
+        """
+        model = self.model
+        full_x = self.fixed_value.copy()
+        full_x[self.cols] = np.asarray(x, dtype=float)
+        if duals is None:
+            return full_x, None, None
+
+        # Duales de las filas conservadas: se desescalan y se asignan a la fila original que
+        # aporta el límite activo, que se deduce del signo del dual
+        sign = 1.0 if model.minimize else -1.0
+        y_reduced = np.asarray(duals, dtype=float) * self.row_scale[self.rows]
+        at_lower = sign * y_reduced > 0
+        sources = np.where(at_lower, self.lower_source[self.rows], self.upper_source[self.rows])
+        factors = np.where(at_lower, self.lower_factor[self.rows], self.upper_factor[self.rows])
+        full_y = np.zeros(model.num_constraints)
+        np.add.at(full_y, sources, y_reduced * factors)
+
+        # Límites de columnas que vienen de filas de una sola variable: el costo reducido de
+        # la variable pasa a ser el dual de esa fila. Se deshacen en orden inverso, porque
+        # una fila solo quedó con una variable después de fijar las demás
+        by_column = np.argsort(model.indices, kind="stable")
+        column_start = np.searchsorted(model.indices[by_column], np.arange(model.num_variables + 1))
+        for j in dict.fromkeys(reversed(self.tightened)):
+            entries = by_column[column_start[j]:column_start[j + 1]]
+            reduced_cost = model.c[j] - model.data[entries] @ full_y[self.row_of[entries]]
+            if sign * reduced_cost > 0 and j in self.column_lower_source:
+                bound, source = self.lower[j], self.column_lower_source[j]
+            elif sign * reduced_cost < 0 and j in self.column_upper_source:
+                bound, source = self.upper[j], self.column_upper_source[j]
+            else:
+                continue
+            if abs(full_x[j] - bound) <= 1e-7 * (1 + abs(bound)):
+                row, factor, coeff = source
+                full_y[row] += reduced_cost / coeff * factor
+        reduced_costs = model.c - self._transpose_times(full_y)
+        return full_x, full_y, reduced_costs
+
+    def _transpose_times(self, y):
+        return np.bincount(self.model.indices, weights=self.model.data * y[self.row_of], minlength=self.model.num_variables)
+
+
+class _Infeasible(Exception):
+    """Infactibilidad detectada durante el presolve."""
+
@@ -0,0 +1,101 @@
+import numpy as np
+
+from simplex import RevisedSimplex
+
+
+def _interval(lower, upper):
+    return float(lower), float(upper)
+
+
+def analyze(model, basis):
+    """
+    Análisis de sensibilidad de un modelo lineal a partir de su base óptima, sin volver a
+    resolverlo.
+
+    Parámetros:
+    - model: El CompactModel resuelto.
+    - basis: Base óptima como arreglo de estados ('B', 'L', 'U') de las variables seguidas
+      de las restricciones.
+
+    Retorna:
+    - Un diccionario con dos entradas:
+      - "constraints": {restricción: {"activity", "rhs", "slack", "shadow_price", "rhs_range"}}
+      - "variables": {variable: {"value", "cost", "reduced_cost", "cost_range"}}
+      Los rangos son los intervalos (inferior, superior) en los que la base actual sigue
+      siendo óptima, variando un solo coeficiente a la vez.
+    """
+    sign = 1.0 if model.minimize else -1.0
+    engine = RevisedSimplex(sign * model.c, model.indptr, model.indices, model.data,
+                            model.row_lower, model.row_upper, model.lower, model.upper)
+    if not engine.warm_start(basis):
+        raise ValueError("La base no es válida para este modelo.")
+
+    n, m = engine.n, engine.m
+    d, y = engine.reduced_costs()
+    x = engine.z[:n]
+    activity = model.activity(x)
+    xb = engine.z[engine.basic]
+    lb, ub = engine.lb[engine.basic], engine.ub[engine.basic]
+    can_increase, can_decrease = engine._movable()
+    tol = engine.pivot_tol
+
+    constraints = {}
+    for i, name in enumerate(model.row_names):
+        rhs = model.row_upper[i] if np.isfinite(model.row_upper[i]) else model.row_lower[i]
+        if engine.is_basic[n + i]:
+            # Restricción no activa: el lado derecho puede moverse hasta la actividad
+            if model.row_lower[i] == model.row_upper[i]:
+                rhs_range = _interval(activity[i], activity[i])
+            elif np.isfinite(model.row_upper[i]):
+                rhs_range = _interval(activity[i], np.inf)
+            else:
+                rhs_range = _interval(-np.inf, activity[i])
+        else:
+            # Restricción activa: x_B(Δ) = x_B + B⁻¹·e_i·Δ debe seguir dentro de sus límites
+            column = engine.Binv[:, i]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                up = np.where(column > tol, (ub - xb) / column, np.where(column < -tol, (lb - xb) / column, np.inf))
+                down = np.where(column > tol, (lb - xb) / column, np.where(column < -tol, (ub - xb) / column, -np.inf))
+            rhs_range = _interval(rhs + np.where(np.isnan(down), -np.inf, down).max(initial=-np.inf),
+                                  rhs + np.where(np.isnan(up), np.inf, up).min(initial=np.inf))
+        constraints[name] = {
+            "activity": float(activity[i]),
+            "rhs": float(rhs),
+            "slack": float(rhs - activity[i]),
+            "shadow_price": float(sign * y[i]),
+            "rhs_range": rhs_range,
+        }
+
+    position = np.full(n + m, -1)
+    position[engine.basic] = np.arange(m)
+    variables = {}
+    for j, name in enumerate(model.var_names):
+        cost = sign * model.c[j]  # Costo en forma de minimización
+        if engine.is_basic[j]:
+            # Δ en el costo cambia los costos reducidos no básicos en -Δ·α_p
+            alpha = engine.transpose_times(engine.Binv[position[j]])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = d / alpha
+            upper_limits = (can_increase & (alpha > tol)) | (can_decrease & (alpha < -tol))
+            lower_limits = (can_increase & (alpha < -tol)) | (can_decrease & (alpha > tol))
+            delta_up = ratio[upper_limits].min(initial=np.inf)
+            delta_down = ratio[lower_limits].max(initial=-np.inf)
+            low, high = cost + min(delta_down, 0.0), cost + max(delta_up, 0.0)
+        elif can_increase[j] and can_decrease[j]:
+            low, high = cost, cost  # Variable libre no básica
+        elif can_increase[j]:
+            low, high = cost - d[j], np.inf
+        elif can_decrease[j]:
+            low, high = -np.inf, cost - d[j]
+        else:
+            low, high = -np.inf, np.inf  # Variable fija
+        if sign < 0:
+            low, high = -high, -low
+        variables[name] = {
+            "value": float(x[j]),
+            "cost": float(model.c[j]),
+            "reduced_cost": float(sign * d[j]),
+            "cost_range": _interval(low, high),
+        }
+
+    return {"constraints": constraints, "variables": variables}
@@ -0,0 +1,345 @@
+import numpy as np
+
+# Códigos de estado compatibles con PuLP
+STATUS_NOT_SOLVED = 0
+STATUS_OPTIMAL = 1
+STATUS_INFEASIBLE = -1
+STATUS_UNBOUNDED = -2
+STATUS_UNDEFINED = -3
+
+# Estado de cada variable en la base
+BASIC = "B"
+AT_LOWER = "L"
+AT_UPPER = "U"
+
+
+class SimplexResult:
+    """Resultado de una resolución con el simplex revisado."""
+
+    def __init__(self, status, objective, x, activity, duals, reduced_costs, basis, iterations, warm_started):
+        self.status = status
+        self.objective = objective
+        self.x = x
+        self.activity = activity
+        self.duals = duals
+        self.reduced_costs = reduced_costs
+        self.basis = basis
+        self.iterations = iterations
+        self.warm_started = warm_started
+
+
+class RevisedSimplex:
+    """
+    Simplex revisado con variables acotadas, en memoria y sobre NumPy.
+
+    El problema min c·x s.a. row_lower <= A·x <= row_upper, lower <= x <= upper se lleva a
+    la forma computacional A·x - r = 0, donde r son las variables lógicas (actividad de
+    cada fila) con los límites de la fila. La inversa de la base se mantiene densa y se
+    actualiza en cada pivoteo; se refactoriza periódicamente para controlar el error.
+    """
+
+    refactor_frequency = 64
+    feasibility_tol = 1e-7
+    optimality_tol = 1e-9
+    pivot_tol = 1e-9
+
+    def __init__(self, c, indptr, indices, data, row_lower, row_upper, lower, upper):
+        self.n = len(c)
+        self.m = len(row_lower)
+        self.cost = np.concatenate([np.asarray(c, dtype=float), np.zeros(self.m)])
+        self.lb = np.concatenate([np.asarray(lower, dtype=float), np.asarray(row_lower, dtype=float)])
+        self.ub = np.concatenate([np.asarray(upper, dtype=float), np.asarray(row_upper, dtype=float)])
+
+        indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=float)
+        self.row_of = np.repeat(np.arange(self.m), np.diff(indptr))
+        # Copia por columnas (CSC) para extraer la columna que entra a la base
+        order = np.argsort(self.indices, kind="stable")
+        self.col_ptr = np.zeros(self.n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.indices, minlength=self.n), out=self.col_ptr[1:])
+        self.col_rows = self.row_of[order]
+        self.col_vals = self.data[order]
+
+        self.iterations = 0
+        self.updates = 0
+        self.degenerate_steps = 0
+
+    # Álgebra con la matriz [A, -I]
+
+    def column(self, k):
+        col = np.zeros(self.m)
+        if k < self.n:
+            start, end = self.col_ptr[k], self.col_ptr[k + 1]
+            np.add.at(col, self.col_rows[start:end], self.col_vals[start:end])
+        else:
+            col[k - self.n] = -1.0
+        return col
+
+    def times(self, z):
+        """Calcula [A, -I]·z."""
+        return np.bincount(self.row_of, weights=self.data * z[:self.n][self.indices], minlength=self.m) - z[self.n:]
+
+    def transpose_times(self, y):
+        """Calcula [A, -I]ᵀ·y."""
+        return np.concatenate([np.bincount(self.indices, weights=self.data * y[self.row_of], minlength=self.n), -y])
+
+    # Manejo de la base
+
+    def _nonbasic_values(self, at_upper):
+        """Valor de cada variable no básica según el límite en el que se encuentra."""
+        finite_lb, finite_ub = np.isfinite(self.lb), np.isfinite(self.ub)
+        use_ub = finite_ub & (at_upper | ~finite_lb)
+        return np.where(use_ub, self.ub, np.where(finite_lb, self.lb, 0.0))
+
+    def _factor(self):
+        """Invierte la base y recalcula los valores de las variables básicas."""
+        B = np.zeros((self.m, self.m))
+        for position, k in enumerate(self.basic):
+            B[:, position] = self.column(k)
+        try:
+            Binv = np.linalg.inv(B)
+        except np.linalg.LinAlgError:
+            return False
+        if not np.isfinite(Binv).all():
+            return False
+        self.Binv = Binv
+        nonbasic = np.where(self.is_basic, 0.0, self.z)
+        self.z[self.basic] = -self.Binv @ self.times(nonbasic)
+        self.updates = 0
+        return True
+
+    def cold_start(self):
+        """Base de holguras: todas las variables lógicas son básicas."""
+        self.basic = np.arange(self.n, self.n + self.m)
+        self.is_basic = np.zeros(self.n + self.m, dtype=bool)
+        self.is_basic[self.basic] = True
+        self.z = self._nonbasic_values(np.zeros(self.n + self.m, dtype=bool))
+        self._factor()
+
+    def warm_start(self, status):
+        """
+        Parte de una base dada como arreglo de estados ('B', 'L', 'U') de las n variables
+        estructurales seguidas de las m lógicas. Retorna False si la base no es válida.
+        """
+        status = np.asarray(status)
+        basic = np.flatnonzero(status == BASIC)
+        if status.size != self.n + self.m or basic.size != self.m:
+            return False
+        self.basic = basic
+        self.is_basic = status == BASIC
+        self.z = self._nonbasic_values(status == AT_UPPER)
+        return self._factor()
+
+    def basis_status(self):
+        status = np.full(self.n + self.m, AT_LOWER)
+        at_upper = np.isfinite(self.ub) & (self.lb < self.ub) & (np.abs(self.z - self.ub) <= self.feasibility_tol)
+        status[at_upper] = AT_UPPER
+        status[self.basic] = BASIC
+        return status
+
+    def _pivot(self, r, q, alpha, leaving_value):
+        leaving = self.basic[r]
+        row = self.Binv[r] / alpha[r]
+        self.Binv -= np.outer(alpha, row)
+        self.Binv[r] = row
+        self.basic[r] = q
+        self.is_basic[q] = True
+        self.is_basic[leaving] = False
+        self.z[leaving] = leaving_value
+        self.updates += 1
+        if self.updates >= self.refactor_frequency:
+            self._factor()
+
+    # Precios
+
+    def reduced_costs(self, phase_one_costs=None):
+        if phase_one_costs is None:
+            y = self.Binv.T @ self.cost[self.basic]
+            return self.cost - self.transpose_times(y), y
+        y = self.Binv.T @ phase_one_costs
+        return -self.transpose_times(y), y
+
+    def _movable(self):
+        nonbasic = ~self.is_basic & (self.lb < self.ub)
+        can_increase = nonbasic & (self.z < self.ub - self.feasibility_tol)
+        can_decrease = nonbasic & (self.z > self.lb + self.feasibility_tol)
+        return can_increase, can_decrease
+
+    def _choose_entering(self, d):
+        can_increase, can_decrease = self._movable()
+        gain_up = np.where(can_increase & (d < -self.optimality_tol), -d, 0.0)
+        gain_down = np.where(can_decrease & (d > self.optimality_tol), d, 0.0)
+        gain = np.maximum(gain_up, gain_down)
+        if self.degenerate_steps > 50:
+            # Regla de Bland para salir de ciclos en vértices degenerados
+            candidates = np.flatnonzero(gain > 0)
+            if candidates.size == 0:
+                return -1, 0
+            q = int(candidates[0])
+        else:
+            q = int(np.argmax(gain)) if gain.size else 0
+            if gain.size == 0 or gain[q] <= 0:
+                return -1, 0
+        return q, (1 if gain_up[q] >= gain_down[q] else -1)
+
+    def is_dual_feasible(self):
+        q, _ = self._choose_entering(self.reduced_costs()[0])
+        return q < 0
+
+    def primal_infeasibility(self):
+        xb = self.z[self.basic]
+        return np.maximum(np.maximum(self.lb[self.basic] - xb, xb - self.ub[self.basic]), 0.0)
+
+    # Simplex primal (fases 1 y 2)
+
+    def primal(self, max_iterations):
+        while self.iterations < max_iterations:
+            xb = self.z[self.basic]
+            lb, ub = self.lb[self.basic], self.ub[self.basic]
+            below = xb < lb - self.feasibility_tol
+            above = xb > ub + self.feasibility_tol
+            phase_one = bool(below.any() or above.any())
+            d, _ = self.reduced_costs(np.where(below, -1.0, np.where(above, 1.0, 0.0)) if phase_one else None)
+
+            q, direction = self._choose_entering(d)
+            if q < 0:
+                return STATUS_INFEASIBLE if phase_one else STATUS_OPTIMAL
+            alpha = self.Binv @ self.column(q)
+            delta = -direction * alpha
+
+            # Prueba del cociente de Harris: primero con límites relajados, luego el pivote más grande
+            feasible = ~below & ~above
+            dec = delta < -self.pivot_tol
+            inc = delta > self.pivot_tol
+            limit = np.full(self.m, np.inf)
+            target = np.full(self.m, np.nan)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mask = (feasible & dec & np.isfinite(lb)) | (below & inc)
+                limit[mask] = np.where(below[mask], lb[mask] - xb[mask], xb[mask] - lb[mask]) / np.abs(delta[mask])
+                target[mask] = lb[mask]
+                mask = (feasible & inc & np.isfinite(ub)) | (above & dec)
+                limit[mask] = np.where(above[mask], xb[mask] - ub[mask], ub[mask] - xb[mask]) / np.abs(delta[mask])
+                target[mask] = ub[mask]
+
+            step = np.inf
+            r = -1
+            candidates = np.flatnonzero(np.isfinite(limit))
+            if candidates.size:
+                relaxed = (np.maximum(limit[candidates], 0.0) + self.feasibility_tol / np.abs(delta[candidates])).min()
+                near = candidates[limit[candidates] <= relaxed]
+                if self.degenerate_steps > 50:
+                    r = int(near[np.argmin(self.basic[near])])
+                else:
+                    r = int(near[np.argmax(np.abs(delta[near]))])
+                step = max(limit[r], 0.0)
+
+            bound_range = self.ub[q] - self.lb[q]
+            if np.isfinite(bound_range) and bound_range <= step:
+                # La variable que entra llega a su otro límite: cambio de límite sin pivoteo
+                self.z[self.basic] += delta * bound_range
+                self.z[q] = self.ub[q] if direction > 0 else self.lb[q]
+            elif r < 0:
+                return STATUS_UNDEFINED if phase_one else STATUS_UNBOUNDED
+            else:
+                self.z[self.basic] += delta * step
+                self.z[q] += direction * step
+                self._pivot(r, q, alpha, target[r])
+
+            self.degenerate_steps = self.degenerate_steps + 1 if step <= self.feasibility_tol else 0
+            self.iterations += 1
+        return STATUS_NOT_SOLVED
+
+    # Simplex dual
+
+    def dual(self, max_iterations):
+        """
+        Simplex dual a partir de una base dual factible, por ejemplo la base óptima anterior
+        después de agregar una restricción o cambiar el lado derecho.
+        """
+        while self.iterations < max_iterations:
+            infeasibility = self.primal_infeasibility()
+            r = int(np.argmax(infeasibility)) if self.m else 0
+            if self.m == 0 or infeasibility[r] <= self.feasibility_tol:
+                return STATUS_OPTIMAL
+            leaving = self.basic[r]
+            increase = self.z[leaving] < self.lb[leaving]
+            target = self.lb[leaving] if increase else self.ub[leaving]
+
+            d, _ = self.reduced_costs()
+            alpha_r = self.transpose_times(self.Binv[r])
+            can_increase, can_decrease = self._movable()
+            sign = 1.0 if increase else -1.0
+            candidates = (can_increase & (-sign * alpha_r > self.pivot_tol)) | (can_decrease & (sign * alpha_r > self.pivot_tol))
+            candidates = np.flatnonzero(candidates)
+            if candidates.size == 0:
+                return STATUS_INFEASIBLE
+            ratios = np.abs(d[candidates]) / np.abs(alpha_r[candidates])
+            near = candidates[ratios <= ratios.min() + self.optimality_tol]
+            q = int(near[np.argmax(np.abs(alpha_r[near]))])
+
+            alpha = self.Binv @ self.column(q)
+            step = (self.z[leaving] - target) / alpha[r]
+            self.z[self.basic] -= alpha * step
+            self.z[q] += step
+            self._pivot(r, q, alpha, target)
+            self.iterations += 1
+        return STATUS_NOT_SOLVED
+
+    def solve(self, basis=None, max_iterations=None):
+        """
+        Resuelve el problema. Si se da una base válida, se parte de ella: si es primal
+        factible se continúa con el simplex primal, si es dual factible con el simplex dual
+        y en otro caso con la fase 1 del primal desde esa base.
+
+        Retorna:
+        - Una tupla (estado, warm_started).
+        """
+        if max_iterations is None:
+            max_iterations = 50 * (self.n + self.m) + 1000
+        warm_started = basis is not None and self.warm_start(basis)
+        if not warm_started:
+            self.cold_start()
+
+        if warm_started and self.primal_infeasibility().max(initial=0.0) > self.feasibility_tol and self.is_dual_feasible():
+            status = self.dual(max_iterations)
+            if status != STATUS_OPTIMAL:
+                return status, warm_started
+        return self.primal(max_iterations), warm_started
+
+
+def solve_model(model, basis=None, max_iterations=None):
+    """
+    Resuelve un CompactModel continuo con el simplex revisado, sin archivos temporales ni
+    procesos externos.
+
+    Parámetros:
+    - model: El CompactModel a resolver.
+    - basis: Base inicial opcional (arreglo de estados 'B', 'L', 'U' de las variables seguidas
+      de las restricciones), normalmente la de una resolución anterior.
+    - max_iterations: Límite de iteraciones.
+
+    Retorna:
+    - Un SimplexResult con el estado en códigos de PuLP, la solución, las actividades de las
+      filas, los precios sombra, los costos reducidos y la base final.
+    """
+    if model.is_mip():
+        raise ValueError("El simplex en memoria solo resuelve problemas continuos; use CBC para problemas enteros.")
+    sign = 1.0 if model.minimize else -1.0
+    engine = RevisedSimplex(sign * model.c, model.indptr, model.indices, model.data,
+                            model.row_lower, model.row_upper, model.lower, model.upper)
+    status, warm_started = engine.solve(basis, max_iterations)
+
+    x = engine.z[:engine.n].copy()
+    d, y = engine.reduced_costs()
+    return SimplexResult(
+        status=status,
+        objective=float(model.c @ x + model.offset) if status == STATUS_OPTIMAL else None,
+        x=x,
+        activity=model.activity(x),
+        duals=sign * y,
+        reduced_costs=sign * d[:engine.n],
+        basis=engine.basis_status(),
+        iterations=engine.iterations,
+        warm_started=warm_started,
+    )
@@ -0,0 +1,169 @@
+import contextlib
+import time
+import warnings
+
+# Estados de una resolución que no terminó con un estado de PuLP
+CANCELLED = "cancelled"
+FAILED = "failed"
+
+# Funciones que reciben cada RunStats (por ejemplo, para exportarlo a un sistema de métricas)
+_hooks = []
+
+# Etiquetas de las métricas para mostrarlas en las páginas
+LABELS = {
+    "backend": "Solver",
+    "status": "Estado",
+    "parse_time": "Interpretación del modelo",
+    "build_time": "Construcción del modelo",
+    "presolve_time": "Presolve",
+    "io_time": "Escritura para el solver",
+    "solve_time": "Resolución",
+    "readback_time": "Lectura de la solución",
+    "total_time": "Total de la resolución",
+    "num_variables": "Variables",
+    "num_constraints": "Restricciones",
+    "nonzeros": "Coeficientes no nulos",
+    "iterations": "Iteraciones",
+    "nodes": "Nodos",
+}
+
+
+class RunStats:
+    """
+    Métricas de una resolución de LinearProgrammingSolver o ResourceAssignmentSolver.
+
+    Atributos:
+    - solver: 'lp' o 'assignment'.
+    - backend: 'cbc', 'simplex' o 'combinatorial'.
+    - presolve: Si se aplicó el presolve.
+    - status: Estado de PuLP al terminar, o CANCELLED / FAILED si la resolución se canceló
+      o lanzó un error.
+    - parse_time: Segundos en interpretar el modelo (expresiones en texto o la matriz de
+      costos) desde la resolución anterior, o desde que se creó el solver.
+    - build_time: Segundos en construir el modelo (objetos de PuLP, CompactModel) desde la
+      resolución anterior, incluida la construcción hecha durante esta resolución.
+    - presolve_time: Segundos del presolve (None si no se aplicó).
+    - io_time: Segundos en escribir el modelo y la base para el solver externo.
+    - solve_time: Segundos (tiempo real) del solver.
+    - readback_time: Segundos en leer la solución de vuelta al modelo.
+    - total_time: Segundos totales de solve().
+    - num_variables, num_constraints, nonzeros: Tamaño del modelo resuelto.
+    - iterations: Iteraciones del simplex (None si el solver no las informa).
+    - nodes: Nodos del árbol de ramificación de CBC (None en los problemas continuos).
+    """
+
+    FIELDS = (
+        "solver", "backend", "presolve", "status",
+        "parse_time", "build_time", "presolve_time", "io_time", "solve_time", "readback_time", "total_time",
+        "num_variables", "num_constraints", "nonzeros", "iterations", "nodes",
+    )
+
+    def __init__(self, solver, backend, presolve=False, parse_time=0.0, build_time=0.0):
+        self.solver = solver
+        self.backend = backend
+        self.presolve = presolve
+        self.status = None
+        self.parse_time = parse_time
+        self.build_time = build_time
+        self.presolve_time = None
+        self.io_time = 0.0
+        self.solve_time = 0.0
+        self.readback_time = 0.0
+        self.total_time = 0.0
+        self.num_variables = None
+        self.num_constraints = None
+        self.nonzeros = None
+        self.iterations = None
+        self.nodes = None
+        self._start = time.perf_counter()
+
+    def timed(self, field):
+        """Context manager que suma a field los segundos del bloque que envuelve."""
+        return timed(self.__dict__, field)
+
+    def set_size(self, num_variables, num_constraints, nonzeros):
+        self.num_variables = int(num_variables)
+        self.num_constraints = int(num_constraints)
+        self.nonzeros = int(nonzeros)
+
+    def add_mip_result(self, result):
+        """Suma los tiempos, iteraciones y nodos de un mip.MipResult."""
+        self.io_time += result.write_time or 0.0
+        self.solve_time += result.solve_time or 0.0
+        self.readback_time += result.read_time or 0.0
+        self.iterations = (self.iterations or 0) + (result.iterations or 0)
+        if result.nodes is not None:
+            self.nodes = (self.nodes or 0) + result.nodes
+
+    def finish(self, status):
+        """Cierra la medición y publica las métricas en los hooks registrados."""
+        self.status = status
+        self.total_time = time.perf_counter() - self._start
+        publish(self)
+        return self
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self):
+        return "RunStats(" + ", ".join(f"{field}={getattr(self, field)!r}" for field in self.FIELDS) + ")"
+
+
+def summary_rows(run_stats):
+    """
+    Filas {"Métrica", "Valor"} para mostrar un RunStats (o su as_dict()) como tabla; los
+    tiempos se dan en milisegundos y se omiten las métricas que no aplican.
+    """
+    values = run_stats.as_dict() if isinstance(run_stats, RunStats) else run_stats
+    rows = []
+    for field, label in LABELS.items():
+        value = values.get(field)
+        if value is None:
+            continue
+        if field.endswith("_time"):
+            value = f"{value * 1000:.1f} ms"
+        rows.append({"Métrica": label, "Valor": str(value)})
+    return rows
+
+
+def take_model_times(model_times):
+    """
+    Retorna (interpretación, construcción) de un diccionario model_times de un solver y
+    los pone en cero, para que cada resolución informe solo el tiempo nuevo.
+    """
+    times = model_times["parse"], model_times["build"]
+    model_times.update(parse=0.0, build=0.0)
+    return times
+
+
+@contextlib.contextmanager
+def timed(totals, key):
+    """Suma a totals[key] los segundos del bloque que envuelve."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        totals[key] += time.perf_counter() - start
+
+
+def add_hook(hook):
+    """
+    Registra hook(run_stats), que se llama al terminar cada resolución de cualquier solver
+    del proceso, por ejemplo para enviar las métricas a un sistema de monitoreo.
+    """
+    if hook not in _hooks:
+        _hooks.append(hook)
+
+
+def remove_hook(hook):
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def publish(run_stats):
+    # Un error al exportar métricas no debe hacer fallar la resolución
+    for hook in list(_hooks):
+        try:
+            hook(run_stats)
+        except Exception as e:
+            warnings.warn(f"Error en el hook de métricas {hook!r}: {e}", RuntimeWarning)
@@ -0,0 +1,29 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Los módulos del proyecto viven en la raíz del repositorio
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from compact import CompactModel  # noqa: E402
+
+
+def dense_model(A, row_lower, row_upper, c, lower=0.0, upper=np.inf, minimize=True):
+    """CompactModel a partir de una matriz densa, para armar casos pequeños."""
+    A = np.atleast_2d(np.asarray(A, dtype=float))
+    m, n = A.shape
+    rows, cols = np.nonzero(A)
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=m))])
+    return CompactModel(
+        c, indptr, cols, A[rows, cols], np.broadcast_to(np.asarray(row_lower, dtype=float), m).copy(),
+        np.broadcast_to(np.asarray(row_upper, dtype=float), m).copy(),
+        np.broadcast_to(np.asarray(lower, dtype=float), n).copy(), np.broadcast_to(np.asarray(upper, dtype=float), n).copy(),
+        minimize=minimize,
+    )
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(20240601)
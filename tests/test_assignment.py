@@ -0,0 +1,107 @@
+import itertools
+
+import numpy as np
+import pytest
+
+import assignment
+
+
+def brute_force(cost, resources_per_task, tasks_per_resource):
+    """Menor costo entre todas las matrices binarias que cumplen las capacidades (None si no hay)."""
+    n, m = cost.shape
+    best = None
+    for bits in itertools.product((0, 1), repeat=n * m):
+        x = np.array(bits).reshape(n, m)
+        if np.any(x & np.isinf(cost)):
+            continue
+        if np.any(x.sum(axis=0) != resources_per_task) or np.any(x.sum(axis=1) > tasks_per_resource):
+            continue
+        total = float(np.where(x == 1, cost, 0.0).sum())
+        best = total if best is None else min(best, total)
+    return best
+
+
+def check_solution(cost, rows, cols, resources_per_task, tasks_per_resource):
+    assert np.isfinite(cost[rows, cols]).all()
+    assert np.all(np.bincount(cols, minlength=cost.shape[1]) == resources_per_task)
+    assert np.all(np.bincount(rows, minlength=cost.shape[0]) <= tasks_per_resource)
+    assert len(set(zip(rows.tolist(), cols.tolist()))) == rows.size
+
+
+@pytest.mark.parametrize("shape", [(3, 3), (3, 5), (1, 4)])
+def test_hungarian_matches_permutations(rng, shape):
+    for _ in range(10):
+        cost = rng.integers(0, 20, shape).astype(float)
+        rows, cols = assignment._hungarian(cost)
+        best = min(cost[np.arange(shape[0]), list(p)].sum() for p in itertools.permutations(range(shape[1]), shape[0]))
+        assert sorted(rows.tolist()) == list(range(shape[0]))
+        assert len(set(cols.tolist())) == shape[0]
+        assert cost[rows, cols].sum() == best
+
+
+def test_hungarian_forbidden_pairs():
+    cost = np.array([[1.0, np.inf], [np.inf, 2.0]])
+    rows, cols = assignment._hungarian(cost)
+    assert cost[rows, cols].sum() == 3.0
+    assert assignment._hungarian(np.array([[np.inf, 1.0], [np.inf, 2.0]])) is None
+
+
+@pytest.mark.parametrize("resources_per_task, tasks_per_resource", [(2, 2), (2, 3), (3, 2)])
+def test_min_cost_flow_matches_brute_force(rng, resources_per_task, tasks_per_resource):
+    for _ in range(5):
+        cost = rng.integers(1, 10, (4, 3)).astype(float)
+        cost[rng.random(cost.shape) < 0.15] = np.inf
+        expected = brute_force(cost, resources_per_task, tasks_per_resource)
+        result = assignment.min_cost_flow_assignment(cost, resources_per_task, tasks_per_resource)
+        if expected is None:
+            assert result is None
+            continue
+        rows, cols = (np.asarray(a) for a in result)
+        check_solution(cost, rows, cols, resources_per_task, tasks_per_resource)
+        assert cost[rows, cols].sum() == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("resources_per_task, tasks_per_resource", [(1, 1), (1, 2), (2, 1), (2, 2)])
+def test_solve_assignment_matches_brute_force(rng, resources_per_task, tasks_per_resource):
+    for _ in range(5):
+        cost = rng.integers(1, 10, (4, 3)).astype(float)
+        cost[rng.random(cost.shape) < 0.1] = np.inf
+        expected = brute_force(cost, resources_per_task, tasks_per_resource)
+        status, objective, rows, cols = assignment.solve_assignment(cost, resources_per_task, tasks_per_resource)
+        if expected is None:
+            assert status == assignment.STATUS_INFEASIBLE
+            continue
+        assert status == assignment.STATUS_OPTIMAL
+        check_solution(cost, rows, cols, resources_per_task, tasks_per_resource)
+        assert objective == pytest.approx(expected)
+
+
+def test_zero_resources_per_task_is_feasible_with_forbidden_columns():
+    cost = np.array([[1.0, np.inf, 3.0], [4.0, np.inf, 2.0]])
+    rows, cols = assignment.min_cost_flow_assignment(cost, 0, 2)
+    assert rows.size == cols.size == 0
+    for tasks_per_resource in (1, 2):
+        status, objective, rows, cols = assignment.solve_assignment(cost, 0, tasks_per_resource)
+        assert status == assignment.STATUS_OPTIMAL
+        assert objective == 0.0 and rows.size == 0
+
+
+def test_large_capacity_is_capped(rng):
+    cost = rng.random((40, 5))
+    capped = assignment.solve_assignment(cost, tasks_per_resource=100000)
+    reference = assignment.solve_assignment(cost, tasks_per_resource=40)
+    assert capped[0] == assignment.STATUS_OPTIMAL
+    assert capped[1] == pytest.approx(reference[1])
+
+
+@pytest.mark.parametrize("capacity", [1.5, -1, "x", None])
+def test_invalid_capacity_raises(capacity):
+    with pytest.raises(ValueError):
+        assignment.solve_assignment(np.ones((2, 2)), tasks_per_resource=capacity)
+    with pytest.raises(ValueError):
+        assignment.solve_assignment(np.ones((2, 2)), resources_per_task=capacity)
+
+
+def test_more_demand_than_capacity_is_infeasible():
+    status, objective, rows, cols = assignment.solve_assignment(np.ones((2, 3)), 1, 1)
+    assert status == assignment.STATUS_INFEASIBLE and objective is None
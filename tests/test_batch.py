@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from models import LinearProgrammingSolver, ResourceAssignmentSolver
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_invalid_assignment_scenario_keeps_the_others(workers):
+    solver = ResourceAssignmentSolver(np.array([[1.0, 2, 3], [4, 1, 2], [3, 3, 1]]))
+    scenarios = [{"costs": {(0, 0): 5.0}}, {"costs": {(0, 7): 1.0}}, {"costs": {(1, 1): 9.0}}]
+    result = solver.solve_batch(scenarios, workers=workers)
+    assert result.statuses.tolist() == [1, 0, 1]
+    assert result.objectives[0] == pytest.approx(7.0) and result.objectives[2] == pytest.approx(6.0)
+    assert np.isnan(result.objectives[1])
+    assert result.errors[0] is None and result.errors[2] is None
+    assert "(0, 7)" in result.errors[1]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_invalid_lp_scenario_keeps_the_others(workers):
+    solver = LinearProgrammingSolver(minimize=False)
+    solver.add_function("3x + 2y", low_bound=0)
+    solver.set_objective()
+    solver.add_constraint("x + y", "<=", "4")
+    result = solver.solve_batch([{"c": {"x": 1}}, {"c": {"zz": 1}}, {"rhs": {"Restriccion_0": 2}}], workers=workers)
+    assert result.statuses.tolist() == [1, 0, 1]
+    assert result.objectives[0] == pytest.approx(8.0) and result.objectives[2] == pytest.approx(6.0)
+    assert "zz" in result.errors[1]
@@ -0,0 +1,33 @@
+import os
+
+import numpy as np
+
+from cache import SolveCache
+
+
+def test_entries_round_trip_as_json(tmp_path):
+    entry = {"status": 1, "objective": np.float64(2.5), "figure": b"\x89PNG\x00",
+             "range": (0.0, np.inf), "solution": {"x": 1.0}, "counts": np.arange(3)}
+    SolveCache(directory=str(tmp_path)).put("k", entry)
+    assert os.listdir(tmp_path) == ["k.json"]
+
+    loaded = SolveCache(directory=str(tmp_path)).get("k")
+    assert loaded["figure"] == b"\x89PNG\x00"
+    assert loaded["range"] == [0.0, np.inf]
+    assert loaded["objective"] == 2.5 and loaded["counts"] == [0, 1, 2]
+
+
+def test_memory_and_disk_limits(tmp_path):
+    cache = SolveCache(max_entries=2, directory=str(tmp_path), max_disk_entries=3)
+    for i in range(5):
+        cache.put(f"k{i}", {"i": i})
+    assert len(cache) == 2
+    assert sorted(os.listdir(tmp_path)) == ["k2.json", "k3.json", "k4.json"]
+    assert cache.disk_size == sum(os.path.getsize(tmp_path / name) for name in os.listdir(tmp_path))
+    assert cache.get("k0") is None and cache.get("k2") == {"i": 2}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_damaged_file_is_a_miss(tmp_path):
+    (tmp_path / "k.json").write_bytes(b"\x80\x04not json")
+    assert SolveCache(directory=str(tmp_path)).get("k") is None
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from cpm import ProjectNetwork
+
+
+def edges(network):
+    sources = np.repeat(np.arange(network.num_activities), np.diff(network.succ_indptr))
+    return sources, network.succ_indices
+
+
+def assert_matches_rebuild(network):
+    fresh = ProjectNetwork(network.durations, *edges(network), names=network.names)
+    np.testing.assert_allclose(network.earliest_start, fresh.earliest_start)
+    np.testing.assert_allclose(network.earliest_finish, fresh.earliest_finish)
+    np.testing.assert_allclose(network.latest_finish, fresh.latest_finish)
+    np.testing.assert_allclose(network.total_float, fresh.total_float)
+    np.testing.assert_allclose(network.free_float, fresh.free_float)
+    assert network.project_duration == pytest.approx(fresh.project_duration)
+
+
+def test_small_network():
+    # A(3) -> B(2) -> D(4); A -> C(5) -> D
+    network = ProjectNetwork([3, 2, 5, 4], [0, 0, 1, 2], [1, 2, 3, 3], names=["A", "B", "C", "D"])
+    assert network.project_duration == 12
+    assert [network.names[i] for i in network.critical_path()] == ["A", "C", "D"]
+    assert network.activity("B")["total_float"] == 3
+
+
+def test_incremental_updates_match_rebuild(rng):
+    n = 40
+    sources = rng.integers(0, n - 1, 80)
+    targets = sources + rng.integers(1, 6, 80)
+    keep = targets < n
+    network = ProjectNetwork(rng.integers(1, 10, n), sources[keep], targets[keep])
+    for _ in range(60):
+        action = rng.integers(3)
+        u, v = sorted(rng.choice(n, 2, replace=False).tolist())
+        if action == 0:
+            network.set_duration(u, float(rng.integers(0, 12)))
+        elif action == 1:
+            network.add_dependency(u, v)
+        elif v in network.successors(u):
+            network.remove_dependency(u, v)
+        assert_matches_rebuild(network)
+
+
+def test_cycles_are_rejected():
+    network = ProjectNetwork([1, 1, 1], [0, 1], [1, 2])
+    with pytest.raises(ValueError):
+        network.add_dependency(2, 0)
+    with pytest.raises(ValueError):
+        ProjectNetwork([1, 1], [0, 1], [1, 0])
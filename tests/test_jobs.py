@@ -0,0 +1,81 @@
+import threading
+
+import pytest
+
+import jobs
+import mip
+
+
+@pytest.fixture
+def manager():
+    manager = jobs.JobManager(max_workers=1)
+    yield manager
+    manager.executor.shutdown(wait=True, cancel_futures=True)
+
+
+def blocking(started, release):
+    """Función de trabajo que espera a release; si se cancela, termina como lo haría CBC."""
+    def run(job):
+        started.set()
+        release.wait(5)
+        if job.token.cancelled:
+            raise mip.SolveCancelled()
+        return "listo"
+    return run
+
+
+def test_done_and_failed(manager):
+    job, is_new = manager.submit("a", lambda job: 42)
+    job.future.result()
+    assert is_new and job.status == jobs.DONE and job.done() and job.result == 42
+
+    job, _ = manager.submit("b", lambda job: 1 / 0)
+    job.future.result()
+    assert job.status == jobs.FAILED and isinstance(job.error, ZeroDivisionError)
+
+
+def test_cancel_after_finish_keeps_status(manager):
+    job, _ = manager.submit("a", lambda job: 42)
+    job.future.result()
+    job.cancel()
+    assert job.status == jobs.DONE and not job.token.cancelled
+
+
+def test_cancelling_job_is_not_done_until_it_returns(manager):
+    started, release = threading.Event(), threading.Event()
+    job, _ = manager.submit("a", blocking(started, release))
+    assert started.wait(5)
+    assert job.status == jobs.RUNNING
+
+    job.cancel()
+    assert job.status == jobs.CANCELLING
+    assert not job.done()
+    # Mientras sigue en ejecución no se olvida ni se reemplaza por otro trabajo
+    manager.forget(job)
+    assert manager.get("a") is job
+    again, is_new = manager.submit("a", lambda job: None)
+    assert again is job and not is_new
+
+    release.set()
+    job.future.result()
+    assert job.status == jobs.CANCELLED and job.done() and job.result is None
+    manager.forget(job)
+    assert manager.get("a") is None
+
+
+def test_cancel_queued_job(manager):
+    started, release = threading.Event(), threading.Event()
+    running, _ = manager.submit("a", blocking(started, release))
+    assert started.wait(5)
+    queued, _ = manager.submit("b", lambda job: "nunca")
+    assert queued.status == jobs.QUEUED
+
+    queued.cancel()
+    assert queued.status == jobs.CANCELLED and queued.done()
+    release.set()
+    running.future.result()
+    assert running.status == jobs.DONE and queued.result is None
+
+
+def test_labels_cover_unfinished_states():
+    assert set(jobs.LABELS) == {jobs.QUEUED, jobs.RUNNING, jobs.CANCELLING}
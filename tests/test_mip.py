@@ -0,0 +1,146 @@
+import sys
+import time
+
+import numpy as np
+import pytest
+from pulp import PULP_CBC_CMD, LpMaximize, LpProblem, LpSolutionOptimal, LpVariable, lpSum
+
+import mip
+
+# Registros de CBC tal como los escribe (valores en su sentido de minimización interno)
+GAP_STOP_ROOT = """\
+Cbc0012I Integer solution of -1507 found by feasibility pump after 0 iterations and 0 nodes (0.02 seconds)
+Cbc0011I Exiting as integer gap of 37.84118 less than 1e-10 or 5%
+Cbc0001I Search completed - best objective -1507, took 0 iterations and 0 nodes (0.02 seconds)
+Result - Optimal solution found (within gap tolerance)
+
+Objective value:                1507.00000000
+Upper bound:                    1544.841
+Gap:                            -0.02
+Enumerated nodes:               0
+Total iterations:               0
+"""
+
+GAP_STOP_TREE = """\
+Cbc0012I Integer solution of -700 found by greedy cover after 0 iterations and 0 nodes (0.01 seconds)
+Cbc0010I After 0 nodes, 1 on tree, -700 best solution, best possible -757.65 (0.03 seconds)
+Cbc0012I Integer solution of -722 found by DiveCoefficient after 120 iterations and 14 nodes (0.05 seconds)
+Cbc0011I Exiting as integer gap of 35.648458 less than 1e-10 or 5%
+Cbc0001I Search completed - best objective -722, took 130 iterations and 14 nodes (0.05 seconds)
+Result - Optimal solution found (within gap tolerance)
+"""
+
+COMPLETED = """\
+Cbc0010I After 0 nodes, 1 on tree, -1507 best solution, best possible -1538.4281 (0.02 seconds)
+Cbc0012I Integer solution of -1518 found by rounding after 2456 iterations and 142 nodes (0.20 seconds)
+Cbc0001I Search completed - best objective -1518, took 2978 iterations and 192 nodes (0.24 seconds)
+Result - Optimal solution found
+
+Objective value:                1518.00000000
+Enumerated nodes:               192
+Total iterations:               2978
+"""
+
+TIME_LIMIT = """\
+Cbc0012I Integer solution of -2547 found by rounding after 30000 iterations and 5600 nodes (0.90 seconds)
+Cbc0020I Exiting on maximum time
+Cbc0005I Partial search - best objective -2547 (best possible -2567.0265), took 30692 iterations and 5729 nodes (1.00 seconds)
+Result - Stopped on time limit
+
+Objective value:                2547.00000000
+Upper bound:                    2567.026
+Gap:                            -0.01
+"""
+
+
+def run_log(log, tmp_path, sign=1.0, offset=0.0):
+    """Pasa un registro por mip._search con un proceso que lo imprime y arma el MipResult."""
+    solution = tmp_path / "solution.sol"
+    solution.write_text("")
+    start = time.perf_counter()
+    search = mip._search([sys.executable, "-c", f"import sys; sys.stdout.write({log!r})"],
+                         sign, offset, start, str(solution), None)
+    incumbents = []
+    try:
+        while True:
+            incumbents.append(next(search))
+    except StopIteration as stop:
+        found = stop.value
+    objective = incumbents[-1].objective
+    # CBC marca la solución como Optimal también cuando se detiene por la brecha
+    return mip._result(1, LpSolutionOptimal, objective, found, start, 0.0, time.perf_counter(), 0.0)
+
+
+def test_gap_stop_at_root_is_not_proven(tmp_path):
+    result = run_log(GAP_STOP_ROOT, tmp_path, sign=-1.0)
+    assert result.objective == 1507
+    assert result.bound == pytest.approx(1544.841)
+    assert result.gap == pytest.approx(37.841 / 1507, rel=1e-3)
+    assert not result.proven_optimal
+
+
+def test_gap_stop_keeps_best_possible(tmp_path):
+    result = run_log(GAP_STOP_TREE, tmp_path)
+    assert result.objective == -722
+    assert result.bound == pytest.approx(-757.65)
+    assert result.gap > 0.04
+    assert not result.proven_optimal
+    assert [incumbent.objective for incumbent in result.incumbents] == [-700, -722]
+    assert result.incumbents[1].bound == pytest.approx(-757.65)
+
+
+def test_completed_search_is_proven(tmp_path):
+    result = run_log(COMPLETED, tmp_path, sign=-1.0)
+    assert result.proven_optimal
+    assert result.objective == result.bound == 1518
+    assert result.gap == 0.0
+    assert result.nodes == 192
+    assert result.iterations == 2978
+
+
+def test_time_limit_keeps_bound_with_offset(tmp_path):
+    result = run_log(TIME_LIMIT, tmp_path, sign=-1.0, offset=7.0)
+    assert result.objective == 2547 + 7
+    assert result.bound == pytest.approx(2567.026 + 7)
+    assert not result.proven_optimal
+
+
+def test_relative_gap():
+    assert mip.relative_gap(None, 1.0) is None
+    assert mip.relative_gap(100.0, 90.0) == pytest.approx(0.1)
+    assert mip.relative_gap(0.0, 0.0) == 0.0
+
+
+def test_cancelled_before_start_raises():
+    token = mip.CancelToken()
+    token.cancel()
+    problem = LpProblem("p", LpMaximize)
+    x = LpVariable("x", 0, 1, cat="Binary")
+    problem += x
+    with pytest.raises(mip.SolveCancelled):
+        mip.solve(problem, cancel=token)
+
+
+def knapsack():
+    rng = np.random.default_rng(3)
+    n = 60
+    values = rng.integers(10, 100, n)
+    problem = LpProblem("knapsack", LpMaximize)
+    x = [LpVariable(f"x{i}", cat="Binary") for i in range(n)]
+    problem += lpSum(int(values[i]) * x[i] for i in range(n))
+    for _ in range(5):
+        weights = rng.integers(10, 100, n)
+        problem += lpSum(int(weights[i]) * x[i] for i in range(n)) <= int(weights.sum() * 0.3)
+    return problem
+
+
+@pytest.mark.skipif(not PULP_CBC_CMD().available(), reason="CBC no está disponible")
+def test_cbc_gap_limit_against_full_search():
+    limited = mip.solve(knapsack(), gap_rel=0.05)
+    full = mip.solve(knapsack())
+    assert full.proven_optimal and full.gap == 0.0
+    assert limited.status == 1
+    assert limited.bound >= full.objective - 1e-6  # Cota superior válida de un máximo
+    if limited.objective < full.objective:
+        assert not limited.proven_optimal
+        assert limited.gap > 0
@@ -0,0 +1,46 @@
+import io
+
+import numpy as np
+
+import modelfile
+from conftest import dense_model
+
+
+def sample():
+    model = dense_model([[1, 2, 0], [0, 1, -1]], [-np.inf, 1], [4, np.inf], [1, -2, 3], lower=[0, -np.inf, 1], upper=[5, 2, np.inf])
+    model.var_names = ["x", "y", "z"]
+    model.integer[2] = True
+    solution = {"status": 1, "objective": -2.5, "x": np.array([0.0, 1.5, 1.0]),
+                "duals": np.array([0.5, 0.0]), "reduced_costs": np.array([1.0, 0.0, 3.0])}
+    return modelfile.ModelFile(model, {"solver": "lp", "opciones": {"presolve": True}}, solution,
+                               ["L", "B", "L", "B", "L"], {"extra": np.arange(4)})
+
+
+def assert_same(loaded, original):
+    for name in ("c", "indptr", "indices", "data", "row_lower", "row_upper", "lower", "upper", "integer"):
+        np.testing.assert_array_equal(getattr(loaded.model, name), getattr(original.model, name))
+    assert loaded.model.var_names == original.model.var_names
+    assert loaded.model.row_names == original.model.row_names
+    assert loaded.model.minimize == original.model.minimize
+    assert loaded.metadata == original.metadata
+    assert list(loaded.basis) == original.basis
+    assert loaded.solution["objective"] == original.solution["objective"]
+    np.testing.assert_array_equal(loaded.solution["x"], original.solution["x"])
+    np.testing.assert_array_equal(loaded.arrays["extra"], original.arrays["extra"])
+
+
+def test_round_trip_through_a_file(tmp_path):
+    original = sample()
+    path = tmp_path / "model.lpmodel"
+    modelfile.save(str(path), original)
+    assert_same(modelfile.load(str(path)), original)
+    assert_same(modelfile.load(str(path), mmap=False), original)
+
+
+def test_round_trip_through_bytes_and_streams():
+    original = sample()
+    assert_same(modelfile.loads(modelfile.dumps(original)), original)
+    stream = io.BytesIO()
+    modelfile.save(stream, original)
+    stream.seek(0)
+    assert_same(modelfile.load(stream), original)
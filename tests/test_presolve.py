@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+import simplex
+from conftest import dense_model
+from presolve import Presolve
+
+
+def solve_presolved(model):
+    reduction = Presolve(model)
+    assert reduction.status is None
+    result = simplex.solve_model(reduction.reduced)
+    assert result.status == simplex.STATUS_OPTIMAL
+    return reduction, reduction.postsolve(result.x, result.duals)
+
+
+def test_reductions_keep_the_optimum():
+    # x0 fija, fila 1 con una sola variable, filas 2 y 3 proporcionales, fila 4 redundante
+    A = [
+        [1, 1, 1, 0],
+        [0, 2, 0, 0],
+        [0, 1, 1, 1],
+        [0, 2, 2, 2],
+        [0, 0, 1, 1],
+    ]
+    row_lower = [-np.inf, -np.inf, 1, 1, -np.inf]
+    row_upper = [6, 4, 5, 8, 100]
+    c = [1, -2, -1, -3]
+    model = dense_model(A, row_lower, row_upper, c, lower=[1, 0, 0, 0], upper=[1, 10, 10, 10])
+    direct = simplex.solve_model(model)
+
+    reduction, (x, duals, reduced_costs) = solve_presolved(model)
+    report = reduction.report
+    assert report["fixed_columns"] >= 1
+    assert report["singleton_rows"] >= 1
+    assert report["duplicate_rows"] >= 1
+    assert report["redundant_rows"] >= 1
+    assert reduction.reduced.num_constraints < model.num_constraints
+
+    assert model.c @ x + model.offset == pytest.approx(direct.objective)
+    activity = model.activity(x)
+    assert np.all(activity <= model.row_upper + 1e-7) and np.all(activity >= model.row_lower - 1e-7)
+    # Los duales reconstruidos explican el costo de cada variable
+    np.testing.assert_allclose(reduced_costs, model.c - activity_transpose(model, duals), atol=1e-9)
+    assert duals @ activity + reduced_costs @ x == pytest.approx(model.c @ x)
+
+
+def activity_transpose(model, y):
+    return np.bincount(model.indices, weights=model.data * y[model.row_index], minlength=model.num_variables)
+
+
+def test_matches_direct_solve_on_random_models(rng):
+    for _ in range(20):
+        A = rng.integers(-2, 4, (6, 5)).astype(float)
+        A[rng.random(A.shape) < 0.5] = 0.0
+        activity = A.sum(axis=1)
+        model = dense_model(A, activity - 3, activity + rng.integers(0, 4, 6), rng.integers(-4, 5, 5), 0.0, 3.0)
+        direct = simplex.solve_model(model)
+        reduction = Presolve(model)
+        if reduction.status is not None:
+            assert direct.status == simplex.STATUS_INFEASIBLE
+            continue
+        result = simplex.solve_model(reduction.reduced)
+        assert result.status == direct.status
+        if direct.status == simplex.STATUS_OPTIMAL:
+            x, _, _ = reduction.postsolve(result.x)
+            assert model.c @ x + model.offset == pytest.approx(direct.objective)
+
+
+def test_detects_conflicting_singleton_rows():
+    model = dense_model([[1, 0], [2, 0], [1, 1]], [3, -np.inf, 0], [np.inf, 4, 10], [1, 1])
+    reduction = Presolve(model)
+    assert reduction.status == simplex.STATUS_INFEASIBLE
+    assert reduction.reduced is None
+
+
+def test_maximization_postsolve():
+    model = dense_model([[1, 1], [1, 0]], -np.inf, [4, 3], [3, 2], minimize=False)
+    reduction, (x, duals, _) = solve_presolved(model)
+    np.testing.assert_allclose(x, [3, 1])
+    assert model.c @ x == pytest.approx(11)
+    np.testing.assert_allclose(duals, [2, 1])
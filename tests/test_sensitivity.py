@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+import sensitivity
+import simplex
+from conftest import dense_model
+
+
+def test_ranges_of_a_small_lp():
+    # max 3x + 2y  s.a.  x + y <= 4,  x <= 3,  x, y >= 0  (óptimo en x = 3, y = 1)
+    model = dense_model([[1, 1], [1, 0]], -np.inf, [4, 3], [3, 2], minimize=False)
+    result = simplex.solve_model(model)
+    analysis = sensitivity.analyze(model, result.basis)
+
+    total, cap = analysis["constraints"]["Restriccion_0"], analysis["constraints"]["Restriccion_1"]
+    assert total["shadow_price"] == pytest.approx(2.0)
+    assert cap["shadow_price"] == pytest.approx(1.0)
+    # Hacia arriba el lado derecho de x + y <= 4 no tiene límite: el rango queda infinito
+    assert total["rhs_range"][0] == pytest.approx(3.0) and total["rhs_range"][1] == np.inf
+    assert cap["rhs_range"] == pytest.approx((0.0, 4.0))
+
+    x, y = analysis["variables"]["x_0"], analysis["variables"]["x_1"]
+    assert x["value"] == pytest.approx(3.0) and y["value"] == pytest.approx(1.0)
+    assert x["cost_range"][0] == pytest.approx(2.0) and x["cost_range"][1] == np.inf
+    assert y["cost_range"] == pytest.approx((0.0, 3.0))
+
+
+def test_invalid_basis_raises():
+    model = dense_model([[1, 1]], -np.inf, 4, [1, 1])
+    with pytest.raises(ValueError):
+        sensitivity.analyze(model, np.array(["L", "L", "L"]))
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+import simplex
+from conftest import dense_model
+
+linprog = pytest.importorskip("scipy.optimize").linprog
+
+
+def random_lp(rng, m=6, n=5):
+    """LP acotado y factible: x = 1 cumple todas las filas."""
+    A = rng.integers(-3, 6, (m, n)).astype(float)
+    activity = A.sum(axis=1)
+    row_lower = np.where(rng.random(m) < 0.3, activity - rng.integers(1, 5, m), -np.inf)
+    row_upper = activity + rng.integers(0, 5, m)
+    c = rng.integers(-5, 6, n).astype(float)
+    return A, row_lower, row_upper, c
+
+
+def reference(A, row_lower, row_upper, c, lower, upper, minimize=True):
+    finite_lower = np.isfinite(row_lower)
+    A_ub = np.vstack([A, -A[finite_lower]])
+    b_ub = np.concatenate([row_upper, -row_lower[finite_lower]])
+    sign = 1.0 if minimize else -1.0
+    result = linprog(sign * c, A_ub=A_ub, b_ub=b_ub, bounds=list(zip(lower, upper)), method="highs")
+    return result.status, sign * result.fun if result.status == 0 else None
+
+
+@pytest.mark.parametrize("minimize", [True, False])
+def test_matches_scipy_on_bounded_lps(rng, minimize):
+    for _ in range(20):
+        A, row_lower, row_upper, c = random_lp(rng)
+        lower = np.zeros(c.size)
+        upper = rng.integers(2, 6, c.size).astype(float)
+        model = dense_model(A, row_lower, row_upper, c, lower, upper, minimize=minimize)
+        result = simplex.solve_model(model)
+        status, objective = reference(A, row_lower, row_upper, c, lower, upper, minimize)
+        assert status == 0
+        assert result.status == simplex.STATUS_OPTIMAL
+        assert result.objective == pytest.approx(objective, abs=1e-7)
+        assert np.all(result.activity <= row_upper + 1e-7) and np.all(result.activity >= row_lower - 1e-7)
+        assert np.all(result.x >= lower - 1e-9) and np.all(result.x <= upper + 1e-9)
+
+
+def test_duals_give_the_objective():
+    # min -3x - 2y  s.a.  x + y <= 4,  x + 3y <= 6,  x <= 3  (óptimo en x = 3, y = 1)
+    model = dense_model([[1, 1], [1, 3]], -np.inf, [4, 6], [-3, -2], upper=[3, np.inf])
+    result = simplex.solve_model(model)
+    assert result.status == simplex.STATUS_OPTIMAL
+    assert result.objective == pytest.approx(-11)
+    np.testing.assert_allclose(result.x, [3, 1])
+    # Dualidad fuerte: c·x = y·b + d·x para la base óptima
+    assert result.duals @ result.activity + result.reduced_costs @ result.x == pytest.approx(result.objective)
+
+
+def test_infeasible_and_unbounded():
+    infeasible = dense_model([[1, 1]], 5, np.inf, [1, 1], upper=2)
+    assert simplex.solve_model(infeasible).status == simplex.STATUS_INFEASIBLE
+    unbounded = dense_model([[1, -1]], -np.inf, 1, [-1, 0])
+    assert simplex.solve_model(unbounded).status == simplex.STATUS_UNBOUNDED
+
+
+def test_warm_start_after_rhs_change(rng):
+    A, row_lower, row_upper, c = random_lp(rng, m=10, n=8)
+    model = dense_model(A, row_lower, row_upper, c, 0.0, 5.0)
+    first = simplex.solve_model(model)
+    changed = model.with_changes(rhs=model.row_upper + 1.0)
+    cold = simplex.solve_model(changed)
+    warm = simplex.solve_model(changed, first.basis)
+    assert warm.warm_started
+    assert warm.status == cold.status == simplex.STATUS_OPTIMAL
+    assert warm.objective == pytest.approx(cold.objective)
+    assert warm.iterations <= cold.iterations
+
+
+def test_rejects_integer_models():
+    model = dense_model([[1]], -np.inf, 1, [1])
+    model.integer[:] = True
+    with pytest.raises(ValueError):
+        simplex.solve_model(model)
@@ -0,0 +1,32 @@
+import pytest
+
+import utils
+
+
+@pytest.mark.parametrize("expression, coefficients, constant", [
+    ("3x + 2y", {"x": 3.0, "y": 2.0}, 0.0),
+    ("1.5x + .5y - 3", {"x": 1.5, "y": 0.5}, -3.0),
+    ("2(x + .5) - x/4", {"x": 1.75}, 1.0),
+    ("-x1 + 2*x2^1", {"x1": -1.0, "x2": 2.0}, 0.0),
+    ("4", {}, 4.0),
+])
+def test_parse_linear_expression(expression, coefficients, constant):
+    assert utils.parse_linear_expression(expression) == (coefficients, constant)
+
+
+@pytest.mark.parametrize("expression", ["2.5.3x", "2..3", "1.2.3 + x"])
+def test_malformed_numbers_raise(expression):
+    with pytest.raises(ValueError):
+        utils.parse_linear_expression(expression)
+
+
+@pytest.mark.parametrize("expression", ["x*y", "x^2", "3/x"])
+def test_nonlinear_terms_raise(expression):
+    with pytest.raises(utils.NonLinearExpressionError):
+        utils.parse_linear_expression(expression)
+
+
+@pytest.mark.parametrize("expression", ["", "x +", "3 $ x", "(x + 1"])
+def test_invalid_expressions_raise(expression):
+    with pytest.raises(ValueError):
+        utils.parse_linear_expression(expression)
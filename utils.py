@@ -1,8 +1,9 @@
-import inspect
-import sympy as sp 
 import re
 import numpy as np
-import matplotlib.pyplot as plt
+
+# SymPy y Matplotlib se importan dentro de las funciones que los usan: tardan cientos de
+# milisegundos en cargarse y la mayoría de los procesos (resolver, trabajadores de lotes)
+# no los necesitan.
 
 def str_to_lambda(equation, reverse=False):
     """
@@ -18,6 +19,8 @@ def str_to_lambda(equation, reverse=False):
         # Crear la expresión de la restricción a partir de la cadena
         return eval("lambda x, y: " + equation)
     else:
+        import inspect
+
         text = inspect.getsource(equation).strip().split(":")[-1].strip()
         
         if text.endswith(","):
@@ -26,9 +29,6 @@ def str_to_lambda(equation, reverse=False):
         return text
     
 
-import re
-import sympy as sp
-
 def parse_equation(equation_str):
     """
     Convierte una cadena de texto en formato 'ax + by operador c' a una ecuación o inecuación simbólica de SymPy.
@@ -39,6 +39,8 @@ def parse_equation(equation_str):
     Retorna:
     - Una ecuación o inecuación simbólica que puede ser procesada por SymPy.
     """
+    import sympy as sp
+
     # Patrón para separar lhs, operador y rhs
     pattern = r'^(.*?)\s*(<=|>=|<|>|==|=)\s*(.*?)$'
     match = re.match(pattern, equation_str.strip())
@@ -103,6 +105,186 @@ def format_to_sympy(equation_str):
     
     return equation_str
 
+_LINEAR_TOKEN = re.compile(r"(\d+(?:\.\d*)?|\.\d+)|([A-Za-z_]+[0-9_]*)|(\*\*|[-+*/^()])")
+
+
+class NonLinearExpressionError(ValueError):
+    """La expresión contiene términos no lineales."""
+
+
+class _LinearExpressionParser:
+    """
+    Analizador descendente recursivo para expresiones lineales.
+
+    Cada subexpresión se representa como un par (coeficientes, constante), donde
+    coeficientes es un diccionario {variable: coeficiente} que conserva el orden de
+    aparición de las variables. Las operaciones que producirían términos no lineales
+    (producto de dos variables, variable elevada a una potencia distinta de 1 o
+    división por una variable) lanzan NonLinearExpressionError.
+    """
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.tokens = self._tokenize(re.sub(r"\s+", "", expression))
+        self.pos = 0
+
+    def _tokenize(self, text):
+        tokens = []
+        end = 0
+        for match in _LINEAR_TOKEN.finditer(text):
+            if match.start() != end:
+                break
+            number, name, op = match.groups()
+            if number is not None:
+                # Dos números seguidos solo aparecen en un número mal escrito, como '2.5.3'
+                if tokens and tokens[-1][0] == "num":
+                    raise ValueError(f"Número mal formado en la expresión: {self.expression}")
+                tokens.append(("num", float(number)))
+            elif name is not None:
+                tokens.append(("var", name))
+            else:
+                tokens.append(("op", "^" if op == "**" else op))
+            end = match.end()
+        if end != len(text):
+            raise ValueError(f"Carácter inesperado '{text[end]}' en la expresión: {self.expression}")
+        return tokens
+
+    def _peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def _accept(self, op):
+        if self._peek() == ("op", op):
+            self.pos += 1
+            return True
+        return False
+
+    def parse(self):
+        if not self.tokens:
+            raise ValueError("La expresión está vacía.")
+        value = self._expr()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"Error al interpretar la expresión: {self.expression}")
+        return value
+
+    def _expr(self):
+        coeffs, const = self._term()
+        while True:
+            if self._accept("+"):
+                sign = 1.0
+            elif self._accept("-"):
+                sign = -1.0
+            else:
+                return coeffs, const
+            other, other_const = self._term()
+            for var, coeff in other.items():
+                coeffs[var] = coeffs.get(var, 0.0) + sign * coeff
+            const += sign * other_const
+
+    def _term(self):
+        value = self._unary()
+        while True:
+            kind, token = self._peek()
+            if self._accept("*"):
+                value = self._multiply(value, self._unary())
+            elif self._accept("/"):
+                divisor_coeffs, divisor = self._unary()
+                if divisor_coeffs:
+                    raise NonLinearExpressionError(f"División por una variable en: {self.expression}")
+                if divisor == 0:
+                    raise ValueError(f"División por cero en: {self.expression}")
+                value = self._multiply(value, ({}, 1.0 / divisor))
+            elif kind in ("num", "var") or (kind, token) == ("op", "("):
+                # Multiplicación implícita, como en '4x' o '2(x + y)'
+                value = self._multiply(value, self._power())
+            else:
+                return value
+
+    def _multiply(self, left, right):
+        (left_coeffs, left_const), (right_coeffs, right_const) = left, right
+        if left_coeffs and right_coeffs:
+            raise NonLinearExpressionError(f"Producto de variables en: {self.expression}")
+        if right_coeffs:
+            left_coeffs, left_const, right_const = right_coeffs, right_const, left_const
+        return {var: coeff * right_const for var, coeff in left_coeffs.items()}, left_const * right_const
+
+    def _unary(self):
+        if self._accept("-"):
+            coeffs, const = self._unary()
+            return {var: -coeff for var, coeff in coeffs.items()}, -const
+        if self._accept("+"):
+            return self._unary()
+        return self._power()
+
+    def _power(self):
+        coeffs, const = self._atom()
+        if not self._accept("^"):
+            return coeffs, const
+        exponent_coeffs, exponent = self._unary()
+        if exponent_coeffs:
+            raise NonLinearExpressionError(f"Exponente variable en: {self.expression}")
+        if not coeffs:
+            return {}, const ** exponent
+        if exponent == 1:
+            return coeffs, const
+        if exponent == 0:
+            return {}, 1.0
+        raise NonLinearExpressionError(f"Potencia no lineal en: {self.expression}")
+
+    def _atom(self):
+        kind, token = self._peek()
+        self.pos += 1
+        if kind == "num":
+            return {}, token
+        if kind == "var":
+            return {token: 1.0}, 0.0
+        if (kind, token) == ("op", "("):
+            value = self._expr()
+            if not self._accept(")"):
+                raise ValueError(f"Falta un paréntesis de cierre en: {self.expression}")
+            return value
+        raise ValueError(f"Error al interpretar la expresión: {self.expression}")
+
+
+def parse_linear_expression(expression, symbolic_fallback=False):
+    """
+    Extrae en una sola pasada los coeficientes y la constante de una expresión lineal
+    como '4x + 2y - 3', sin pasar por SymPy.
+
+    Parámetros:
+    - expression: Cadena con la expresión. Admite multiplicación implícita ('4x'),
+      '*', '/', '^' o '**' con exponentes constantes y paréntesis.
+    - symbolic_fallback: Si es True, las expresiones no lineales se interpretan con
+      SymPy en lugar de lanzar un error.
+
+    Retorna:
+    - Una tupla (coeficientes, constante), donde coeficientes es un diccionario
+      {variable: coeficiente} en el orden en que aparecen las variables.
+    """
+    try:
+        return _LinearExpressionParser(expression).parse()
+    except NonLinearExpressionError:
+        if not symbolic_fallback:
+            raise
+    return _parse_with_sympy(expression)
+
+
+def _parse_with_sympy(expression):
+    """
+    Interpreta una expresión con SymPy y retorna sus coeficientes lineales y su
+    constante. Las variables se ordenan por nombre.
+    """
+    import sympy as sp
+
+    expr = sp.expand(sp.sympify(format_to_sympy(expression)))
+    variables = sorted(expr.free_symbols, key=lambda var: var.name)
+    try:
+        coefficients = {var.name: float(expr.coeff(var)) for var in variables}
+        constant = float(expr.as_coeff_Add()[0])
+    except TypeError as e:
+        raise ValueError(f"Error al interpretar la expresión: {expression}") from e
+    return coefficients, constant
+
+
 def extract_variables(objective_function):
     """
     Extrae las variables simbólicas de una función objetivo.
@@ -113,6 +295,8 @@ def extract_variables(objective_function):
     Retorna:
     - Un conjunto con las variables encontradas.
     """
+    import sympy as sp
+
     # Convertir la función objetivo en una expresión simbólica
     expr = sp.sympify(objective_function)
 
@@ -132,6 +316,8 @@ def extract_coefficients(objective_function, variables):
     Retorna:
     - dict: Diccionario donde las claves son las variables y los valores son sus coeficientes.
     """
+    import sympy as sp
+
     # Convertir la función objetivo a una expresión de SymPy
     expr = sp.sympify(objective_function)
     
@@ -142,119 +328,358 @@ def extract_coefficients(objective_function, variables):
     return coeffs
 
 
+def to_csr_arrays(matrix, num_columns=None):
+    """
+    Obtiene los arreglos CSR (indptr, indices, data) de una matriz densa (lista de listas
+    o arreglo de NumPy) o de una matriz dispersa de SciPy, sin recorrerla fila por fila.
+
+    Parámetros:
+    - matrix: La matriz de coeficientes.
+    - num_columns: Número de columnas esperado (opcional, para validar la forma).
+
+    Retorna:
+    - Una tupla (indptr, indices, data) con los elementos no nulos por fila.
+    """
+    if hasattr(matrix, "tocsr"):
+        csr = matrix.tocsr()
+        indptr, indices, data, shape = csr.indptr, csr.indices, np.asarray(csr.data, dtype=float), csr.shape
+    else:
+        dense = np.asarray(matrix, dtype=float)
+        if dense.ndim == 1:
+            dense = dense.reshape(1, -1)
+        if dense.ndim != 2:
+            raise ValueError("La matriz de coeficientes debe ser bidimensional.")
+        rows, cols = np.nonzero(dense)
+        indptr = np.zeros(dense.shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=dense.shape[0]), out=indptr[1:])
+        indices, data, shape = cols, dense[rows, cols], dense.shape
+
+    if num_columns is not None and shape[1] != num_columns:
+        raise ValueError(f"La matriz tiene {shape[1]} columnas, pero se esperaban {num_columns}.")
+    return indptr, indices, data
+
+
+def expand_bounds(bounds, num_variables):
+    """
+    Expande los límites de las variables al formato de scipy.optimize.linprog.
+
+    Parámetros:
+    - bounds: Un par (inferior, superior) común a todas las variables o una secuencia
+      de pares, uno por variable. None o ±inf indican que no hay límite.
+    - num_variables: Número de variables.
+
+    Retorna:
+    - Dos listas (inferiores, superiores) con None donde no hay límite.
+    """
+    if bounds is None:
+        bounds = (0, None)
+    if len(bounds) == 2 and all(b is None or np.isscalar(b) for b in bounds):
+        bounds = [bounds] * num_variables
+    if len(bounds) != num_variables:
+        raise ValueError(f"Se esperaban {num_variables} pares de límites, pero se recibieron {len(bounds)}.")
+
+    lower, upper = [], []
+    for low, up in bounds:
+        lower.append(None if low is None or low == -np.inf else float(low))
+        upper.append(None if up is None or up == np.inf else float(up))
+    return lower, upper
+
+
+def read_mps_basis(path, variable_names, constraint_names):
+    """
+    Lee una base en formato MPS escrita por CBC ('-basisO') y la traduce a los nombres
+    originales de variables y restricciones.
+
+    Parámetros:
+    - path: Ruta del archivo de base.
+    - variable_names: Diccionario {nombre original: nombre en el archivo MPS} de las variables.
+    - constraint_names: Diccionario {nombre original: nombre en el archivo MPS} de las restricciones.
+
+    Retorna:
+    - Un diccionario {"variables": {...}, "constraints": {...}} con el estado de cada elemento:
+      'B' (básico), 'L' (no básico en su límite inferior) o 'U' (en su límite superior).
+    """
+    variables = {name: "L" for name in variable_names}
+    constraints = {name: "B" for name in constraint_names}
+    original_variable = {mps: name for name, mps in variable_names.items()}
+    original_constraint = {mps: name for name, mps in constraint_names.items()}
+
+    with open(path) as f:
+        for line in f:
+            fields = line.split()
+            if not line.startswith(" ") or not fields:
+                continue
+            kind, column = fields[0], original_variable.get(fields[1])
+            if column is None:
+                continue
+            if kind in ("XU", "XL"):
+                variables[column] = "B"
+                row = original_constraint.get(fields[2])
+                if row is not None:
+                    constraints[row] = kind[1]
+            elif kind in ("UL", "LL"):
+                variables[column] = kind[0]
+    return {"variables": variables, "constraints": constraints}
+
+
+def write_mps_basis(path, basis, variable_names, constraint_names):
+    """
+    Escribe una base en formato MPS ('-basisI' de CBC) para el modelo actual.
+
+    Los elementos que no aparecen en la base (por ejemplo, restricciones agregadas después
+    de la última resolución) quedan con su valor por defecto: las restricciones con su
+    holgura básica y las variables en su límite inferior. Así la base anterior sigue siendo
+    dual factible al agregar filas.
+
+    Parámetros:
+    - path: Ruta del archivo de base.
+    - basis: Base retornada por read_mps_basis.
+    - variable_names: Diccionario {nombre original: nombre en el archivo MPS} de las variables.
+    - constraint_names: Diccionario {nombre original: nombre en el archivo MPS} de las restricciones.
+
+    Retorna:
+    - True si la base contiene información aplicable al modelo actual.
+    """
+    basic_columns = [name for name in variable_names if basis["variables"].get(name) == "B"]
+    nonbasic_rows = [name for name in constraint_names if basis["constraints"].get(name, "B") != "B"]
+    at_upper = [name for name in variable_names if basis["variables"].get(name) == "U"]
+
+    # Cada columna básica se empareja con una fila no básica para conservar el tamaño de la base
+    lines = ["NAME          MODEL"]
+    for column, row in zip(basic_columns, nonbasic_rows):
+        lines.append(f" X{basis['constraints'][row]} {variable_names[column]} {constraint_names[row]}")
+    lines += [f" UL {variable_names[column]}" for column in at_upper]
+    lines.append("ENDATA")
+
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    return len(lines) > 2
+
+
+def split_constraint(equation_str):
+    """
+    Separa una restricción en texto en sus dos lados y su operador.
+
+    Parámetros:
+    - equation_str: Restricción en formato de texto (por ejemplo: '2x + 3y <= 10'). Admite
+      los operadores '<=', '>=', '=', '==', '≤' y '≥'.
+
+    Retorna:
+    - Una tupla (lhs, operador, rhs) con el operador normalizado a '<=', '=' o '>='.
+    """
+    match = re.match(r'^(.*?)\s*(<=|>=|==|=|≤|≥)\s*(.*?)$', equation_str.strip())
+    if not match or not match.group(1) or not match.group(3):
+        raise ValueError(f"La ecuación no tiene el formato correcto: {equation_str}")
+    lhs_str, operator, rhs_str = match.groups()
+    operator = {"≤": "<=", "≥": ">=", "==": "="}.get(operator, operator)
+    return lhs_str, operator, rhs_str
+
+
+def constraint_to_line(equation_str, x_name="x", y_name="y"):
+    """
+    Obtiene los coeficientes de la recta que delimita una restricción lineal en dos
+    variables, sin pasar por SymPy.
+
+    Parámetros:
+    - equation_str: Restricción en formato de texto (por ejemplo: '2*x + 3*y <= 10').
+    - x_name, y_name: Nombres de las variables de los ejes.
+
+    Retorna:
+    - Una tupla (a, b, c) con la recta a·x + b·y = c.
+    """
+    lhs_str, _, rhs_str = split_constraint(equation_str)
+    lhs, lhs_constant = parse_linear_expression(lhs_str)
+    rhs, rhs_constant = parse_linear_expression(rhs_str)
+    a = lhs.get(x_name, 0.0) - rhs.get(x_name, 0.0)
+    b = lhs.get(y_name, 0.0) - rhs.get(y_name, 0.0)
+    return a, b, rhs_constant - lhs_constant
+
+
+def line_points(line, x_values, y_values):
+    """
+    Evalúa en forma cerrada y vectorizada la recta a·x + b·y = c.
+
+    Parámetros:
+    - line: Tupla (a, b, c).
+    - x_values: Arreglo de valores de x en los que se evalúa la recta si b != 0.
+    - y_values: Arreglo de valores de y para las rectas verticales (b == 0).
+
+    Retorna:
+    - Una tupla (xs, ys) de arreglos, o None si la recta es degenerada (a == b == 0).
+    """
+    a, b, c = line
+    if b != 0:
+        x_values = np.asarray(x_values, dtype=float)
+        return x_values, (c - a * x_values) / b
+    if a != 0:
+        y_values = np.asarray(y_values, dtype=float)
+        return np.full(y_values.shape, c / a), y_values
+    return None
+
+
 def get_range(constraints, variable):
     """
     Obtiene un rango aproximado para una variable ('x' o 'y') evaluando las restricciones en un conjunto de puntos.
     
     Parámetros:
-    - constraints: Lista de funciones lambda que representan las restricciones.
+    - constraints: Lista de restricciones, como cadenas, funciones lambda de str_to_lambda o
+      tuplas (a, b, c) de la recta a·x + b·y = c.
     - variable: La variable para la cual se quiere calcular el rango ('x' o 'y').
     
     Retorna:
     - Un rango aproximado (min, max) para la variable especificada.
     """
-    y_max = set()
-    y_min = set()
-    x_max = set()
-    x_min = set()
+    grid = np.arange(-10, 11, dtype=float)
+    lows, highs = [], []
 
-    # Graficar las líneas de las restricciones
     for constraint in constraints:
-        # Resolver la restricción para y
-        eq = str_to_lambda(constraint, reverse=True)  # Asumimos que puedes convertir la función lambda a string
-        eq = format_to_sympy(eq)
-        eq = parse_equation(eq)
-        eq = sp.Eq(eq.lhs, eq.rhs)
-        
-        # Resolvemos la ecuación para 'y' si se puede
-        try:
-            eq_y = sp.Eq(eq.lhs, eq.rhs)
-            solution_for_y = sp.solve(eq_y, "y")
-            if solution_for_y:  
-                y_max.add(max([solution_for_y[0].subs("x", i) for i in range(-10, 11)])) 
-                y_min.add(min([solution_for_y[0].subs("x", i) for i in range(-10, 11)])) 
-        except Exception as e:
-            print(f"No se puede resolver para y: {e}")
-        
-        # Resolvemos la ecuación para 'x' si se puede
-        try:
-            eq_x = sp.Eq(eq.lhs, eq.rhs)
-            solution_for_x = sp.solve(eq_x, "x")
-            if solution_for_x:  # Si se puede resolver para 'x'
-                x_max.add(max([solution_for_x[0].subs("y", i) for i in range(-10, 11)]))
-                x_min.add(min([solution_for_x[0].subs("y", i) for i in range(-10, 11)]))
-        except Exception as e:
-            print(f"No se puede resolver para x: {e}")
-        
-    if variable == "x":
-        return min(x_min), max(x_max)
-    else:
-        return min(y_min), max(y_max)
+        if callable(constraint):
+            constraint = str_to_lambda(constraint, reverse=True)
+        a, b, c = constraint_to_line(constraint) if isinstance(constraint, str) else constraint
+
+        # Despejar la variable pedida y evaluarla sobre toda la cuadrícula de una vez
+        if variable == "x" and a != 0:
+            values = (c - b * grid) / a
+        elif variable != "x" and b != 0:
+            values = (c - a * grid) / b
+        else:
+            continue
+        lows.append(values.min())
+        highs.append(values.max())
+
+    return min(lows), max(highs)
+
 
 
+def _clip_polygon(vertices, a, b, c):
+    """
+    Recorta un polígono convexo con el semiplano a·x + b·y <= c (Sutherland-Hodgman,
+    vectorizado sobre las aristas).
+    """
+    values = vertices @ np.array([a, b], dtype=float) - c
+    inside = values <= 1e-9 * (1.0 + abs(c))
+    following = np.roll(vertices, -1, axis=0)
+    following_values = np.roll(values, -1)
+    crossing = inside != np.roll(inside, -1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(crossing, values / (values - following_values), 0.0)
+    intersections = vertices + t[:, None] * (following - vertices)
+
+    # Por cada arista: el vértice inicial si está dentro y el cruce si lo hay
+    points = np.stack([vertices, intersections], axis=1).reshape(-1, 2)
+    polygon = points[np.stack([inside, crossing], axis=1).ravel()]
+    if len(polygon) > 1:
+        repeated = np.all(np.isclose(polygon, np.roll(polygon, -1, axis=0)), axis=1)
+        polygon = polygon[~repeated] if not repeated.all() else polygon[:1]
+    return polygon
 
-def plot_feasible_region_and_constraints(lambda_constraints, str_constraints, optimal_values, x_range=(0, 16), y_range=(0, 11), resolution=300):
+
+def feasible_region(lines, senses, points=()):
+    """
+    Calcula exactamente la región factible de un problema en dos variables como el polígono
+    que resulta de intersectar los semiplanos de las restricciones.
+
+    Parámetros:
+    - lines: Lista de tuplas (a, b, c) con la recta a·x + b·y = c de cada restricción.
+    - senses: Operador de cada restricción ('<=', '=' o '>=').
+    - points: Puntos adicionales que deben quedar a la vista (por ejemplo, el óptimo).
+
+    Retorna:
+    - Una tupla (vértices, x_range, y_range): los vértices del polígono en orden
+      antihorario (arreglo vacío si no hay región factible) y los límites de los ejes que
+      lo muestran completo. Las regiones no acotadas se recortan con una caja varias veces
+      mayor que la escala del problema.
+    """
+    points = np.array([point for point in points if None not in point], dtype=float).reshape(-1, 2)
+
+    # Escala del problema: interceptos de las rectas y puntos a mostrar
+    scale = [1.0] + np.abs(points).ravel().tolist()
+    for a, b, c in lines:
+        scale += [abs(c / coeff) for coeff in (a, b) if coeff != 0]
+    size = 4 * max(scale)
+    polygon = np.array([[-size, -size], [size, -size], [size, size], [-size, size]])
+
+    halfplanes = []
+    for (a, b, c), sense in zip(lines, senses):
+        if sense in ("<=", "=", "=="):
+            halfplanes.append((a, b, c))
+        if sense in (">=", "=", "=="):
+            halfplanes.append((-a, -b, -c))
+    for a, b, c in halfplanes:
+        if len(polygon):
+            polygon = _clip_polygon(polygon, a, b, c)
+
+    # Límites de los ejes a partir de los vértices reales (no los de la caja), los puntos y
+    # los interceptos factibles de las rectas, que ubican las regiones no acotadas
+    intercepts = [(c / a, 0.0) for a, b, c in lines if a != 0] + [(0.0, c / b) for a, b, c in lines if b != 0]
+    intercepts = np.array(intercepts, dtype=float).reshape(-1, 2)
+    if halfplanes and len(intercepts):
+        normals = np.array(halfplanes, dtype=float)
+        slack = normals[:, 2] - intercepts @ normals[:, :2].T
+        intercepts = intercepts[(slack >= -1e-9 * (1.0 + np.abs(normals[:, 2]))).all(axis=1)]
+    on_box = np.isclose(np.abs(polygon), size).any(axis=1) if len(polygon) else np.zeros(0, dtype=bool)
+    visible = np.vstack([polygon[~on_box], points, intercepts])
+    if len(visible) == 0:
+        visible = np.zeros((1, 2))
+    low, high = visible.min(axis=0), visible.max(axis=0)
+    span = np.maximum(high - low, np.maximum(0.1 * np.abs(visible).max(), 1.0))
+    low, high = low - 0.15 * span, high + 0.15 * span
+    if on_box.any():
+        # Dejar ver hacia dónde se extiende una región no acotada
+        low = np.where(polygon[on_box].min(axis=0) < low, low - 0.5 * span, low)
+        high = np.where(polygon[on_box].max(axis=0) > high, high + 0.5 * span, high)
+
+    return polygon, (float(low[0]), float(high[0])), (float(low[1]), float(high[1]))
+
+
+def plot_feasible_region_and_constraints(str_constraints, optimal_values, lines=None, senses=None, x_range=None, y_range=None, region=None):
     """
     Grafica la región factible y las restricciones para un problema de programación lineal.
     
     Parámetros:
-    - lambda_constraints: Lista de funciones de restricciones, cada una en forma de una lambda.
     - str_constraints: Lista de restricciones en formato de texto.
     - optimal_values: Diccionario con las coordenadas óptimas {"x": x, "y": y}.
-    - x_range: Rango para el eje x.
-    - y_range: Rango para el eje y.
-    - resolution: Resolución de la cuadrícula para calcular la región factible.
+    - lines: Lista opcional de tuplas (a, b, c) con la recta a·x + b·y = c de cada
+      restricción. Si no se indica, se obtiene de str_constraints.
+    - senses: Operador de cada restricción ('<=', '=' o '>='). Si no se indica, se obtiene
+      de str_constraints.
+    - x_range: Rango para el eje x (por defecto, el que muestra la región y el óptimo).
+    - y_range: Rango para el eje y (por defecto, el que muestra la región y el óptimo).
+    - region: Resultado de feasible_region ya calculado (por ejemplo, incluyendo los
+      límites de las variables). Si no se indica, se calcula con lines y senses.
     
     Retorna:
     - fig: Objeto Figure de Matplotlib.
     """
+    import matplotlib.pyplot as plt
+
     # Usar estilo de fondo oscuro
     plt.style.use('dark_background')
 
-    # Crear el espacio de valores de x y y
-    d = np.linspace(x_range[0], x_range[1], resolution)
-    x, y = np.meshgrid(d, d)
-    
+    if lines is None:
+        lines = [constraint_to_line(constraint) for constraint in str_constraints]
+    if senses is None:
+        senses = [split_constraint(constraint)[1] for constraint in str_constraints]
+    optimum = (optimal_values["x"], optimal_values["y"])
+    vertices, auto_x_range, auto_y_range = region or feasible_region(lines, senses, [optimum])
+    x_range = x_range or auto_x_range
+    y_range = y_range or auto_y_range
+
     # Crear figura y ejes
     fig, ax = plt.subplots()
     
-    # Graficar la región factible
-    feasible_region = np.ones_like(x, dtype=bool)
-    for constraint in lambda_constraints:
-        feasible_region &= constraint(x, y)
-    
-    ax.imshow(feasible_region.astype(int), extent=(x.min(), x.max(), y.min(), y.max()), origin="lower", cmap="inferno", alpha=0.5)
+    # Graficar la región factible como polígono exacto
+    if len(vertices):
+        ax.fill(vertices[:, 0], vertices[:, 1], color="orange", alpha=0.35, label="Región factible")
     
-    # Graficar las líneas de las restricciones
-    for constraint in str_constraints:
-        # Resolver la restricción para y
-        eq = format_to_sympy(constraint)
-        eq = parse_equation(eq)
-        eq = sp.Eq(eq.lhs, eq.rhs)
-        
-        # Resolvemos la ecuación para 'y' si se puede
-        try:
-            eq_y = sp.Eq(eq.lhs, eq.rhs)
-            solution_for_y = sp.solve(eq_y, "y")
-            if solution_for_y:  # Si se puede resolver para 'y'
-                y_vals = [solution_for_y[0].subs("x", i) for i in x[0]]
-                ax.plot(x[0], y_vals, label=str(constraint))
-                continue
-        except Exception as e:
-            print(f"No se puede resolver para y: {e}")
-        
-        # Resolvemos la ecuación para 'x' si se puede
-        try:
-            eq_x = sp.Eq(eq.lhs, eq.rhs)
-            solution_for_x = sp.solve(eq_x, "x")
-            if solution_for_x:  # Si se puede resolver para 'x'
-                x_vals = [solution_for_x[0].subs("y", i) for i in y[:, 0]]  # Usamos y[:, 0] para obtener valores de y
-                ax.plot(x_vals, y[:, 0], label=str(constraint))
-                continue
-        except Exception as e:
-            print(f"No se puede resolver para x: {e}")
+    # Graficar las líneas de las restricciones: al ser rectas, basta con sus extremos
+    for constraint, line in zip(str_constraints, lines):
+        points = line_points(line, x_range, y_range)
+        if points is not None:
+            ax.plot(*points, label=str(constraint))
     
-    ax.scatter(optimal_values["x"], optimal_values["y"], color="green", s=50, zorder=5, label="Óptimo", alpha=0.8)
+    if None not in optimum:
+        ax.scatter(*optimum, color="green", s=50, zorder=5, label="Óptimo", alpha=0.8)
 
     # Configuración del gráfico
     ax.set_xlim(x_range)
@@ -265,5 +690,3 @@ def plot_feasible_region_and_constraints(lambda_constraints, str_constraints, op
     ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
     
     return fig
-
-